@@ -74,6 +74,7 @@ class MuteEntry: type_: MuteType; id_: CustomUUID; name: str; flags: MuteFlags
 class AgentManager:
     def __init__(self, client_ref: 'GridClient'):
         self.client=client_ref; self.agent_id=CustomUUID.ZERO; self.session_id=CustomUUID.ZERO
+        self.agent_session_bytes:bytes=bytes(32) # AgentID+SessionID wire bytes, packed once per session for AgentData blocks
         self.secure_session_id=CustomUUID.ZERO; self.circuit_code=0; self.seed_capability:str|None=None
         self.name="Unknown Agent"; self.home_info:HomeInfo|None=None; self.start_location_request="last"
         self.current_position=Vector3.ZERO; self.current_look_at=Vector3.ZERO
@@ -115,7 +116,7 @@ class AgentManager:
     def _on_mute_list_update_wrapper(self,s,p): isinstance(p,MuteListUpdatePacket) and self._on_mute_list_update(s,p)
 
     def _handle_login_response(self,d:LoginResponseData):
-        self.agent_id=d.agent_id;self.session_id=d.session_id;self.secure_session_id=d.secure_session_id;self.circuit_code=d.circuit_code;self.seed_capability=d.seed_capability;self.name=f"{d.first_name} {d.last_name}";self.start_location_request=d.start_location or "last";self.home_info=d.home;il=d.look_at if d.look_at.magnitude_squared()>1e-5 else Vector3(1,0,0);self.movement.camera.look_at(self.current_position+il,self.current_position)
+        self.agent_id=d.agent_id;self.session_id=d.session_id;self.agent_session_bytes=d.agent_id.get_bytes()+d.session_id.get_bytes();self.secure_session_id=d.secure_session_id;self.circuit_code=d.circuit_code;self.seed_capability=d.seed_capability;self.name=f"{d.first_name} {d.last_name}";self.start_location_request=d.start_location or "last";self.home_info=d.home;il=d.look_at if d.look_at.magnitude_squared()>1e-5 else Vector3(1,0,0);self.movement.camera.look_at(self.current_position+il,self.current_position)
         self.client.inventory.inventory_root_uuid=d.inventory_root;self.client.inventory.library_root_uuid=d.library_root;self.client.inventory.library_owner_id=d.library_owner_id
         if d.inventory_skeleton:self.client.inventory._parse_initial_skeleton(d.inventory_skeleton,d.library_skeleton,d.library_owner_id)
 
@@ -120,7 +120,8 @@ class AppearanceManager:
         current_sim = self.client.network.current_sim
         if not current_sim or not current_sim.handshake_complete: logger.warning("Cannot request wearables: No sim."); return
         if not self.client.self or self.client.self.agent_id == CustomUUID.ZERO: logger.warning("Cannot request wearables: AgentID not set."); return
-        req = AgentWearablesRequestPacket(self.client.self.agent_id, self.client.self.session_id)
+        req = AgentWearablesRequestPacket(self.client.self.agent_id, self.client.self.session_id,
+                                          agent_session_bytes=self.client.self.agent_session_bytes)
         await self.client.network.send_packet(req, current_sim); logger.info("Sent AgentWearablesRequestPacket.")
 
     def _on_agent_wearables_update(self, source_sim: 'Simulator', packet: AgentWearablesUpdatePacket):
@@ -162,11 +163,12 @@ class AppearanceManager:
             logger.warning("InventoryManager not available, cannot populate full current_wearables_by_type.")
 
 
-        if len(packet.visual_param) > 0:
-            max_idx = min(len(packet.visual_param), self.VISUAL_PARAM_COUNT)
-            for i in range(max_idx): self.visual_params[i] = (packet.visual_param[i].ParamValue & 0xFF) / 255.0
-            if len(packet.visual_param) != self.VISUAL_PARAM_COUNT and len(packet.visual_param) != 0:
-                 logger.warning(f"AgentWearablesUpdate: Expected {self.VISUAL_PARAM_COUNT} VPs, got {len(packet.visual_param)}")
+        vp_bytes = packet.visual_param_bytes
+        if len(vp_bytes) > 0:
+            max_idx = min(len(vp_bytes), self.VISUAL_PARAM_COUNT)
+            for i in range(max_idx): self.visual_params[i] = vp_bytes[i] / 255.0
+            if len(vp_bytes) != self.VISUAL_PARAM_COUNT and len(vp_bytes) != 0:
+                 logger.warning(f"AgentWearablesUpdate: Expected {self.VISUAL_PARAM_COUNT} VPs, got {len(vp_bytes)}")
 
         logger.info(f"Updated wearables (ID pairs): {len(self.wearables)} items. Visuals updated (first 5: {[f'{x:.2f}' for x in self.visual_params[:5]]}). current_wearables_by_type has {len(self.current_wearables_by_type)} items.")
 
@@ -348,10 +350,9 @@ class AppearanceManager:
             current_te_bytes = texture_entry_bytes
 
         current_vp_float = visual_params_override if visual_params_override is not None else self.visual_params
-        vp_bytes_list: List[int] = [(max(0, min(255, int(v * 255.0)))) for v in current_vp_float]
-        if len(vp_bytes_list) != self.VISUAL_PARAM_COUNT: # Ensure correct length
-            vp_bytes_list.extend([0] * (self.VISUAL_PARAM_COUNT - len(vp_bytes_list)))
-            vp_bytes_list = vp_bytes_list[:self.VISUAL_PARAM_COUNT]
+        vp_bytes = bytes(max(0, min(255, int(v * 255.0))) for v in current_vp_float)
+        if len(vp_bytes) != self.VISUAL_PARAM_COUNT: # Ensure correct length
+            vp_bytes = vp_bytes[:self.VISUAL_PARAM_COUNT].ljust(self.VISUAL_PARAM_COUNT, b'\0')
 
         current_size = size_override if size_override is not None else self.agent_size
         if current_size.magnitude_squared() < 1e-5 : current_size = Vector3(0.45, 0.6, 1.8)
@@ -359,7 +360,8 @@ class AppearanceManager:
         set_packet = AgentSetAppearancePacket(
             agent_id=self.client.self.agent_id, session_id=self.client.self.session_id,
             serial_num=self.serial_num, size_vec=current_size,
-            texture_entry_bytes=current_te, visual_params_bytes=vp_bytes_list
+            texture_entry_bytes=current_te_bytes, visual_params_bytes=vp_bytes,
+            agent_session_bytes=self.client.self.agent_session_bytes
         )
         await self.client.network.send_packet(set_packet, current_sim)
         logger.info(f"Sent AgentSetAppearancePacket (Serial: {self.serial_num}).")
@@ -367,20 +369,21 @@ class AppearanceManager:
     def _on_avatar_appearance(self, source_sim: 'Simulator', packet: AvatarAppearancePacket):
         if packet.sender.ID == self.client.self.agent_id:
             logger.info(f"Received self AvatarAppearancePacket. IsTrial: {packet.sender.IsTrial}")
-            self.texture_entry_bytes = packet.object_data.TextureEntry
+            self.texture_entry_bytes = bytes(packet.object_data.TextureEntry) # Own a copy; the packet holds a view
 
             new_vp: List[float] = [0.0] * self.VISUAL_PARAM_COUNT
-            if len(packet.visual_param) > 0:
-                max_idx = min(len(packet.visual_param), self.VISUAL_PARAM_COUNT)
-                for i in range(max_idx): new_vp[i] = (packet.visual_param[i].ParamValue & 0xFF) / 255.0
-                if len(packet.visual_param) != self.VISUAL_PARAM_COUNT and len(packet.visual_param) != 0 :
-                     logger.warning(f"Own AvatarAppearance: VPs count {len(packet.visual_param)} vs {self.VISUAL_PARAM_COUNT}")
+            vp_bytes = packet.visual_param_bytes
+            if len(vp_bytes) > 0:
+                max_idx = min(len(vp_bytes), self.VISUAL_PARAM_COUNT)
+                for i in range(max_idx): new_vp[i] = vp_bytes[i] / 255.0
+                if len(vp_bytes) != self.VISUAL_PARAM_COUNT and len(vp_bytes) != 0 :
+                     logger.warning(f"Own AvatarAppearance: VPs count {len(vp_bytes)} vs {self.VISUAL_PARAM_COUNT}")
             self.visual_params = new_vp
             logger.info(f"Own appearance updated via AvatarAppearance. TE len: {len(self.texture_entry_bytes if self.texture_entry_bytes else [])}. "
                         f"Visuals (first 5: {[f'{x:.2f}' for x in self.visual_params[:5]]}).")
             # TODO: Fire general appearance_updated event if needed
         else:
-            logger.debug(f"Rcvd AvatarAppearance for other: {packet.sender.ID}. TE len: {len(packet.object_data.TextureEntry)}. VP count: {len(packet.visual_param)}")
+            logger.debug(f"Rcvd AvatarAppearance for other: {packet.sender.ID}. TE len: {len(packet.object_data.TextureEntry)}. VP count: {len(packet.visual_param_bytes)}")
 
     def get_wearable_item(self,wt:WearableType)->Tuple[CustomUUID,CustomUUID]|None:return self.wearables.get(wt) # This returns ItemID, AssetID tuple
     def get_visual_param_value(self,idx:int)->float:return self.visual_params[idx] if 0<=idx<len(self.visual_params) else 0.0
@@ -416,7 +419,8 @@ class AppearanceManager:
         packet = AgentIsNowWearingPacket(
             agent_id=self.client.self.agent_id,
             session_id=self.client.self.session_id,
-            items=final_wearables_for_packet
+            items=final_wearables_for_packet,
+            agent_session_bytes=self.client.self.agent_session_bytes
         )
         await self.client.network.send_packet(packet, current_sim)
         logger.info(f"Sent AgentIsNowWearingPacket with {len(final_wearables_for_packet)} items.")
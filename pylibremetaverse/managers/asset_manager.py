@@ -47,6 +47,16 @@ class Transfer:
     total_chunks_to_send: int = 0
     next_chunk_to_send: int = 0
 
+    def add_chunk(self, chunk: bytes | memoryview) -> None:
+        """Copies a received chunk into data at received_bytes, pre-sizing data to the known asset size."""
+        if not self.data and self.size > 0: self.data = bytearray(self.size)
+        end = self.received_bytes + len(chunk)
+        self.data[self.received_bytes:end] = chunk; self.received_bytes = end
+
+    def assembled(self) -> bytes:
+        """Returns the bytes received so far (data may be pre-sized past them)."""
+        return bytes(memoryview(self.data)[:self.received_bytes])
+
 AssetReceivedHandler = Callable[[bool, Asset | bytes | None, AssetType, CustomUUID, CustomUUID | None, str | None], Any]
 AssetUploadCompletedHandler = Callable[[bool, CustomUUID | None, AssetType | None], None]
 
@@ -152,13 +162,13 @@ class AssetManager:
         if not transfer:
             transfer = Transfer(id=packet.transfer_id, vfile_id_for_callback=packet.transfer_id, asset_uuid=packet.transfer_id, channel=packet.channel_type, status=TransferStatus.InProgress)
             self.current_xfers[packet.transfer_id] = transfer
-        transfer.data.extend(packet.data); transfer.received_bytes += len(packet.data)
+        transfer.add_chunk(packet.data)
         transfer.status = TransferStatus.InProgress
         is_complete = (transfer.size > 0 and transfer.received_bytes >= transfer.size) or \
                       (transfer.size == 0 and not packet.data)
         if is_complete:
             transfer.status = TransferStatus.Done
-            self._fire_asset_received(transfer.vfile_id_for_callback, True, bytes(transfer.data), transfer.asset_type, transfer.asset_uuid)
+            self._fire_asset_received(transfer.vfile_id_for_callback, True, transfer.assembled(), transfer.asset_type, transfer.asset_uuid)
             if packet.transfer_id in self.current_xfers: del self.current_xfers[packet.transfer_id]
 
     def _on_send_xfer(self, source_sim: 'Simulator', packet: SendXferPacket): # For downloads
@@ -168,7 +178,7 @@ class AssetManager:
             return
         if packet.packet_num <= transfer.last_packet_num and transfer.last_packet_num != -1: pass
         else:
-            transfer.data.extend(packet.data); transfer.received_bytes += len(packet.data)
+            transfer.add_chunk(packet.data)
             transfer.last_packet_num = packet.packet_num
         transfer.status = TransferStatus.InProgress
         confirm = ConfirmXferPacket(xfer_id=packet.xfer_id, packet_num=packet.packet_num)
@@ -176,7 +186,7 @@ class AssetManager:
         asyncio.create_task(self.client.network.send_packet(confirm, source_sim))
         if not packet.data:
             transfer.status = TransferStatus.Done
-            self._fire_asset_received(transfer.vfile_id_for_callback, True, bytes(transfer.data), transfer.asset_type, transfer.asset_uuid)
+            self._fire_asset_received(transfer.vfile_id_for_callback, True, transfer.assembled(), transfer.asset_type, transfer.asset_uuid)
             if packet.xfer_id in self.current_xfers: del self.current_xfers[packet.xfer_id]
 
     async def request_asset_xfer(self, filename: str, use_big_packets: bool,
@@ -229,14 +239,15 @@ class AssetManager:
             transfer = self.current_xfers[texture_uuid]; transfer.status = TransferStatus.Queued; transfer.data.clear(); transfer.received_bytes = 0
             transfer.udp_packets_expected = 0; transfer.udp_packets_received.clear(); transfer.image_type = image_type
         image_request_block = {'Image': texture_uuid, 'Type': image_type.value, 'DiscardLevel': 0, 'DownloadPriority': priority, 'Packet': 0, 'ExtraInfo': 0}
-        req_packet = RequestImagePacket(self.client.self.agent_id, self.client.self.session_id, [image_request_block])
+        req_packet = RequestImagePacket(self.client.self.agent_id, self.client.self.session_id, [image_request_block],
+                                        agent_session_bytes=self.client.self.agent_session_bytes)
         req_packet.header.reliable = False
         asyncio.create_task(self.client.network.send_packet(req_packet, current_sim))
         logger.info(f"Sent RequestImagePacket for texture {texture_uuid} via UDP to {current_sim.name}.")
         return True
 
     def _on_image_not_in_database(self, source_sim: 'Simulator', packet: ImageNotInDatabasePacket):
-        texture_uuid = packet.image_id_block.ID
+        texture_uuid = packet.id
         logger.warning(f"Received ImageNotInDatabase for {texture_uuid} from {source_sim.name}.")
         transfer = self.current_xfers.get(texture_uuid)
         if transfer:
@@ -247,15 +258,15 @@ class AssetManager:
 
     def _on_image_data(self, source_sim: 'Simulator', packet: ImageDataPacket):
         # ... (Implementation as before, seems okay for downloads) ...
-        texture_uuid = packet.image_id_block.ID; size = packet.image_id_block.Size; data_chunk = packet.image_data_block.Data
+        texture_uuid = packet.id; size = packet.size; data_chunk = packet.data
         transfer = self.current_xfers.get(texture_uuid)
         if not transfer or transfer.status == TransferStatus.ERROR or transfer.status == TransferStatus.Done: return
         if transfer.size == 0 and size > 0: transfer.size = size; transfer.udp_packets_expected = (size + 999) // 1000
-        transfer.data.extend(data_chunk); transfer.received_bytes += len(data_chunk); transfer.status = TransferStatus.InProgress
+        transfer.add_chunk(data_chunk); transfer.status = TransferStatus.InProgress
         if (transfer.size > 0 and transfer.received_bytes >= transfer.size) or \
            (transfer.size == 0 and len(data_chunk) == 0) :
             completed_transfer = self.current_xfers.pop(texture_uuid, None)
-            if completed_transfer: self._fire_asset_received(completed_transfer.vfile_id_for_callback, True, bytes(completed_transfer.data), completed_transfer.asset_type, completed_transfer.asset_uuid)
+            if completed_transfer: self._fire_asset_received(completed_transfer.vfile_id_for_callback, True, completed_transfer.assembled(), completed_transfer.asset_type, completed_transfer.asset_uuid)
 
     async def upload_asset_object(self, asset_obj: Asset,
                                 is_public: bool = False, is_temp: bool = False, store_local: bool = False
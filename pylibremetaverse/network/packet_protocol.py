@@ -1,15 +1,18 @@
 import asyncio
 import logging
+import struct
 import time
 
 from pylibremetaverse import utils as plm_utils
-from .packets_base import PacketHeader, PacketFlags, PacketType
+from .packets_base import PacketHeader, PacketFlags
 from .packet_factory import from_bytes as packet_from_bytes
 # AckPacket needs to be imported if we handle its type for logging, though factory returns base Packet
 # from .packets_control import AckPacket
 
 logger = logging.getLogger(__name__)
 
+_PACKET_ACK_MARKER = b'\xff\xff\xff\xf4' # Low frequency type marker of PacketAck (see packet_factory)
+
 class IncomingPacket:
     def __init__(self, simulator_ref, packet_obj):
         self.simulator = simulator_ref
@@ -21,24 +24,31 @@ class PacketProtocol(asyncio.DatagramProtocol):
     def __init__(self, simulator_ref):
         self.simulator = simulator_ref # Reference to the Simulator instance
         self.transport = None
-        logger.debug(f"PacketProtocol initialized for {self.simulator}")
+        # Scratch buffer for zero-decoding, reused for every datagram. datagram_received is
+        # called serially by the event loop for this protocol instance, so no locking is needed.
+        self._zdec_buf = bytearray(simulator_ref.client.settings.MAX_PACKET_SIZE)
+        # Cached for the per-datagram utilization check. The settings object itself is cached
+        # (not the flag) so track_utilization can still be toggled at runtime.
+        self._settings = simulator_ref.client.settings
+        self._stats = simulator_ref.client.stats
+        logger.debug("PacketProtocol initialized for %s", self.simulator)
 
     def connection_made(self, transport: asyncio.DatagramTransport):
         self.transport = transport
-        logger.info(f"UDP connection established for {self.simulator} to {self.simulator.ip_addr_str}:{self.simulator.port}")
+        logger.info("UDP connection established for %s to %s:%s", self.simulator, self.simulator.ip_addr_str, self.simulator.port)
         # self.simulator.connected is already True from Simulator.connect if transport setup succeeded.
         # self.simulator._start_network_tasks() # Simulator starts its tasks once transport is confirmed.
 
     def datagram_received(self, data: bytes, addr: tuple[str, int]):
         if not self.simulator or not self.simulator.client.settings: # Check if sim and settings available
-            logger.warning(f"Received datagram from {addr} but simulator or settings are None. Discarding.")
+            logger.warning("Received datagram from %s but simulator or settings are None. Discarding.", addr)
             return
         if not self.simulator.connected: # Check connected state of simulator
-            logger.warning(f"Received datagram from {addr} for a disconnected simulator {self.simulator}. Discarding.")
+            logger.warning("Received datagram from %s for a disconnected simulator %s. Discarding.", addr, self.simulator)
             return
 
-        if self.simulator.client.settings.track_utilization and self.simulator.client.stats:
-            self.simulator.client.stats.received_bytes(len(data),1)
+        if self._settings.track_utilization and self._stats is not None:
+            self._stats.received_bytes(len(data),1)
 
         try:
             header = PacketHeader.from_bytes(data, 0)
@@ -47,21 +57,23 @@ class PacketProtocol(asyncio.DatagramProtocol):
             # Potentially zero-decoded data (full packet: header + body_with_type_markers)
             processed_data = data
             if header.flags & PacketFlags.ZEROCODED:
-                max_size = self.simulator.client.settings.MAX_PACKET_SIZE
-                decompressed_buffer = bytearray(max_size)
                 try:
-                    actual_len = plm_utils.zero_decode(data, len(data), decompressed_buffer)
-                    processed_data = bytes(decompressed_buffer[:actual_len])
-                    # Re-parse header from decompressed data as flags might have changed (though unlikely for decode)
-                    # More importantly, payload is now different.
-                    header = PacketHeader.from_bytes(processed_data, 0)
-                    logger.debug(f"Zero-decoded packet from {len(data)} to {actual_len} bytes for {self.simulator} (Seq={header.sequence})")
+                    actual_len = plm_utils.zero_decode(data, self._zdec_buf)
+                    if actual_len <= 0: raise ValueError("decoded packet does not fit the receive buffer")
+                    # View into the scratch buffer, no copy here. Everything below runs before the
+                    # next datagram can overwrite it, and the packet factory makes the one bytes copy
+                    # of the body that deserialized packets (handled asynchronously) keep.
+                    processed_data = memoryview(self._zdec_buf)[:actual_len]
+                    # zero_decode copies the leading bytes (including the 4-byte header) verbatim,
+                    # so the header parsed above is still valid for the decoded packet.
+                    logger.debug("Zero-decoded packet from %d to %d bytes for %s (Seq=%d)", len(data), actual_len, self.simulator, header.sequence)
                 except Exception as e:
-                    logger.error(f"Zero-decode failed for packet (Seq={header.sequence}) from {self.simulator}: {e}")
+                    logger.error("Zero-decode failed for packet (Seq=%d) from %s: %s", header.sequence, self.simulator, e)
                     return
 
-            # Payload now means data *after* the 4-byte header
-            payload_with_type_markers = processed_data[full_payload_offset:]
+            # Payload now means data *after* the 4-byte header. Work on a memoryview so that
+            # stripping the header and appended ACKs does not copy the payload.
+            payload_with_type_markers = memoryview(processed_data)[full_payload_offset:]
 
             # Handle appended ACKs if MSG_APPENDED_ACKS (PacketFlags.ACK) is set on this data packet's header
             if header.flags & PacketFlags.ACK:
@@ -70,59 +82,62 @@ class PacketProtocol(asyncio.DatagramProtocol):
 
                 if len(payload_with_type_markers) >= ack_data_len:
                     ack_payload_start = len(payload_with_type_markers) - ack_data_len
-                    current_ack_offset = ack_payload_start
-                    for i in range(num_acks):
-                        acked_seq = plm_utils.bytes_to_uint32(payload_with_type_markers, current_ack_offset)
-                        if acked_seq in self.simulator.need_ack:
-                            del self.simulator.need_ack[acked_seq]
-                        logger.debug(f"[{self.simulator}] Appended ACK received for Seq={acked_seq} within packet Seq={header.sequence}.")
-                        current_ack_offset += 4
+                    appended_acks = struct.unpack_from(f'<{num_acks}I', payload_with_type_markers, ack_payload_start)
+                    need_ack = self.simulator.need_ack
+                    for acked_seq in appended_acks:
+                        need_ack.pop(acked_seq, None)
+                    logger.debug("[%s] %d appended ACKs received within packet Seq=%d: %s", self.simulator, num_acks, header.sequence, appended_acks[:10])
                     # Trim the payload to exclude these appended ACKs before factory processing
                     payload_with_type_markers = payload_with_type_markers[:ack_payload_start]
                 else:
-                    logger.warning(f"[{self.simulator}] MSG_APPENDED_ACKS flag set, but payload too short for num_acks={num_acks}. Seq={header.sequence}")
+                    logger.warning("[%s] MSG_APPENDED_ACKS flag set, but payload too short for num_acks=%d. Seq=%d", self.simulator, num_acks, header.sequence)
 
             if not payload_with_type_markers and not (header.flags & PacketFlags.ACK): # If only header and no actual payload (e.g. pure header ACK)
                 # This case might occur if a packet is ONLY ACKs in its header (no body, no appended acks)
                 # Or if after stripping appended ACKs, the data payload is empty.
                 # For pure header ACKs, just update ack_inbox based on header.sequence
                 if header.flags & PacketFlags.ACK: # If the header itself is an ACK for its sequence number
-                     logger.debug(f"Pure Header ACK received for Seq={header.sequence} from {self.simulator}")
-                     if header.sequence in self.simulator.need_ack: del self.simulator.need_ack[header.sequence]
+                     logger.debug("Pure Header ACK received for Seq=%d from %s", header.sequence, self.simulator)
+                     self.simulator.need_ack.pop(header.sequence, None)
                 else:
-                     logger.debug(f"Empty payload for non-ACK packet Seq={header.sequence} from {self.simulator}. Discarding.")
+                     logger.debug("Empty payload for non-ACK packet Seq=%d from %s. Discarding.", header.sequence, self.simulator)
                 return
 
             # If reliable, queue an ACK for this packet's sequence number
             if header.reliable:
                 self.simulator.queue_ack(header.sequence)
 
+            # PacketAck (0xFFFFFFF4) is handled inline: its body is just a count byte followed by
+            # u32 sequence numbers, so there is no need to build an AckPacket through the factory.
+            if payload_with_type_markers[:4] == _PACKET_ACK_MARKER:
+                ack_count = min(payload_with_type_markers[4], (len(payload_with_type_markers) - 5) // 4) if len(payload_with_type_markers) > 4 else 0
+                acked_seqs = struct.unpack_from(f'<{ack_count}I', payload_with_type_markers, 5)
+                need_ack = self.simulator.need_ack
+                for acked_seq in acked_seqs:
+                    need_ack.pop(acked_seq, None)
+                logger.debug("[%s] Received PacketAck (Seq=%d) with %d ACKs: %s", self.simulator, header.sequence, ack_count, acked_seqs[:10])
+                return # PacketAck processed, no further handling needed by general inbox
+
             # Deserialize using PacketFactory
             deserialized_packet = packet_from_bytes(payload_with_type_markers, header)
 
             if deserialized_packet:
-                # If it's an AckPacket (PacketType.PacketAck, 0xFFFFFFF4), process its list of sequences
-                if deserialized_packet.type == PacketType.PacketAck:
-                    logger.debug(f"[{self.simulator}] Received AckPacket (Seq={header.sequence}) with {len(deserialized_packet.sequences)} ACKs: {deserialized_packet.sequences[:10]}")
-                    for acked_seq in deserialized_packet.sequences:
-                        if acked_seq in self.simulator.need_ack:
-                            del self.simulator.need_ack[acked_seq]
-                            # logger.debug(f"[{self.simulator}] Cleared reliable packet Seq={acked_seq} due to AckPacket.")
-                    return # AckPacket processed, no further handling needed by general inbox
-
-                # For other deserialized packets, put them into the NetworkManager's inbox
-                logger.debug(f"Deserialized {deserialized_packet.type.name} (Seq={header.sequence}) for {self.simulator}, enqueuing.")
-                incoming_wrapper = IncomingPacket(simulator=self.simulator, packet=deserialized_packet)
-                asyncio.create_task(self.simulator.network_manager.packet_inbox.put(incoming_wrapper))
+                # Put deserialized packets into the NetworkManager's inbox
+                logger.debug("Deserialized %s (Seq=%d) for %s, enqueuing.", deserialized_packet.type.name, header.sequence, self.simulator)
+                incoming_wrapper = IncomingPacket(self.simulator, deserialized_packet)
+                # The inbox is unbounded, so put_nowait never blocks; this avoids scheduling a Task per packet.
+                self.simulator.network_manager.packet_inbox.put_nowait(incoming_wrapper)
             else:
-                logger.debug(f"PacketFactory could not deserialize. Seq={header.sequence}, Flags={header.flags!r}. "
-                               f"Payload (after type markers, if any, were stripped by factory): {payload_with_type_markers[:12].hex()} from {self.simulator}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("PacketFactory could not deserialize. Seq=%d, Flags=%r. "
+                                 "Payload (after type markers, if any, were stripped by factory): %s from %s",
+                                 header.sequence, header.flags, payload_with_type_markers[:12].hex(), self.simulator)
 
         except Exception as e:
-            logger.exception(f"Critical error in datagram_received for {self.simulator}: {e}. Raw Data: {data.hex()[:100]}")
+            logger.exception("Critical error in datagram_received for %s: %s. Raw Data[:50]: %s", self.simulator, e, data[:50].hex())
 
     def error_received(self, exc: Exception):
-        logger.error(f"UDP error for {self.simulator}: {exc}")
+        logger.error("UDP error for %s: %s", self.simulator, exc)
         if self.simulator:
             # This error might mean the simulator is unreachable.
             # Consider triggering a disconnect or checking connection status.
@@ -130,7 +145,7 @@ class PacketProtocol(asyncio.DatagramProtocol):
             pass
 
     def connection_lost(self, exc: Exception | None):
-        logger.info(f"UDP connection lost for {self.simulator}. Exception: {exc if exc else 'Clean close'}")
+        logger.info("UDP connection lost for %s. Exception: %s", self.simulator, exc if exc else 'Clean close')
         sim = self.simulator
         if sim:
             sim.connected = False; sim.handshake_complete = False
@@ -141,4 +156,4 @@ class PacketProtocol(asyncio.DatagramProtocol):
             if nm:
                 asyncio.create_task(nm._on_sim_disconnected(sim, requested_logout=False))
 
-        if exc: logger.error(f"Connection lost for {sim} due to error: {exc}")
+        if exc: logger.error("Connection lost for %s due to error: %s", sim, exc)
@@ -1,6 +1,5 @@
 import logging
 import struct
-import uuid
 import dataclasses
 
 from pylibremetaverse.types import CustomUUID, Vector3, Quaternion
@@ -13,24 +12,55 @@ from .packets_base import Packet, PacketHeader, PacketType, PacketFlags
 
 logger = logging.getLogger(__name__)
 
+# Precompiled layouts for the fixed-size agent packets.
+# AgentUpdate: AgentID, SessionID, BodyRotation(4f), HeadRotation(4f), CameraCenter, CameraAtAxis,
+# CameraLeftAxis, CameraUpAxis (3f each), Far(f), ControlFlags(u32), Flags(u8), State(u8) = 122 bytes.
+_AGENT_UPDATE_STRUCT = struct.Struct('<16s16s' + 'f' * 21 + 'IBB')
+_SET_ALWAYS_RUN_STRUCT = struct.Struct('<16s16sB')
+_AGENT_MOVEMENT_COMPLETE_STRUCT = struct.Struct('<16s16s6fQI') # AgentID, SessionID, Position, LookAt, RegionHandle, Timestamp
+_AVATAR_SIT_RESPONSE_STRUCT = struct.Struct('<16s3f4f3f3f??') # SitObject, SitPosition, SitRotation, CameraEye, CameraAt, ForceMouselook, AutoPilot
+_AGENT_DATA_STRUCT = struct.Struct('<16s16s') # AgentID, SessionID
+_AGENT_REQUEST_SIT_STRUCT = struct.Struct('<16s16s16s3f') # AgentID, SessionID, TargetID, Offset
+_GESTURES_AGENT_STRUCT = struct.Struct('<16s16sIB') # AgentID, SessionID, Flags, Data block count
+_ACTIVATE_GESTURE_BLOCK_STRUCT = struct.Struct('<16s16sB') # ItemID, AssetID, GestureFlags
+_ANIMATION_BLOCK_STRUCT = struct.Struct('<16si') # AnimID, AnimSequenceID
+_AGENT_ANIMATION_BLOCK_STRUCT = struct.Struct('<16s?') # AnimID, StartAnim
+_CHAT_TAIL_STRUCT = struct.Struct('<iB') # Channel, Type (follows the null-terminated message)
+_MUTE_LIST_REQUEST_STRUCT = struct.Struct('<16s16sI') # AgentID, SessionID, MuteCRC
+_UPDATE_MUTE_HEAD_STRUCT = struct.Struct('<16s16si16s') # AgentID, SessionID, MuteType, MuteID
+_REMOVE_MUTE_HEAD_STRUCT = struct.Struct('<16s16s16s') # AgentID, SessionID, MuteID
+_U32_STRUCT = struct.Struct('<I')
+_U64_STRUCT = struct.Struct('<Q')
+
 # ... (Existing AgentUpdatePacket, SetAlwaysRunPacket, AgentDataUpdatePacket, etc. remain here) ...
 class AgentUpdatePacket(Packet): # Shortened for brevity, assume it's here
     def __init__(self, agent_id: CustomUUID | None = None, session_id: CustomUUID | None = None, body_rotation: Quaternion | None = None, head_rotation: Quaternion | None = None,camera_at_axis: Vector3 | None = None, camera_center: Vector3 | None = None, camera_left_axis: Vector3 | None = None, camera_up_axis: Vector3 | None = None,far: float = 0.0, state: AgentState = AgentState.NONE, control_flags: ControlFlags = ControlFlags.NONE, agent_flags: AgentFlags = AgentFlags.NONE, header: PacketHeader | None = None):
         super().__init__(PacketType.AgentUpdate, header);self.agent_id=agent_id or CustomUUID.ZERO;self.session_id=session_id or CustomUUID.ZERO;self.body_rotation=body_rotation or Quaternion.Identity;self.head_rotation=head_rotation or Quaternion.Identity;self.camera_at_axis=camera_at_axis or Vector3.ZERO;self.camera_center=camera_center or Vector3.ZERO;self.camera_left_axis=camera_left_axis or Vector3.ZERO;self.camera_up_axis=camera_up_axis or Vector3.ZERO;self.far=far;self.state=state;self.control_flags=control_flags;self.agent_flags=agent_flags
     def to_bytes(self) -> bytes:
-        d=bytearray();d.extend(self.agent_id.get_bytes());d.extend(self.session_id.get_bytes());d.extend(struct.pack('<ffff',*self.body_rotation.as_tuple()));d.extend(struct.pack('<ffff',*self.head_rotation.as_tuple()));d.extend(struct.pack('<fff',*self.camera_center.as_tuple()));d.extend(struct.pack('<fff',*self.camera_at_axis.as_tuple()));d.extend(struct.pack('<fff',*self.camera_left_axis.as_tuple()));d.extend(struct.pack('<fff',*self.camera_up_axis.as_tuple()));d.extend(helpers.float_to_bytes(self.far));d.extend(helpers.uint32_to_bytes(self.control_flags.value));d.append(self.agent_flags.value&0xFF);d.append(self.state.value&0xFF);return bytes(d)
+        br=self.body_rotation;hr=self.head_rotation;cc=self.camera_center;ca=self.camera_at_axis;cl=self.camera_left_axis;cu=self.camera_up_axis
+        return _AGENT_UPDATE_STRUCT.pack(self.agent_id.get_bytes(),self.session_id.get_bytes(),br.X,br.Y,br.Z,br.W,hr.X,hr.Y,hr.Z,hr.W,cc.X,cc.Y,cc.Z,ca.X,ca.Y,ca.Z,cl.X,cl.Y,cl.Z,cu.X,cu.Y,cu.Z,self.far,self.control_flags.value,self.agent_flags.value&0xFF,self.state.value&0xFF)
     def from_bytes_body(self, b:bytes,o:int,l:int):
-        assert l>=122,"Short";self.agent_id=CustomUUID(b,o);o+=16;self.session_id=CustomUUID(b,o);o+=16;self.body_rotation=Quaternion(*struct.unpack_from('<ffff',b,o));o+=16;self.head_rotation=Quaternion(*struct.unpack_from('<ffff',b,o));o+=16;self.camera_center=Vector3(*struct.unpack_from('<fff',b,o));o+=12;self.camera_at_axis=Vector3(*struct.unpack_from('<fff',b,o));o+=12;self.camera_left_axis=Vector3(*struct.unpack_from('<fff',b,o));o+=12;self.camera_up_axis=Vector3(*struct.unpack_from('<fff',b,o));o+=12;self.far=helpers.bytes_to_float(b,o);o+=4;self.control_flags=ControlFlags(helpers.bytes_to_uint32(b,o));o+=4;self.agent_flags=AgentFlags(b[o]);o+=1;self.state=AgentState(b[o]);return self
+        assert l>=_AGENT_UPDATE_STRUCT.size,"Short";v=_AGENT_UPDATE_STRUCT.unpack_from(b,o)
+        self.agent_id=CustomUUID.from_buffer(v[0]);self.session_id=CustomUUID.from_buffer(v[1]);self.body_rotation=Quaternion(*v[2:6]);self.head_rotation=Quaternion(*v[6:10]);self.camera_center=Vector3(*v[10:13]);self.camera_at_axis=Vector3(*v[13:16]);self.camera_left_axis=Vector3(*v[16:19]);self.camera_up_axis=Vector3(*v[19:22]);self.far=v[22];self.control_flags=ControlFlags(v[23]);self.agent_flags=AgentFlags(v[24]);self.state=AgentState(v[25]);return self
 
 class SetAlwaysRunPacket(Packet): # Shortened
     def __init__(self,a:CustomUUID,s:CustomUUID,r:bool,h:PacketHeader|None=None):super().__init__(PacketType.SetAlwaysRun,h);self.agent_id=a;self.session_id=s;self.always_run=r;self.header.reliable=True
-    def to_bytes(self)->bytes:d=bytearray();d.extend(self.agent_id.get_bytes());d.extend(self.session_id.get_bytes());d.append(1 if self.always_run else 0);return bytes(d)
-    def from_bytes_body(self,b,o,l):self.agent_id=CustomUUID(b,o);o+=16;self.session_id=CustomUUID(b,o);o+=16;self.always_run=b[o]!=0;return self
+    def to_bytes(self)->bytes:return _SET_ALWAYS_RUN_STRUCT.pack(self.agent_id.get_bytes(),self.session_id.get_bytes(),1 if self.always_run else 0)
+    def from_bytes_body(self,b,o,l):a,s,r=_SET_ALWAYS_RUN_STRUCT.unpack_from(b,o);self.agent_id=CustomUUID.from_buffer(a);self.session_id=CustomUUID.from_buffer(s);self.always_run=r!=0;return self
 @dataclasses.dataclass
-class AgentDataBlock: agent_id:CustomUUID=CustomUUID.ZERO;session_id:CustomUUID=CustomUUID.ZERO;first_name:bytes=b'';last_name:bytes=b'';group_powers:int=0;active_group_id:CustomUUID=CustomUUID.ZERO;group_title:bytes=b'';group_name:bytes=b'';@property def first_name_str(self)->str:return self.first_name.decode(errors='replace');@property def last_name_str(self)->str:return self.last_name.decode(errors='replace');@property def group_title_str(self)->str:return self.group_title.decode(errors='replace');@property def group_name_str(self)->str:return self.group_name.decode(errors='replace')
+class AgentDataBlock:
+    agent_id:CustomUUID=CustomUUID.ZERO;session_id:CustomUUID=CustomUUID.ZERO;first_name:bytes=b'';last_name:bytes=b'';group_powers:int=0;active_group_id:CustomUUID=CustomUUID.ZERO;group_title:bytes=b'';group_name:bytes=b''
+    @property
+    def first_name_str(self)->str:return self.first_name.decode(errors='replace')
+    @property
+    def last_name_str(self)->str:return self.last_name.decode(errors='replace')
+    @property
+    def group_title_str(self)->str:return self.group_title.decode(errors='replace')
+    @property
+    def group_name_str(self)->str:return self.group_name.decode(errors='replace')
 class AgentDataUpdatePacket(Packet): # Shortened
-    def __init__(self,h:PacketHeader|None=None):
-        super().__init__(PacketType.AgentDataUpdate,h)
+    def __init__(self,header:PacketHeader|None=None):
+        super().__init__(PacketType.AgentDataUpdate,header)
         self.agent_data=AgentDataBlock()
 
     def from_bytes_body(self, buffer: bytes, offset: int, length: int):
@@ -38,33 +68,39 @@ class AgentDataUpdatePacket(Packet): # Shortened
         # Minimum length: AgentID (16) + FirstName (1, null) + LastName (1, null) + GroupPowers (8) + ActiveGroupID (16) + GroupTitle (1, null) [+ GroupName (1, null)]
         # Approx 40 + 1 = 41 without group name, 42 with group name.
         if length < 40: # A very rough minimum, actual is more due to variable strings.
-            logger.error(f"AgentDataUpdatePacket too short for parsing. Length: {length}")
+            logger.error("AgentDataUpdatePacket too short for parsing. Length: %d", length)
             raise ValueError("Buffer too short for AgentDataUpdatePacket.")
 
-        self.agent_data.agent_id = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
+        self.agent_data.agent_id = CustomUUID.from_buffer(buffer, offset); offset += 16
 
         self.agent_data.first_name, bytes_read = helpers.read_null_terminated_bytes(buffer, offset)
+        if bytes_read < 0: raise ValueError("AgentDataUpdate: No null terminator for FirstName.")
         offset += bytes_read
 
         self.agent_data.last_name, bytes_read = helpers.read_null_terminated_bytes(buffer, offset)
+        if bytes_read < 0: raise ValueError("AgentDataUpdate: No null terminator for LastName.")
         offset += bytes_read
 
-        self.agent_data.group_powers = helpers.bytes_to_uint64(buffer, offset); offset += 8
-        self.agent_data.active_group_id = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
+        self.agent_data.group_powers, = _U64_STRUCT.unpack_from(buffer, offset); offset += 8
+        self.agent_data.active_group_id = CustomUUID.from_buffer(buffer, offset); offset += 16
 
         self.agent_data.group_title, bytes_read = helpers.read_null_terminated_bytes(buffer, offset)
+        if bytes_read < 0: raise ValueError("AgentDataUpdate: No null terminator for GroupTitle.")
         offset += bytes_read
 
         # GroupName is the last field and might be absent in some older packet versions or if empty.
         if offset < (initial_offset + length):
             self.agent_data.group_name, bytes_read = helpers.read_null_terminated_bytes(buffer, offset)
+            if bytes_read < 0: # Last field, so an unterminated name just runs to the end of the body
+                logger.debug("AgentDataUpdatePacket: GroupName not null-terminated.")
+                bytes_read = len(self.agent_data.group_name)
             offset += bytes_read
         else:
             self.agent_data.group_name = b""
 
         # Sanity check: did we parse roughly what we expected?
         if offset - initial_offset > length + 5: # Allow some slack for null terminators if not counted in string length by `length`
-            logger.warning(f"AgentDataUpdatePacket parsed beyond expected body length. Parsed: {offset-initial_offset}, Expected: {length}")
+            logger.warning("AgentDataUpdatePacket parsed beyond expected body length. Parsed: %d, Expected: %d", offset-initial_offset, length)
             # This might not be an error if `length` is approximate or doesn't count all nulls.
 
         return self
@@ -75,38 +111,58 @@ class AgentDataUpdatePacket(Packet): # Shortened
         return b''
 
 @dataclasses.dataclass
-class AgentMovementCompleteDataBlock:position:Vector3=Vector3.ZERO;look_at:Vector3=Vector3.ZERO;region_handle:int=0;timestamp:int=0
+class AgentMovementCompleteDataBlock:position:Vector3=dataclasses.field(default_factory=Vector3);look_at:Vector3=dataclasses.field(default_factory=Vector3);region_handle:int=0;timestamp:int=0
 class AgentMovementCompletePacket(Packet): # Shortened
-    def __init__(self,h:PacketHeader|None=None):super().__init__(PacketType.AgentMovementComplete,h);self.agent_id:CustomUUID=CustomUUID.ZERO;self.session_id:CustomUUID=CustomUUID.ZERO;self.data=AgentMovementCompleteDataBlock()
-    def from_bytes_body(self,b,o,l):min_len=16+16+12+12+8+4;assert l>=min_len,"Short";self.agent_id=CustomUUID(b,o);o+=16;self.session_id=CustomUUID(b,o);o+=16;self.data.position=Vector3(*struct.unpack_from('<fff',b,o));o+=12;self.data.look_at=Vector3(*struct.unpack_from('<fff',b,o));o+=12;self.data.region_handle=helpers.bytes_to_uint64(b,o);o+=8;self.data.timestamp=helpers.bytes_to_uint32(b,o);return self
+    def __init__(self,header:PacketHeader|None=None):super().__init__(PacketType.AgentMovementComplete,header);self.agent_id:CustomUUID=CustomUUID.ZERO;self.session_id:CustomUUID=CustomUUID.ZERO;self.data=AgentMovementCompleteDataBlock()
+    def from_bytes_body(self,b,o,l):
+        assert l>=_AGENT_MOVEMENT_COMPLETE_STRUCT.size,"Short";v=_AGENT_MOVEMENT_COMPLETE_STRUCT.unpack_from(b,o)
+        self.agent_id=CustomUUID.from_buffer(v[0]);self.session_id=CustomUUID.from_buffer(v[1]);self.data.position=Vector3(*v[2:5]);self.data.look_at=Vector3(*v[5:8]);self.data.region_handle=v[8];self.data.timestamp=v[9];return self
     def to_bytes(self)->bytes:return b''
 @dataclasses.dataclass
-class AnimationListBlock: anim_id:uuid.UUID=uuid.UUID(int=0);anim_sequence_id:int=0
+class AnimationListBlock: anim_id:CustomUUID=CustomUUID.ZERO;anim_sequence_id:int=0
 @dataclasses.dataclass
 class SenderBlock: id:CustomUUID=CustomUUID.ZERO
 class AvatarAnimationPacket(Packet): # Shortened
-    def __init__(self,h:PacketHeader|None=None):super().__init__(PacketType.AvatarAnimation,h);self.sender=SenderBlock();self.animation_list:list[AnimationListBlock]=[]
-    def from_bytes_body(self,b,o,l):assert l>=17,"Short";self.sender.id=CustomUUID(b,o);o+=16;cnt=b[o];o+=1;self.animation_list=[];[self.animation_list.append(AnimationListBlock(uuid.UUID(bytes_le=b[o:o+16]),helpers.bytes_to_int32(b,o+16))) for _ in range(cnt) if (o:=o+20)-16<=l-4];return self # type: ignore
-    def to_bytes(self)->bytes:d=bytearray();d.extend(self.sender.id.get_bytes());c=len(self.animation_list);d.append(min(c,255));[d.extend(a.anim_id.bytes_le) or d.extend(helpers.int32_to_bytes(a.anim_sequence_id)) for i,a in enumerate(self.animation_list) if i<255];d.extend(b'\x00\x00');return bytes(d)
+    def __init__(self,header:PacketHeader|None=None):super().__init__(PacketType.AvatarAnimation,header);self.sender=SenderBlock();self.animation_list:list[AnimationListBlock]=[]
+    def from_bytes_body(self,b,o,l):
+        assert l>=17,"Short";self.sender.id=CustomUUID.from_buffer(b,o);sz=_ANIMATION_BLOCK_STRUCT.size;cnt=min(b[o+16],(l-17)//sz);o+=17 # Clamp count to the blocks actually present
+        self.animation_list=[AnimationListBlock(CustomUUID.from_buffer(a),seq) for a,seq in _ANIMATION_BLOCK_STRUCT.iter_unpack(memoryview(b)[o:o+cnt*sz])];return self
+    def to_bytes(self)->bytes:
+        anims=self.animation_list[:255];c=len(anims);o=17;buf=bytearray(o+c*_ANIMATION_BLOCK_STRUCT.size+2);buf[:16]=self.sender.id.get_bytes();buf[16]=c
+        for a in anims:_ANIMATION_BLOCK_STRUCT.pack_into(buf,o,a.anim_id.get_bytes(),a.anim_sequence_id);o+=_ANIMATION_BLOCK_STRUCT.size
+        return bytes(buf)
 class ChatFromViewerPacket(Packet): # Shortened
-    def __init__(self,m:str,c:int=0,t:ChatType=ChatType.NORMAL,h:PacketHeader|None=None):super().__init__(PacketType.ChatFromViewer,h);self.message=m;self.channel=c;self.type=t;self.header.reliable=True
-    def to_bytes(self)->bytes:mb=self.message.encode()[:1023];d=bytearray();d.extend(mb);d.append(0);d.extend(helpers.int32_to_bytes(self.channel));d.append(self.type.value&0xFF);return bytes(d)
-    def from_bytes_body(self,b,o,l):me=b.find(b'\0',o);assert me!=-1;self.message=b[o:me].decode(errors='replace');o=me+1;self.channel=helpers.bytes_to_int32(b,o);o+=4;self.type=ChatType(b[o]);return self
+    def __init__(self,m:str,c:int=0,t:ChatType=ChatType.NORMAL,h:PacketHeader|None=None):super().__init__(PacketType.ChatFromViewer,h);self.message=m;self.channel=c;self.chat_type=t;self.header.reliable=True
+    @property
+    def message(self)->str:
+        if self._message is None:self._message=self.message_bytes.decode(errors='replace') # Decoded on first access only
+        return self._message
+    @message.setter
+    def message(self,v:str):self._message=v;self.message_bytes=None
+    def to_bytes(self)->bytes:mb=(self.message_bytes if self.message_bytes is not None else self._message.encode())[:1023];n=len(mb);buf=bytearray(n+1+_CHAT_TAIL_STRUCT.size);buf[:n]=mb;_CHAT_TAIL_STRUCT.pack_into(buf,n+1,self.channel,self.chat_type.value&0xFF);return bytes(buf)
+    def from_bytes_body(self,b,o,l):me=b.index(b'\0',o);self._message=None;self.message_bytes=b[o:me];self.channel,t=_CHAT_TAIL_STRUCT.unpack_from(b,me+1);self.chat_type=ChatType(t);return self
 class AgentRequestSitPacket(Packet): # Shortened
     def __init__(self,a:CustomUUID,s:CustomUUID,t:CustomUUID,off:Vector3,h:PacketHeader|None=None):super().__init__(PacketType.AgentRequestSit,h);self.agent_id=a;self.session_id=s;self.target_id=t;self.offset=off;self.header.reliable=True
-    def to_bytes(self)->bytes:d=bytearray();d.extend(self.agent_id.get_bytes());d.extend(self.session_id.get_bytes());d.extend(self.target_id.get_bytes());d.extend(struct.pack('<fff',*self.offset.as_tuple()));return bytes(d)
+    def to_bytes(self)->bytes:off=self.offset;return _AGENT_REQUEST_SIT_STRUCT.pack(self.agent_id.get_bytes(),self.session_id.get_bytes(),self.target_id.get_bytes(),off.X,off.Y,off.Z)
     def from_bytes_body(self,b,o,l):return self
 class AgentSitPacket(Packet): # Shortened
     def __init__(self,a:CustomUUID,s:CustomUUID,h:PacketHeader|None=None):super().__init__(PacketType.AgentSit,h);self.agent_id=a;self.session_id=s;self.header.reliable=True
-    def to_bytes(self)->bytes:d=bytearray();d.extend(self.agent_id.get_bytes());d.extend(self.session_id.get_bytes());return bytes(d)
+    def to_bytes(self)->bytes:return _AGENT_DATA_STRUCT.pack(self.agent_id.get_bytes(),self.session_id.get_bytes())
     def from_bytes_body(self,b,o,l):return self
 class AvatarSitResponsePacket(Packet): # Shortened
-    def __init__(self,h:PacketHeader|None=None):super().__init__(PacketType.AvatarSitResponse,h);self.sit_object_id=CustomUUID.ZERO;self.autopilot=False;self.camera_at_offset=Vector3.ZERO;self.camera_eye_offset=Vector3.ZERO;self.force_mouselook=False;self.sit_position=Vector3.ZERO;self.sit_rotation=Quaternion.Identity
-    def from_bytes_body(self,b,o,l):min_len=16+12+16+12+12+1+1;assert l>=min_len,"Short";self.sit_object_id=CustomUUID(b,o);o+=16;self.sit_position=Vector3(*struct.unpack_from('<fff',b,o));o+=12;self.sit_rotation=Quaternion(*struct.unpack_from('<ffff',b,o));o+=16;self.camera_eye_offset=Vector3(*struct.unpack_from('<fff',b,o));o+=12;self.camera_at_offset=Vector3(*struct.unpack_from('<fff',b,o));o+=12;self.force_mouselook=b[o]!=0;o+=1;self.autopilot=b[o]!=0;return self
+    def __init__(self,header:PacketHeader|None=None):super().__init__(PacketType.AvatarSitResponse,header);self.sit_object_id=CustomUUID.ZERO;self.autopilot=False;self.camera_at_offset=Vector3.ZERO;self.camera_eye_offset=Vector3.ZERO;self.force_mouselook=False;self.sit_position=Vector3.ZERO;self.sit_rotation=Quaternion.Identity
+    def from_bytes_body(self,b,o,l):
+        assert l>=_AVATAR_SIT_RESPONSE_STRUCT.size,"Short";v=_AVATAR_SIT_RESPONSE_STRUCT.unpack_from(b,o)
+        self.sit_object_id=CustomUUID.from_buffer(v[0]);self.sit_position=Vector3(*v[1:4]);self.sit_rotation=Quaternion(*v[4:8]);self.camera_eye_offset=Vector3(*v[8:11]);self.camera_at_offset=Vector3(*v[11:14]);self.force_mouselook=v[14];self.autopilot=v[15];return self
     def to_bytes(self)->bytes:return b''
+@dataclasses.dataclass
+class AgentAnimationListBlock: anim_id:CustomUUID=CustomUUID.ZERO;start_anim:bool=False
 class AgentAnimationPacket(Packet): # Shortened (Client -> Server)
-    def __init__(self,a:CustomUUID,s:CustomUUID,ans:Dict[CustomUUID,bool],h:PacketHeader|None=None):super().__init__(PacketType.AgentAnimation,h);self.agent_id=a;self.session_id=s;self.animation_list=[AnimationListBlock(k,v) for k,v in ans.items()] # type: ignore
-    def to_bytes(self)->bytes:d=bytearray();d.extend(self.agent_id.get_bytes());d.extend(self.session_id.get_bytes());c=len(self.animation_list);d.append(min(c,255));[d.extend(an.AnimID.get_bytes()) or d.append(1 if an.StartAnim else 0) for i,an in enumerate(self.animation_list) if i<255];d.append(0);return bytes(d) # type: ignore
+    def __init__(self,a:CustomUUID,s:CustomUUID,ans:dict[CustomUUID,bool],h:PacketHeader|None=None):super().__init__(PacketType.AgentAnimation,h);self.agent_id=a;self.session_id=s;self.animation_list=[AgentAnimationListBlock(k,v) for k,v in ans.items()]
+    def to_bytes(self)->bytes:
+        anims=self.animation_list[:255];c=len(anims);o=33;buf=bytearray(o+c*_AGENT_ANIMATION_BLOCK_STRUCT.size+1);_AGENT_DATA_STRUCT.pack_into(buf,0,self.agent_id.get_bytes(),self.session_id.get_bytes());buf[32]=c
+        for an in anims:_AGENT_ANIMATION_BLOCK_STRUCT.pack_into(buf,o,an.anim_id.get_bytes(),an.start_anim);o+=_AGENT_ANIMATION_BLOCK_STRUCT.size
+        return bytes(buf)
     def from_bytes_body(self,b,o,l):return self
 @dataclasses.dataclass
 class ActivateGesturesDataAgentBlock:AgentID:CustomUUID;SessionID:CustomUUID;Flags:int
@@ -114,7 +170,10 @@ class ActivateGesturesDataAgentBlock:AgentID:CustomUUID;SessionID:CustomUUID;Fla
 class ActivateGesturesDataDataBlock:ItemID:CustomUUID;AssetID:CustomUUID;GestureFlags:int
 class ActivateGesturesPacket(Packet): # Shortened
     def __init__(self,a:CustomUUID,s:CustomUUID,gi:CustomUUID,ga:CustomUUID,f:int=0,gf:int=0,h:PacketHeader|None=None):super().__init__(PacketType.ActivateGestures,h);self.agent_data=ActivateGesturesDataAgentBlock(a,s,f);self.data_blocks=[ActivateGesturesDataDataBlock(gi,ga,gf)];self.header.reliable=True
-    def to_bytes(self)->bytes:d=bytearray();d.extend(self.agent_data.AgentID.get_bytes());d.extend(self.agent_data.SessionID.get_bytes());d.extend(helpers.uint32_to_bytes(self.agent_data.Flags));d.append(len(self.data_blocks)&0xFF);[d.extend(b.ItemID.get_bytes()) or d.extend(b.AssetID.get_bytes()) or d.append(b.GestureFlags&0xFF) for b in self.data_blocks];return bytes(d)
+    def to_bytes(self)->bytes:
+        ad=self.agent_data;o=_GESTURES_AGENT_STRUCT.size;buf=bytearray(o+len(self.data_blocks)*_ACTIVATE_GESTURE_BLOCK_STRUCT.size);_GESTURES_AGENT_STRUCT.pack_into(buf,0,ad.AgentID.get_bytes(),ad.SessionID.get_bytes(),ad.Flags,len(self.data_blocks)&0xFF)
+        for b in self.data_blocks:_ACTIVATE_GESTURE_BLOCK_STRUCT.pack_into(buf,o,b.ItemID.get_bytes(),b.AssetID.get_bytes(),b.GestureFlags&0xFF);o+=_ACTIVATE_GESTURE_BLOCK_STRUCT.size
+        return bytes(buf)
     def from_bytes_body(self,b,o,l):return self
 @dataclasses.dataclass
 class DeactivateGesturesDataAgentBlock:AgentID:CustomUUID;SessionID:CustomUUID;Flags:int
@@ -122,7 +181,10 @@ class DeactivateGesturesDataAgentBlock:AgentID:CustomUUID;SessionID:CustomUUID;F
 class DeactivateGesturesDataDataBlock:ItemID:CustomUUID
 class DeactivateGesturesPacket(Packet): # Shortened
     def __init__(self,a:CustomUUID,s:CustomUUID,gi:CustomUUID,f:int=0,h:PacketHeader|None=None):super().__init__(PacketType.DeactivateGestures,h);self.agent_data=DeactivateGesturesDataAgentBlock(a,s,f);self.data_blocks=[DeactivateGesturesDataDataBlock(gi)];self.header.reliable=True
-    def to_bytes(self)->bytes:d=bytearray();d.extend(self.agent_data.AgentID.get_bytes());d.extend(self.agent_data.SessionID.get_bytes());d.extend(helpers.uint32_to_bytes(self.agent_data.Flags));d.append(len(self.data_blocks)&0xFF);[d.extend(b.ItemID.get_bytes()) for b in self.data_blocks];return bytes(d)
+    def to_bytes(self)->bytes:
+        ad=self.agent_data;o=_GESTURES_AGENT_STRUCT.size;buf=bytearray(o+len(self.data_blocks)*16);_GESTURES_AGENT_STRUCT.pack_into(buf,0,ad.AgentID.get_bytes(),ad.SessionID.get_bytes(),ad.Flags,len(self.data_blocks)&0xFF)
+        for b in self.data_blocks:buf[o:o+16]=b.ItemID.get_bytes();o+=16
+        return bytes(buf)
     def from_bytes_body(self,b,o,l):return self
 
 # --- New Mute List Packets ---
@@ -133,7 +195,7 @@ class MuteListRequestMuteDataBlock: MuteCRC: int # u32
 class MuteListRequestPacket(Packet):
     def __init__(self, agent_id: CustomUUID, session_id: CustomUUID, mute_crc: int = 0, header: PacketHeader | None = None):
         super().__init__(PacketType.MuteListRequest, header); self.agent_data = MuteListRequestAgentDataBlock(agent_id,session_id); self.mute_data = MuteListRequestMuteDataBlock(mute_crc); self.header.reliable = True
-    def to_bytes(self) -> bytes: data=bytearray();data.extend(self.agent_data.AgentID.get_bytes());data.extend(self.agent_data.SessionID.get_bytes());data.extend(helpers.uint32_to_bytes(self.mute_data.MuteCRC)); return bytes(data)
+    def to_bytes(self) -> bytes: return _MUTE_LIST_REQUEST_STRUCT.pack(self.agent_data.AgentID.get_bytes(),self.agent_data.SessionID.get_bytes(),self.mute_data.MuteCRC)
     def from_bytes_body(self, b,o,l): logger.warning("Client doesn't receive MuteListRequestPacket."); return self
 
 @dataclasses.dataclass
@@ -142,7 +204,9 @@ class MuteListUpdatePacket(Packet): # Server -> Client
     def __init__(self, header: PacketHeader | None = None): super().__init__(PacketType.MuteListUpdate, header); self.mute_data = MuteListUpdateMuteDataBlock(0,b'')
     @property
     def filename_str(self) -> str: return self.mute_data.Filename.decode(errors='replace')
-    def from_bytes_body(self, b:bytes,o:int,l:int): self.mute_data.MuteCRC=helpers.bytes_to_uint32(b,o);o+=4; self.mute_data.Filename=helpers.bytes_to_string(b,o,0).encode(); return self
+    def from_bytes_body(self, b:bytes,o:int,l:int):
+        self.mute_data.MuteCRC,=_U32_STRUCT.unpack_from(b,o);o+=4;e=b.find(b'\0',o,o+l-4) # Filename is null-terminated
+        self.mute_data.Filename=b[o:e if e!=-1 else o+l-4];return self
     def to_bytes(self) -> bytes: logger.warning("Client doesn't send MuteListUpdatePacket."); return b''
 
 @dataclasses.dataclass
@@ -151,7 +215,9 @@ class UpdateMuteListEntryPacket(Packet): # Client -> Server
     def __init__(self, agent_id:CustomUUID,session_id:CustomUUID,mute_type:MuteType,mute_id:CustomUUID,mute_name:str,mute_flags:MuteFlags,header:PacketHeader|None=None):
         super().__init__(PacketType.UpdateMuteListEntry,header);self.agent_data=MuteListRequestAgentDataBlock(agent_id,session_id) # Reuse agent data block
         self.mute_data=UpdateMuteListEntryMuteDataBlock(mute_type.value,mute_id,mute_name.encode()[:254],mute_flags.value);self.header.reliable=True
-    def to_bytes(self)->bytes: data=bytearray();data.extend(self.agent_data.AgentID.get_bytes());data.extend(self.agent_data.SessionID.get_bytes());data.extend(helpers.int32_to_bytes(self.mute_data.MuteType));data.extend(self.mute_data.MuteID.get_bytes());data.extend(self.mute_data.MuteName);data.append(0);data.extend(helpers.uint32_to_bytes(self.mute_data.MuteFlags)); return bytes(data)
+    def to_bytes(self)->bytes:
+        md=self.mute_data;name=md.MuteName;o=_UPDATE_MUTE_HEAD_STRUCT.size;n=len(name);buf=bytearray(o+n+1+4)
+        _UPDATE_MUTE_HEAD_STRUCT.pack_into(buf,0,self.agent_data.AgentID.get_bytes(),self.agent_data.SessionID.get_bytes(),md.MuteType,md.MuteID.get_bytes());buf[o:o+n]=name;_U32_STRUCT.pack_into(buf,o+n+1,md.MuteFlags);return bytes(buf)
     def from_bytes_body(self,b,o,l): logger.warning("Client doesn't receive UpdateMuteListEntryPacket."); return self
 
 @dataclasses.dataclass
@@ -160,5 +226,7 @@ class RemoveMuteListEntryPacket(Packet): # Client -> Server
     def __init__(self,agent_id:CustomUUID,session_id:CustomUUID,mute_id:CustomUUID,mute_name:str,header:PacketHeader|None=None):
         super().__init__(PacketType.RemoveMuteListEntry,header);self.agent_data=MuteListRequestAgentDataBlock(agent_id,session_id)
         self.mute_data=RemoveMuteListEntryMuteDataBlock(mute_id,mute_name.encode()[:254]);self.header.reliable=True
-    def to_bytes(self)->bytes: data=bytearray();data.extend(self.agent_data.AgentID.get_bytes());data.extend(self.agent_data.SessionID.get_bytes());data.extend(self.mute_data.MuteID.get_bytes());data.extend(self.mute_data.MuteName);data.append(0); return bytes(data)
+    def to_bytes(self)->bytes:
+        name=self.mute_data.MuteName;o=_REMOVE_MUTE_HEAD_STRUCT.size;n=len(name);buf=bytearray(o+n+1)
+        _REMOVE_MUTE_HEAD_STRUCT.pack_into(buf,0,self.agent_data.AgentID.get_bytes(),self.agent_data.SessionID.get_bytes(),self.mute_data.MuteID.get_bytes());buf[o:o+n]=name;return bytes(buf)
     def from_bytes_body(self,b,o,l): logger.warning("Client doesn't receive RemoveMuteListEntryPacket."); return self
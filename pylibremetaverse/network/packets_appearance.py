@@ -2,15 +2,23 @@ import logging
 import struct
 import dataclasses
 
-from pylibremetaverse.types import CustomUUID
+from typing import List, Sequence
+
+from pylibremetaverse.types import CustomUUID, Vector3
 from pylibremetaverse.types.enums import WearableType # For WearableDataBlock
-from pylibremetaverse.utils import helpers
 from .packets_base import Packet, PacketHeader, PacketType
 
 logger = logging.getLogger(__name__)
 
+_AGENT_DATA_STRUCT = struct.Struct('<16s16s') # AgentID, SessionID
+_SET_APPEARANCE_AGENT_STRUCT = struct.Struct('<32sIfff') # AgentID+SessionID, SerialNum, Size
+_WEARABLES_UPDATE_AGENT_STRUCT = struct.Struct('<16sIB') # AgentID, SerialNum, VisualVersion
+_WEARABLE_DATA_STRUCT = struct.Struct('<16s16sB') # ItemID, AssetID, WearableType
+_AVATAR_APPEARANCE_SENDER_STRUCT = struct.Struct('<16s?') # ID, IsTrial
+_WEARING_ITEM_STRUCT = struct.Struct('<16sB') # ItemID, WearableType
+
 # --- AgentWearablesRequestPacket (Client -> Server) ---
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AgentWearablesRequestAgentDataBlock:
     AgentID: CustomUUID
     SessionID: CustomUUID
@@ -18,17 +26,14 @@ class AgentWearablesRequestAgentDataBlock:
 class AgentWearablesRequestPacket(Packet):
     """Client requests its current wearable appearance from the server."""
     def __init__(self, agent_id: CustomUUID, session_id: CustomUUID,
-                 header: PacketHeader | None = None):
+                 header: PacketHeader | None = None, agent_session_bytes: bytes | None = None):
         super().__init__(PacketType.AgentWearablesRequest, header if header else PacketHeader())
         self.agent_data = AgentWearablesRequestAgentDataBlock(AgentID=agent_id, SessionID=session_id)
+        self.agent_session_bytes: bytes | None = agent_session_bytes # Pre-packed AgentID+SessionID (AgentManager.agent_session_bytes)
         self.header.reliable = True # Typically reliable
 
     def to_bytes(self) -> bytes:
-        data = bytearray()
-        # AgentData block
-        data.extend(self.agent_data.AgentID.get_bytes())
-        data.extend(self.agent_data.SessionID.get_bytes())
-        return bytes(data)
+        return self.agent_session_bytes or _AGENT_DATA_STRUCT.pack(self.agent_data.AgentID.get_bytes(), self.agent_data.SessionID.get_bytes())
 
     def from_bytes_body(self, buffer: bytes, offset: int, length: int):
         logger.warning("AgentWearablesRequestPacket.from_bytes_body should not be called on client.")
@@ -36,7 +41,7 @@ class AgentWearablesRequestPacket(Packet):
 
 
 # --- AgentWearablesUpdatePacket (Server -> Client) ---
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AgentWearablesUpdateAgentDataBlock:
     AgentID: CustomUUID
     SessionID: CustomUUID # Note: C# packet has AgentID, SerialNum, VisualVersion. SessionID might not be here.
@@ -45,67 +50,89 @@ class AgentWearablesUpdateAgentDataBlock:
     SerialNum: int = 0 # u32, version number for this update
     VisualVersion: int = 0 # u8, version of visual params
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class WearableDataBlock:
     ItemID: CustomUUID
     AssetID: CustomUUID
     WearableType: int # Actually u8, maps to WearableType enum
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class VisualParamBlock:
     ParamValue: int # Actually u8
 
+class _VisualParamView:
+    """Sequence of VisualParamBlock over raw ParamValue bytes; blocks are only created when read."""
+    __slots__ = ('_raw',)
+
+    def __init__(self, raw: bytes):
+        self._raw = raw
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [VisualParamBlock(ParamValue=v) for v in self._raw[index]]
+        return VisualParamBlock(ParamValue=self._raw[index])
+
+    def __iter__(self):
+        return (VisualParamBlock(ParamValue=v) for v in self._raw)
+
 class AgentWearablesUpdatePacket(Packet):
     """Server sends this with the agent's current wearable items and visual parameters."""
     def __init__(self, header: PacketHeader | None = None):
         super().__init__(PacketType.AgentWearablesUpdate, header if header else PacketHeader())
         self.agent_data = AgentWearablesUpdateAgentDataBlock(AgentID=CustomUUID.ZERO, SessionID=CustomUUID.ZERO)
-        self.wearable_data: list[WearableDataBlock] = []
-        self.visual_param: list[VisualParamBlock] = [] # Should contain 256 params
+        self.wearable_data_bytes: bytes = b'' # Raw WearableData records, 33 bytes each
+        self.visual_param_bytes: bytes = b'' # Raw ParamValue bytes, should contain 256 params
 
-    def from_bytes_body(self, buffer: bytes, offset: int, length: int):
-        initial_offset = offset
+    @property
+    def wearable_data(self) -> list[WearableDataBlock]:
+        """WearableData blocks, built on demand from wearable_data_bytes."""
+        return [WearableDataBlock(ItemID=CustomUUID.from_buffer(item_id), AssetID=CustomUUID.from_buffer(asset_id),
+                                  WearableType=wearable_type)
+                for item_id, asset_id, wearable_type in _WEARABLE_DATA_STRUCT.iter_unpack(self.wearable_data_bytes)]
 
-        # AgentData block
-        self.agent_data.AgentID = CustomUUID(buffer, offset); offset += 16
-        # Assuming SessionID is here based on common pattern, C# has SerialNum instead.
-        # If it's SerialNum (u32) + VisualVersion (u8):
-        # self.agent_data.SerialNum = helpers.bytes_to_uint32(buffer, offset); offset += 4
-        # self.agent_data.VisualVersion = buffer[offset]; offset += 1
-        # For now, let's assume SessionID for placeholder consistency.
-        self.agent_data.SessionID = CustomUUID(buffer, offset); offset += 16 # Placeholder for actual AgentData structure
-        # Correcting AgentData block based on common AgentWearablesUpdate structure:
-        # It's AgentID (16), SerialNum (4), VisualVersion (1)
-        # Reset offset and parse correctly:
-        offset = initial_offset
-        self.agent_data.AgentID = CustomUUID(buffer, offset); offset += 16
-        self.agent_data.SerialNum = helpers.bytes_to_uint32(buffer, offset); offset += 4
-        self.agent_data.VisualVersion = buffer[offset]; offset += 1
+    @property
+    def visual_param(self) -> '_VisualParamView':
+        """VisualParam blocks as a read-only sequence over visual_param_bytes."""
+        return _VisualParamView(self.visual_param_bytes)
 
+    def from_bytes_body(self, buffer: bytes, offset: int, length: int):
+        end = offset + length
+        # Fixed part: AgentData plus the WearableData count byte. Checked once up front; every
+        # variable block below is clamped to what is left instead of checking per element.
+        if length < _WEARABLES_UPDATE_AGENT_STRUCT.size + 1:
+            logger.warning("AgentWearablesUpdate: packet too short for AgentData.")
+            return self
+
+        # AgentData block: AgentID (16), SerialNum (4), VisualVersion (1). There is no SessionID on the wire.
+        agent_id, self.agent_data.SerialNum, self.agent_data.VisualVersion = _WEARABLES_UPDATE_AGENT_STRUCT.unpack_from(buffer, offset)
+        self.agent_data.AgentID = CustomUUID.from_buffer(agent_id); offset += _WEARABLES_UPDATE_AGENT_STRUCT.size
 
         # WearableData blocks (variable count)
+        # Records are fixed size, so the whole array is kept as one slice and decoded lazily.
         wearable_count = buffer[offset]; offset += 1 # Count is u8
-        for _ in range(wearable_count):
-            if offset + 16 + 16 + 1 > initial_offset + length: # Check bounds
-                logger.warning("AgentWearablesUpdate: WearableData truncated.")
-                break
-            item_id = CustomUUID(buffer, offset); offset += 16
-            asset_id = CustomUUID(buffer, offset); offset += 16
-            wearable_type_val = buffer[offset]; offset += 1
-            self.wearable_data.append(WearableDataBlock(ItemID=item_id, AssetID=asset_id, WearableType=wearable_type_val))
+        available = (end - offset) // _WEARABLE_DATA_STRUCT.size
+        if wearable_count > available: # Check bounds
+            logger.warning("AgentWearablesUpdate: WearableData truncated.")
+            wearable_count = available
+        self.wearable_data_bytes = bytes(buffer[offset:offset + wearable_count * _WEARABLE_DATA_STRUCT.size])
+        offset += len(self.wearable_data_bytes)
 
         # VisualParam blocks (fixed count, typically 256)
         # There's a count byte for visual params as well.
+        if offset >= end:
+            logger.warning("AgentWearablesUpdate: No data left for VisualParams count.")
+            return self
         visual_param_count = buffer[offset]; offset += 1
-        for i in range(visual_param_count):
-            if offset + 1 > initial_offset + length: # Check bounds
-                logger.warning(f"AgentWearablesUpdate: VisualParam data truncated at index {i}.")
-                break
-            param_val = buffer[offset]; offset += 1
-            self.visual_param.append(VisualParamBlock(ParamValue=param_val))
-
-        if visual_param_count != 256 and visual_param_count !=0 : # 0 can be valid if not sent
-             logger.warning(f"AgentWearablesUpdate: Expected 256 visual params or 0, got {visual_param_count}")
+        self.visual_param_bytes = bytes(buffer[offset:min(offset + visual_param_count, end)])
+        if len(self.visual_param_bytes) < visual_param_count: # Check bounds
+            logger.warning("AgentWearablesUpdate: VisualParam data truncated at index %d.", len(self.visual_param_bytes))
+        offset += len(self.visual_param_bytes)
+
+        if visual_param_count != 256 and visual_param_count != 0: # 0 can be valid if not sent
+             logger.warning("AgentWearablesUpdate: Expected 256 visual params or 0, got %d", visual_param_count)
         return self
 
     def to_bytes(self) -> bytes:
@@ -114,16 +141,16 @@ class AgentWearablesUpdatePacket(Packet):
 
 
 # --- AgentSetAppearancePacket (Client -> Server) ---
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AgentSetAppearanceAgentDataBlock:
     AgentID: CustomUUID
     SessionID: CustomUUID
     SerialNum: int # u32
     Size: Vector3 # Vector3, but often just sent as all zeros by client initially
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AgentSetAppearanceObjectDataBlock: # For TextureEntry
-    TextureEntry: bytes # Variable, up to 2000 bytes (typically ~470 for default, up to 1000 for extended)
+    TextureEntry: bytes | memoryview # Variable (memoryview into the packet body when decoded), up to 2000 bytes (typically ~470 for default, up to 1000 for extended)
 
 # WearableDataBlock for AgentSetAppearance is an array of CacheID (CustomUUID)
 # This is typically empty when sent by client, server uses it for its own caching.
@@ -133,52 +160,50 @@ class AgentSetAppearancePacket(Packet):
     """Client sends this to set its appearance (textures, visual params, wearables)."""
     def __init__(self, agent_id: CustomUUID, session_id: CustomUUID,
                  serial_num: int, size_vec: Vector3,
-                 texture_entry_bytes: bytes, visual_params_bytes: List[int], # List of int 0-255
-                 header: PacketHeader | None = None):
+                 texture_entry_bytes: bytes, visual_params_bytes: bytes | bytearray | memoryview | Sequence[int], # Values 0-255
+                 header: PacketHeader | None = None, agent_session_bytes: bytes | None = None):
         super().__init__(PacketType.AgentSetAppearance, header if header else PacketHeader())
         self.agent_data = AgentSetAppearanceAgentDataBlock(
             AgentID=agent_id, SessionID=session_id, SerialNum=serial_num, Size=size_vec
         )
+        self.agent_session_bytes: bytes | None = agent_session_bytes # Pre-packed AgentID+SessionID (AgentManager.agent_session_bytes)
         self.object_data = AgentSetAppearanceObjectDataBlock(TextureEntry=texture_entry_bytes)
         self.wearable_data_cache_ids: List[CustomUUID] = [] # Typically empty from client
-        self.visual_param_values: List[int] = visual_params_bytes # List of ints (0-255)
+        # Kept as given: buffers are copied straight into the packet, other sequences go through bytes().
+        self.visual_param_values: bytes | bytearray | memoryview | Sequence[int] = visual_params_bytes
         self.header.reliable = True
 
     def to_bytes(self) -> bytes:
-        data = bytearray()
-        # AgentData Block
-        data.extend(self.agent_data.AgentID.get_bytes())
-        data.extend(self.agent_data.SessionID.get_bytes())
-        data.extend(helpers.uint32_to_bytes(self.agent_data.SerialNum))
-        data.extend(struct.pack('<fff', self.agent_data.Size.X, self.agent_data.Size.Y, self.agent_data.Size.Z))
+        ad = self.agent_data; size = ad.Size
+        agent_session = self.agent_session_bytes or ad.AgentID.get_bytes() + ad.SessionID.get_bytes()
 
         # ObjectData Block (TextureEntry)
         te_len = len(self.object_data.TextureEntry)
         if te_len > 2000: # Max size check
-            logger.warning(f"TextureEntry too long ({te_len}), truncating to 2000 bytes.")
-            self.object_data.TextureEntry = self.object_data.TextureEntry[:2000]
+            logger.warning("TextureEntry too long (%d), truncating to 2000 bytes.", te_len)
+            self.object_data.TextureEntry = self.object_data.TextureEntry[:2000]; te_len = 2000
         # TextureEntry is prefixed by its length (u16 or u32 depending on packet version, assume u16 for now)
         # C# uses WriteUTF8String which implies null termination and length prefix handling by underlying methods.
         # For direct byte array, many viewers expect u16 length prefix for TE.
         # However, AgentSetAppearance TE is often just the raw bytes up to a certain limit (e.g. 1000).
         # For now, assume raw bytes as per some packet captures. This needs verification.
-        # If it needs a length prefix: data.extend(helpers.uint16_to_bytes(len(self.object_data.TextureEntry)))
-        data.extend(self.object_data.TextureEntry)
+        # If it needs a length prefix: join a '<H' length in front of the TE below.
 
-        # WearableData Block (array of CacheIDs)
-        data.append(len(self.wearable_data_cache_ids) & 0xFF) # Count byte
-        for cache_id in self.wearable_data_cache_ids: # Usually empty from client
-            data.extend(cache_id.get_bytes())
-
-        # VisualParam Block (array of ParamValue bytes)
+        num_cache_ids = len(self.wearable_data_cache_ids)
         num_visual_params = len(self.visual_param_values)
         if num_visual_params != 256: # Standard count
-             logger.warning(f"AgentSetAppearance: Sending {num_visual_params} visual params, expected 256.")
-        data.append(num_visual_params & 0xFF) # Count byte (should be 256 or specific count)
-        for val in self.visual_param_values:
-            data.append(val & 0xFF) # Ensure it's a byte
-
-        return bytes(data)
+             logger.warning("AgentSetAppearance: Sending %d visual params, expected 256.", num_visual_params)
+
+        vp = self.visual_param_values
+        # Buffers (bytes, bytearray, memoryview) are joined as-is. Other sequences of ints are
+        # converted by bytes() in C, which raises ValueError for values outside 0-255 instead of masking.
+        if not isinstance(vp, (bytes, bytearray, memoryview)): vp = bytes(vp)
+        return b''.join((_SET_APPEARANCE_AGENT_STRUCT.pack(agent_session, ad.SerialNum, size.X, size.Y, size.Z),
+                         self.object_data.TextureEntry,
+                         bytes((num_cache_ids & 0xFF,)), # WearableData count, then the CacheIDs (usually none from client)
+                         *[cache_id.get_bytes() for cache_id in self.wearable_data_cache_ids],
+                         bytes((num_visual_params & 0xFF,)), # VisualParam count (should be 256)
+                         vp))
 
     def from_bytes_body(self, buffer: bytes, offset: int, length: int): # Server doesn't send this
         logger.warning("AgentSetAppearancePacket.from_bytes_body should not be called on client.")
@@ -186,7 +211,7 @@ class AgentSetAppearancePacket(Packet):
 
 
 # --- AvatarAppearancePacket (Server -> Client) ---
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AvatarAppearanceSenderBlock:
     ID: CustomUUID
     IsTrial: bool # u8
@@ -232,7 +257,7 @@ class AvatarAppearanceSenderBlock:
 
 # For `AgentIsNowWearingPacket`, it's a list of (ItemID, WearableType).
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class AgentIsNowWearingItemDataBlock:
     ItemID: CustomUUID
     WearableType: int # u8, maps to WearableType enum
@@ -241,28 +266,31 @@ class AgentIsNowWearingPacket(Packet):
     """Client informs the server about explicitly worn or detached items."""
     def __init__(self, agent_id: CustomUUID, session_id: CustomUUID,
                  items: list[tuple[CustomUUID, WearableType]],
-                 header: PacketHeader | None = None):
+                 header: PacketHeader | None = None, agent_session_bytes: bytes | None = None):
         super().__init__(PacketType.AgentIsNowWearing, header if header else PacketHeader())
         self.agent_data = AgentSetAppearanceAgentDataBlock( # Re-use AgentData from AgentSetAppearance
             AgentID=agent_id, SessionID=session_id, SerialNum=0, Size=Vector3.ZERO # SerialNum/Size might not be used
         )
-        self.item_data_blocks: list[AgentIsNowWearingItemDataBlock] = []
-        for item_id, wearable_type_enum in items:
-            self.item_data_blocks.append(
-                AgentIsNowWearingItemDataBlock(ItemID=item_id, WearableType=wearable_type_enum.value)
-            )
+        self.item_data_blocks: list[AgentIsNowWearingItemDataBlock] = [
+            AgentIsNowWearingItemDataBlock(ItemID=item_id, WearableType=wearable_type_enum.value)
+            for item_id, wearable_type_enum in items
+        ]
+        self.agent_session_bytes: bytes | None = agent_session_bytes # Pre-packed AgentID+SessionID (AgentManager.agent_session_bytes)
         self.header.reliable = True
 
     def to_bytes(self) -> bytes:
-        data = bytearray()
+        # Fixed 17-byte records, so the packet is written into an exact-size buffer.
+        num_items = len(self.item_data_blocks)
+        data = bytearray(_AGENT_DATA_STRUCT.size + 1 + _WEARING_ITEM_STRUCT.size * num_items)
         # AgentData
-        data.extend(self.agent_data.AgentID.get_bytes())
-        data.extend(self.agent_data.SessionID.get_bytes())
+        data[:_AGENT_DATA_STRUCT.size] = self.agent_session_bytes or _AGENT_DATA_STRUCT.pack(
+            self.agent_data.AgentID.get_bytes(), self.agent_data.SessionID.get_bytes())
         # ItemData array
-        data.append(len(self.item_data_blocks) & 0xFF) # Count byte
+        off = _AGENT_DATA_STRUCT.size
+        data[off] = num_items & 0xFF; off += 1 # Count byte
         for block in self.item_data_blocks:
-            data.extend(block.ItemID.get_bytes())
-            data.append(block.WearableType & 0xFF)
+            _WEARING_ITEM_STRUCT.pack_into(data, off, block.ItemID.get_bytes(), block.WearableType & 0xFF)
+            off += _WEARING_ITEM_STRUCT.size
         return bytes(data)
 
     def from_bytes_body(self, buffer: bytes, offset: int, length: int):
@@ -276,60 +304,44 @@ class AvatarAppearancePacket(Packet):
         super().__init__(PacketType.AvatarAppearance, header if header else PacketHeader())
         self.sender = AvatarAppearanceSenderBlock(ID=CustomUUID.ZERO, IsTrial=False)
         self.object_data = AgentSetAppearanceObjectDataBlock(TextureEntry=b'') # Reusing for TE
-        self.visual_param: list[VisualParamBlock] = [] # List of VisualParamBlock from AgentWearablesUpdate structure
+        self.visual_param_bytes: bytes = b'' # Raw ParamValue bytes, same layout as AgentWearablesUpdate
+
+    @property
+    def visual_param(self) -> '_VisualParamView':
+        """VisualParam blocks as a read-only sequence over visual_param_bytes."""
+        return _VisualParamView(self.visual_param_bytes)
 
     def from_bytes_body(self, buffer: bytes, offset: int, length: int):
         initial_offset = offset
 
         # Sender Block
-        self.sender.ID = CustomUUID(buffer, offset); offset += 16
-        self.sender.IsTrial = (buffer[offset] != 0); offset += 1
+        sender_id, self.sender.IsTrial = _AVATAR_APPEARANCE_SENDER_STRUCT.unpack_from(buffer, offset)
+        self.sender.ID = CustomUUID.from_buffer(sender_id); offset += _AVATAR_APPEARANCE_SENDER_STRUCT.size
 
         # ObjectData Block (TextureEntry)
-        # TextureEntry is complex. It's a variable length byte array.
-        # The length is determined by how much of the packet is left before VisualParams.
-        # VisualParams are a fixed block at the end (typically 256 bytes + 1 count byte).
-
-        # Calculate visual param block size first
-        # If VisualParam count is always 256 + 1 byte for count:
-        vp_count_assumed = 256 # This is an assumption, might be a byte in packet
-        # Check if there's a visual param count byte
-        # C# AvatarAppearancePacket has a VisualParam (count byte + 256 bytes) block at the end.
-        # So, texture entry length is total_length - header - sender - visual_params_with_count.
-
-        # Assuming VisualParam data is at the end and has a count byte
-        # This is a common pattern: [Data] [VPCount (1 byte)] [VPData (VPCount bytes)]
-        # If VPCount is fixed at 256, then it's simpler:
-        # texture_entry_len = length - (offset - initial_offset) - (1 + 256) # if count byte + 256 params
+        # TextureEntry is a variable length byte array with no length prefix; it runs up to the
+        # VisualParam block at the end of the packet ([VPCount (1 byte)] [VPData (256 bytes)]).
+        # Both blocks are located with offset arithmetic and taken as single slices.
         # This needs careful checking against actual packet structure from C# / captures.
-
-        # For now, let's assume TextureEntry takes up space until a known fixed size for VisualParams.
-        # If VisualParams are always 256 bytes + 1 count byte:
+        end = initial_offset + length
         visual_params_size_with_count = 256 + 1
-        texture_entry_end_offset = (initial_offset + length) - visual_params_size_with_count
-
-        if offset <= texture_entry_end_offset:
-            self.object_data.TextureEntry = buffer[offset:texture_entry_end_offset]
-            offset = texture_entry_end_offset
-        else: # Not enough space for TE and full visual params
+        texture_entry_end_offset = end - visual_params_size_with_count
+        if offset > texture_entry_end_offset: # Not enough space for TE and full visual params
             logger.warning("AvatarAppearancePacket: Not enough data for TextureEntry and VisualParams.")
-            # Fallback: try to read TE up to where visual params would start, or assume empty TE.
-            min_remaining_for_vp = 1 # count byte
-            if initial_offset + length - offset > min_remaining_for_vp:
-                 self.object_data.TextureEntry = buffer[offset : (initial_offset + length - min_remaining_for_vp)]
-            else: self.object_data.TextureEntry = b''
-            offset += len(self.object_data.TextureEntry)
-
+            # Fallback: leave just the VP count byte, or assume empty TE.
+            texture_entry_end_offset = max(offset, end - 1)
+        # Zero-copy view into the packet body; it keeps the body alive, so consumers that store
+        # the TextureEntry beyond the packet handler should take bytes() of it.
+        self.object_data.TextureEntry = memoryview(buffer)[offset:texture_entry_end_offset]
+        offset = texture_entry_end_offset
 
         # VisualParam Block
-        if offset < initial_offset + length:
+        if offset < end:
             visual_param_count = buffer[offset]; offset += 1
-            for i in range(visual_param_count):
-                if offset + 1 > initial_offset + length: break
-                param_val = buffer[offset]; offset += 1
-                self.visual_param.append(VisualParamBlock(ParamValue=param_val))
+            self.visual_param_bytes = bytes(buffer[offset:min(offset + visual_param_count, end)])
+            offset += len(self.visual_param_bytes)
             if visual_param_count != 256 and visual_param_count != 0:
-                 logger.warning(f"AvatarAppearance: Expected 256 or 0 visual params, got {visual_param_count}")
+                 logger.warning("AvatarAppearance: Expected 256 or 0 visual params, got %d", visual_param_count)
         else:
             logger.warning("AvatarAppearancePacket: No data left for VisualParams count.")
 
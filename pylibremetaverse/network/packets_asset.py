@@ -4,17 +4,26 @@ import dataclasses
 
 from pylibremetaverse.types import CustomUUID, Vector3 # Vector3 for AgentData in RequestImage
 from pylibremetaverse.types.enums import AssetType, ChannelType, TargetType, StatusCode, ImageType # Added ImageType
-from pylibremetaverse.utils import helpers
 from .packets_base import Packet, PacketHeader, PacketType
 
 logger = logging.getLogger(__name__)
 
+_REQUEST_XFER_STRUCT = struct.Struct('<Q16sh') # XferID, VFileID, VFileType
+_XFER_PACKET_STRUCT = struct.Struct('<QI') # XferID, Packet (SendXferPacket / ConfirmXferPacket)
+_TRANSFER_INFO_STRUCT = struct.Struct('<16siiii') # TransferID, ChannelType, TargetType, Status, Size
+_TRANSFER_PACKET_STRUCT = struct.Struct('<16si') # TransferID, ChannelType
+_REQUEST_IMAGE_BLOCK_STRUCT = struct.Struct('<16sBBfII') # Image, Type, DiscardLevel, DownloadPriority, Packet, ExtraInfo
+_REQUEST_IMAGE_SINGLE_STRUCT = struct.Struct('<32sB16sBBfII') # AgentID+SessionID, Count (1), then one RequestImage block
+_IMAGE_ID_STRUCT = struct.Struct('<16sIB') # ID, Size, Codec
+_ASSET_UPLOAD_REQUEST_STRUCT = struct.Struct('<16sB???iI') # TransactionID, Type, Tempfile, Public, StoreLocal, Size, DataLen
+_ASSET_UPLOAD_COMPLETE_STRUCT = struct.Struct('<16s?16sb') # TransactionID, Success, AssetUUID, Type
+
 # --- RequestXferPacket (Client -> Server) ---
 class RequestXferPacket(Packet):
     """Client requests an Xfer download from the server."""
-    def __init__(self, filename: str, delete_on_completion: bool, use_big_packets: bool,
-                 vfile_id: CustomUUID, vfile_type: AssetType,
-                 header: PacketHeader | None = None):
+    def __init__(self, filename: str = '', delete_on_completion: bool = False, use_big_packets: bool = False,
+                 vfile_id: CustomUUID = CustomUUID.ZERO, vfile_type: AssetType = AssetType.Unknown,
+                 header: PacketHeader | None = None): # Defaults let packet_factory build it for server-sent requests
         super().__init__(PacketType.RequestXfer, header if header else PacketHeader())
         self.filename_bytes: bytes = filename.encode('utf-8') # Null-terminated string internally
         self.delete_on_completion: bool = delete_on_completion
@@ -25,73 +34,62 @@ class RequestXferPacket(Packet):
         self.header.reliable = True
 
     def to_bytes(self) -> bytes:
-        data = bytearray()
-        data.extend(helpers.uint64_to_bytes(self.xfer_id)) # XferID (u64)
-        data.extend(self.vfile_id.get_bytes()) # VFileID (16)
-        data.extend(helpers.int16_to_bytes(self.vfile_type)) # VFileType (s16)
-
         fn_bytes = self.filename_bytes
         if len(fn_bytes) > 254: fn_bytes = fn_bytes[:254] # Max length
-        data.extend(fn_bytes); data.append(0) # Filename (null-terminated)
 
         # These flags are not explicitly in C# RequestXferPacket, but part of generic Xfer setup.
         # For now, assuming they are not part of this specific packet's body.
         # If they are, they would be packed here.
         # data.append(1 if self.delete_on_completion else 0)
         # data.append(1 if self.use_big_packets else 0)
-        return bytes(data)
+        return _REQUEST_XFER_STRUCT.pack(self.xfer_id, self.vfile_id.get_bytes(), self.vfile_type) + fn_bytes + b'\0' # Null-terminated filename
 
     def from_bytes_body(self, buffer: bytes, offset: int, length: int) -> "RequestXferPacket":
         """Parses a RequestXferPacket, typically when server initiates an upload Xfer."""
+        if length < _REQUEST_XFER_STRUCT.size: raise ValueError("RequestXferPacket body too short.")
         initial_offset = offset
-        self.xfer_id = helpers.bytes_to_uint64(buffer, offset); offset += 8
-        self.vfile_id = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
-        self.vfile_type = helpers.bytes_to_int16(buffer, offset); offset += 2 # s16
+        self.xfer_id, vfile_id, self.vfile_type = _REQUEST_XFER_STRUCT.unpack_from(buffer, offset) # VFileType is s16
+        self.vfile_id = CustomUUID.from_buffer(vfile_id); offset += _REQUEST_XFER_STRUCT.size
 
         # FilePath might be empty or not present in server->client RequestXfer for upload
-        filename_end = buffer.find(b'\0', offset)
-        if filename_end != -1 and filename_end < initial_offset + length:
-            self.filename_bytes = buffer[offset:filename_end]
-            # offset = filename_end + 1 # Not strictly needed as it's the last field we parse here
-        else: # No null term or empty path
-            self.filename_bytes = b''
-            # offset += 0 # Path was empty or not fully there
+        end = initial_offset + length
+        filename_end = buffer.find(b'\0', offset, end) if offset < end else -1 # Skip the scan for an empty path
+        self.filename_bytes = buffer[offset:filename_end] if filename_end != -1 else b'' # No null term or empty path
 
         # delete_on_completion and use_big_packets are not typically sent by server in this context.
-        logger.info(f"Parsed server-sent RequestXfer: XferID={self.xfer_id}, VFileID={self.vfile_id}, Type={self.vfile_type}")
+        logger.info("Parsed server-sent RequestXfer: XferID=%s, VFileID=%s, Type=%s", self.xfer_id, self.vfile_id, self.vfile_type)
         return self
 
 
 # --- SendXferPacket (Bidirectional, but context determines sender/receiver) ---
 class SendXferPacket(Packet):
     """Contains a chunk of data for an Xfer transfer (download or upload)."""
+    __slots__ = ('xfer_id', 'packet_num', 'data')
+
     def __init__(self, xfer_id: int = 0, packet_num: int = 0, data_chunk: bytes = b'',
                  header: PacketHeader | None = None):
         super().__init__(PacketType.SendXferPacket, header if header else PacketHeader())
         self.xfer_id: int = xfer_id # u64, identifies the transfer session
         self.packet_num: int = packet_num # u32, sequence number for this chunk
-        self.data: bytes = data_chunk # The actual data chunk
+        self.data: bytes | memoryview = data_chunk # The actual data chunk (a view into the packet body when received)
 
     def from_bytes_body(self, buffer: bytes, offset: int, length: int) -> "SendXferPacket":
         # Used when client receives this packet (download)
-        if length < 12: raise ValueError("SendXferPacket (from_bytes) body too short for XferID and PacketNum.")
-        self.xfer_id = helpers.bytes_to_uint64(buffer, offset); offset += 8
-        self.packet_num = helpers.bytes_to_uint32(buffer, offset); offset += 4
-        self.data = buffer[offset : offset + (length - 12)]
+        if length < _XFER_PACKET_STRUCT.size: raise ValueError("SendXferPacket (from_bytes) body too short for XferID and PacketNum.")
+        self.xfer_id, self.packet_num = _XFER_PACKET_STRUCT.unpack_from(buffer, offset)
+        self.data = memoryview(buffer)[offset + _XFER_PACKET_STRUCT.size : offset + length] # Zero-copy view of the body
         return self
 
     def to_bytes(self) -> bytes:
         # Used when client sends this packet (upload)
-        packet_data = bytearray()
-        packet_data.extend(helpers.uint64_to_bytes(self.xfer_id))
-        packet_data.extend(helpers.uint32_to_bytes(self.packet_num))
-        packet_data.extend(self.data)
-        return bytes(packet_data)
+        return _XFER_PACKET_STRUCT.pack(self.xfer_id, self.packet_num) + (self.data or b'')
 
 
 # --- ConfirmXferPacket (Bidirectional) ---
 class ConfirmXferPacket(Packet):
     """Confirms receipt of a data chunk from SendXferPacket."""
+    __slots__ = ('xfer_id', 'packet_num')
+
     def __init__(self, xfer_id: int = 0, packet_num: int = 0, header: PacketHeader | None = None):
         super().__init__(PacketType.ConfirmXferPacket, header if header else PacketHeader())
         self.xfer_id: int = xfer_id # u64
@@ -99,21 +97,19 @@ class ConfirmXferPacket(Packet):
         # Reliability is set by AssetManager depending on context (client send = reliable)
 
     def to_bytes(self) -> bytes: # Client sends this for downloads
-        data = bytearray()
-        data.extend(helpers.uint64_to_bytes(self.xfer_id))
-        data.extend(helpers.uint32_to_bytes(self.packet_num))
-        return bytes(data)
+        return _XFER_PACKET_STRUCT.pack(self.xfer_id, self.packet_num)
 
     def from_bytes_body(self, buffer: bytes, offset: int, length: int) -> "ConfirmXferPacket": # Server sends this for uploads
         if length < 12: raise ValueError("ConfirmXferPacket body too short.")
-        self.xfer_id = helpers.bytes_to_uint64(buffer, offset); offset += 8
-        self.packet_num = helpers.bytes_to_uint32(buffer, offset); offset += 4
+        self.xfer_id, self.packet_num = _XFER_PACKET_STRUCT.unpack_from(buffer, offset)
         return self
 
 
 # --- TransferInfoPacket (Server -> Client) ---
 class TransferInfoPacket(Packet):
     """Server provides information about an upcoming transfer."""
+    __slots__ = ('transfer_id', 'channel_type', 'target_type', 'status_code', 'size', 'params')
+
     def __init__(self, header: PacketHeader | None = None):
         super().__init__(PacketType.TransferInfo, header if header else PacketHeader())
         self.transfer_id: CustomUUID = CustomUUID.ZERO # UUID, often same as VFileID from request
@@ -128,24 +124,18 @@ class TransferInfoPacket(Packet):
 
     def from_bytes_body(self, buffer: bytes, offset: int, length: int):
         if length < (16 + 4*4): raise ValueError("TransferInfoPacket body too short.") # Min for UUID + 4 ints
-        self.transfer_id = CustomUUID(buffer, offset); offset += 16
-        try: self.channel_type = ChannelType(helpers.bytes_to_int32(buffer, offset))
-        except ValueError: self.channel_type = ChannelType.Unknown; logger.warning(f"Unknown ChannelType {helpers.bytes_to_int32(buffer, offset)}")
-        offset += 4
-        try: self.target_type = TargetType(helpers.bytes_to_int32(buffer, offset))
-        except ValueError: self.target_type = TargetType.Unknown; logger.warning(f"Unknown TargetType {helpers.bytes_to_int32(buffer, offset)}")
-        offset += 4
-        try: self.status_code = StatusCode(helpers.bytes_to_int32(buffer, offset))
-        except ValueError: self.status_code = StatusCode.UNKNOWN; logger.warning(f"Unknown StatusCode {helpers.bytes_to_int32(buffer, offset)}")
-        offset += 4
-        self.size = helpers.bytes_to_int32(buffer, offset); offset += 4
+        transfer_id, channel_type, target_type, status_code, self.size = _TRANSFER_INFO_STRUCT.unpack_from(buffer, offset)
+        self.transfer_id = CustomUUID.from_buffer(transfer_id); offset += _TRANSFER_INFO_STRUCT.size
+        self.channel_type = ChannelType._value2member_map_.get(channel_type)
+        if self.channel_type is None: self.channel_type = ChannelType.Unknown; logger.warning("Unknown ChannelType %d", channel_type)
+        self.target_type = TargetType._value2member_map_.get(target_type)
+        if self.target_type is None: self.target_type = TargetType.Unknown; logger.warning("Unknown TargetType %d", target_type)
+        self.status_code = StatusCode._value2member_map_.get(status_code)
+        if self.status_code is None: self.status_code = StatusCode.UNKNOWN; logger.warning("Unknown StatusCode %d", status_code)
 
         # Params is variable, null-terminated, up to 255 useful bytes
-        param_len = 0
-        for i in range(offset, min(offset + 255, len(buffer))):
-            if buffer[i] == 0: break
-            param_len += 1
-        self.params = buffer[offset : offset + param_len]
+        stop = min(offset + 255, len(buffer)); nul = buffer.find(b'\0', offset, stop)
+        self.params = bytes(buffer[offset : nul if nul != -1 else stop])
         return self
     def to_bytes(self)->bytes:logger.warning("Client doesn't send TransferInfoPacket.");return b''
 
@@ -153,31 +143,33 @@ class TransferInfoPacket(Packet):
 # --- TransferPacket (Server -> Client, asset data itself) ---
 class TransferPacket(Packet): # This is the one that carries the bulk data in modern Xfer.
     """Contains a chunk of asset data for a transfer."""
+    __slots__ = ('transfer_id', 'channel_type', 'data')
+
     def __init__(self, header: PacketHeader | None = None):
         super().__init__(PacketType.TransferPacket, header if header else PacketHeader())
         self.transfer_id: CustomUUID = CustomUUID.ZERO # UUID identifying the transfer
         self.channel_type: ChannelType = ChannelType.Unknown # s32
-        self.data: bytes = b'' # The asset data chunk
+        self.data: bytes | memoryview = b'' # The asset data chunk (a view into the packet body)
 
     def from_bytes_body(self, buffer: bytes, offset: int, length: int):
-        if length < (16 + 4): raise ValueError("TransferPacket body too short.")
-        self.transfer_id = CustomUUID(buffer, offset); offset += 16
-        try: self.channel_type = ChannelType(helpers.bytes_to_int32(buffer, offset))
-        except ValueError: self.channel_type = ChannelType.Unknown; logger.warning(f"Unknown ChannelType {helpers.bytes_to_int32(buffer, offset)}")
-        offset += 4
-        self.data = buffer[offset : offset + (length - (16 + 4))]
+        if length < _TRANSFER_PACKET_STRUCT.size: raise ValueError("TransferPacket body too short.")
+        transfer_id, channel_type = _TRANSFER_PACKET_STRUCT.unpack_from(buffer, offset)
+        self.transfer_id = CustomUUID.from_buffer(transfer_id)
+        self.channel_type = ChannelType._value2member_map_.get(channel_type)
+        if self.channel_type is None: self.channel_type = ChannelType.Unknown; logger.warning("Unknown ChannelType %d", channel_type)
+        self.data = memoryview(buffer)[offset + _TRANSFER_PACKET_STRUCT.size : offset + length] # Zero-copy view of the body
         return self
     def to_bytes(self)->bytes:logger.warning("Client doesn't send TransferPacket this way.");return b''
 
 
 # --- Image/Texture Related UDP Packets ---
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RequestImageAgentDataBlock: # Common AgentData for RequestImage
     AgentID: CustomUUID
     SessionID: CustomUUID
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RequestImageBlock: # One per requested image
     Image: CustomUUID    # UUID of the image
     Type: int            # byte, from ImageType enum (Normal, Baked)
@@ -191,9 +183,10 @@ class RequestImagePacket(Packet): # Client -> Server
     """Client requests one or more images/textures via UDP."""
     def __init__(self, agent_id: CustomUUID, session_id: CustomUUID,
                  image_requests: list[dict], # list of dicts matching RequestImageBlock fields
-                 header: PacketHeader | None = None):
+                 header: PacketHeader | None = None, agent_session_bytes: bytes | None = None):
         super().__init__(PacketType.RequestImage, header if header else PacketHeader())
         self.agent_data = RequestImageAgentDataBlock(AgentID=agent_id, SessionID=session_id)
+        self.agent_session_bytes: bytes | None = agent_session_bytes # Pre-packed AgentID+SessionID (AgentManager.agent_session_bytes)
         self.request_image_blocks: list[RequestImageBlock] = []
         for req_dict in image_requests:
             self.request_image_blocks.append(RequestImageBlock(
@@ -207,55 +200,42 @@ class RequestImagePacket(Packet): # Client -> Server
         self.header.reliable = False # Typically not reliable, server resends ImageData if needed
 
     def to_bytes(self) -> bytes:
-        data = bytearray()
-        # AgentData
-        data.extend(self.agent_data.AgentID.get_bytes())
-        data.extend(self.agent_data.SessionID.get_bytes())
-
-        # RequestImage Blocks
-        num_requests = len(self.request_image_blocks)
-        if num_requests > 255: # Max 1 Request block in C# (count byte for "NumBlocks" is 1)
-                               # However, packet structure implies it can be an array.
-                               # The packet format implies NumBlocks is for the *entire packet content*, not per image.
-                               # C# RequestImagePacket is designed for ONE image request per packet.
-                               # For multiple, client sends multiple RequestImagePackets.
-            logger.warning(f"RequestImagePacket: Number of requests ({num_requests}) exceeds typical single request. Sending only the first.")
-            num_requests = 1
-
-        # The packet structure in C# has one RequestImageBlock directly, not an array.
-        # If sending multiple, client sends multiple packets.
-        # For now, this implementation will send only the first request if multiple are provided.
-        if num_requests > 0:
-            block = self.request_image_blocks[0]
-            data.extend(block.Image.get_bytes())
-            data.append(block.Type & 0xFF)
-            data.append(block.DiscardLevel & 0xFF)
-            data.extend(helpers.float_to_bytes(block.DownloadPriority))
-            data.extend(helpers.uint32_to_bytes(block.Packet))
-            data.extend(helpers.uint32_to_bytes(block.ExtraInfo))
-        else: # No requests, send empty packet (server will likely ignore)
-            pass # Or raise error if this is invalid
-
-        return bytes(data)
+        # RequestImage is a variable block: count byte followed by up to 255 blocks.
+        blocks = self.request_image_blocks
+        if len(blocks) > 255:
+            logger.warning("RequestImagePacket: Number of requests (%d) exceeds 255. Sending only the first 255.", len(blocks))
+            blocks = blocks[:255]
+        agent_session = self.agent_session_bytes or self.agent_data.AgentID.get_bytes() + self.agent_data.SessionID.get_bytes()
+        if len(blocks) == 1: # The common case (one texture per request): pack the whole body in one call
+            b = blocks[0]
+            return _REQUEST_IMAGE_SINGLE_STRUCT.pack(agent_session, 1, b.Image.get_bytes(), b.Type & 0xFF, b.DiscardLevel & 0xFF,
+                                                     b.DownloadPriority, b.Packet, b.ExtraInfo)
+        pack = _REQUEST_IMAGE_BLOCK_STRUCT.pack
+        return b''.join((agent_session, bytes((len(blocks),)),
+                         *[pack(b.Image.get_bytes(), b.Type & 0xFF, b.DiscardLevel & 0xFF,
+                                b.DownloadPriority, b.Packet, b.ExtraInfo) for b in blocks]))
 
     def from_bytes_body(self, buffer: bytes, offset: int, length: int):
         logger.warning("Client doesn't receive RequestImagePacket in this form.")
         return self
 
 
-@dataclasses.dataclass
-class ImageNotInDatabaseIDBlock: # For ImageNotInDatabasePacket
-    ID: CustomUUID
-
 class ImageNotInDatabasePacket(Packet): # Server -> Client
     """Server indicates that a requested image texture is not in its database."""
+    __slots__ = ('id',)
+
     def __init__(self, header: PacketHeader | None = None):
         super().__init__(PacketType.ImageNotInDatabase, header if header else PacketHeader())
-        self.image_id_block = ImageNotInDatabaseIDBlock(ID=CustomUUID.ZERO)
+        self.id: CustomUUID = CustomUUID.ZERO # UUID of the missing image
 
-    def from_bytes_body(self, buffer: bytes, offset: int, length: int):
+    @classmethod
+    def parse_id(cls, buffer: bytes, offset: int, length: int = 16) -> CustomUUID:
+        """Returns just the missing image's UUID from a body, without building a packet."""
         if length < 16: raise ValueError("ImageNotInDatabasePacket body too short.")
-        self.image_id_block.ID = CustomUUID(buffer, offset)
+        return CustomUUID.from_buffer(buffer, offset)
+
+    def from_bytes_body(self, buffer: bytes, offset: int, length: int):
+        self.id = self.parse_id(buffer, offset, length)
         return self
 
     def to_bytes(self) -> bytes:
@@ -263,32 +243,25 @@ class ImageNotInDatabasePacket(Packet): # Server -> Client
         return b''
 
 
-@dataclasses.dataclass
-class ImageDataImageIDBlock: # For ImageDataPacket
-    ID: CustomUUID
-    Size: int # uint32, total size of the image data
-    Codec: int # byte, e.g., 0 for J2K, 2 for Lossless, 3 for PNG
-
-@dataclasses.dataclass
-class ImageDataDataBlock: # For ImageDataPacket
-    Data: bytes # Variable length
-
 class ImageDataPacket(Packet): # Server -> Client
     """Server sends a chunk of image data."""
+    __slots__ = ('id', 'size', 'codec', 'data')
+
     def __init__(self, header: PacketHeader | None = None):
         super().__init__(PacketType.ImageData, header if header else PacketHeader())
-        self.image_id_block = ImageDataImageIDBlock(ID=CustomUUID.ZERO, Size=0, Codec=0)
-        self.image_data_block = ImageDataDataBlock(Data=b'')
+        self.id: CustomUUID = CustomUUID.ZERO # UUID of the image
+        self.size: int = 0 # uint32, total size of the image data
+        self.codec: int = 0 # byte, e.g., 0 for J2K, 2 for Lossless, 3 for PNG
+        self.data: bytes | memoryview = b'' # Variable length, a view into the packet body when received
 
     def from_bytes_body(self, buffer: bytes, offset: int, length: int):
         # ImageID Block (ID:16, Size:4, Codec:1 = 21 bytes)
-        if length < 21: raise ValueError("ImageDataPacket body too short for ImageIDBlock.")
-        self.image_id_block.ID = CustomUUID(buffer, offset); offset += 16
-        self.image_id_block.Size = helpers.bytes_to_uint32(buffer, offset); offset += 4
-        self.image_id_block.Codec = buffer[offset]; offset += 1
+        if length < _IMAGE_ID_STRUCT.size: raise ValueError("ImageDataPacket body too short for ImageIDBlock.")
+        image_id, self.size, self.codec = _IMAGE_ID_STRUCT.unpack_from(buffer, offset)
+        self.id = CustomUUID.from_buffer(image_id)
 
         # ImageData Block (remaining data)
-        self.image_data_block.Data = buffer[offset : offset + (length - 21)]
+        self.data = memoryview(buffer)[offset + _IMAGE_ID_STRUCT.size : offset + length] # Zero-copy view of the body
         return self
 
     def to_bytes(self) -> bytes:
@@ -298,7 +271,7 @@ class ImageDataPacket(Packet): # Server -> Client
 
 # --- Asset Upload Packets ---
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AssetUploadRequestAssetBlock: # For AssetUploadRequestPacket
     TransactionID: CustomUUID # New random UUID for this upload session
     Type: int             # sbyte, from AssetType enum
@@ -328,21 +301,12 @@ class AssetUploadRequestPacket(Packet): # Client -> Server
         self.header.reliable = True
 
     def to_bytes(self) -> bytes:
-        data_bytes = bytearray()
-        # AssetBlock
-        data_bytes.extend(self.asset_block.TransactionID.get_bytes())
-        data_bytes.append(self.asset_block.Type & 0xFF) # sbyte in C#, pack as byte
-        data_bytes.append(1 if self.asset_block.Tempfile else 0)
-        data_bytes.append(1 if self.asset_block.Public else 0)
-        data_bytes.append(1 if self.asset_block.StoreLocal else 0)
-        data_bytes.extend(helpers.int32_to_bytes(self.asset_block.Size)) # Add true asset size
-
         # Data is variable length, prefixed by its size (u32)
         # If self.asset_block.Data is b'', len is 0, correct for Xfer initiation.
         actual_data_to_send = self.asset_block.Data if self.asset_block.Data is not None else b''
-        data_bytes.extend(helpers.uint32_to_bytes(len(actual_data_to_send)))
-        data_bytes.extend(actual_data_to_send)
-        return bytes(data_bytes)
+        ab = self.asset_block # Type is sbyte in C#, pack as byte
+        return _ASSET_UPLOAD_REQUEST_STRUCT.pack(ab.TransactionID.get_bytes(), ab.Type & 0xFF, ab.Tempfile, ab.Public,
+                                                 ab.StoreLocal, ab.Size, len(actual_data_to_send)) + actual_data_to_send
 
     def from_bytes_body(self, buffer: bytes, offset: int, length: int):
         logger.warning("Client doesn't receive AssetUploadRequestPacket.")
@@ -350,7 +314,7 @@ class AssetUploadRequestPacket(Packet): # Client -> Server
 
 
 # AssetBlock in C# AssetUploadCompletePacket includes TransactionID
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AssetUploadCompleteAssetBlock: # For AssetUploadCompletePacket
     TransactionID: CustomUUID # UUID, should match the one from AssetUploadRequestPacket
     Success: bool       # bool, True if upload was successful
@@ -359,8 +323,7 @@ class AssetUploadCompleteAssetBlock: # For AssetUploadCompletePacket
 
     @property
     def type_enum(self) -> AssetType:
-        try: return AssetType(self.Type)
-        except ValueError: return AssetType.Unknown
+        return AssetType._value2member_map_.get(self.Type, AssetType.Unknown)
 
 class AssetUploadCompletePacket(Packet): # Server -> Client
     """Server confirms asset upload completion and provides the new asset's UUID."""
@@ -378,10 +341,10 @@ class AssetUploadCompletePacket(Packet): # Server -> Client
         if length < 34:
             raise ValueError(f"AssetUploadCompletePacket body too short ({length} bytes). Expected at least 34.")
 
-        self.asset_block.TransactionID = CustomUUID(buffer, offset); offset += 16
-        self.asset_block.Success = (buffer[offset] != 0); offset += 1
-        self.asset_block.AssetUUID = CustomUUID(buffer, offset); offset += 16
-        self.asset_block.Type = struct.unpack_from('<b', buffer, offset)[0]; offset += 1 # sbyte
+        transaction_id, self.asset_block.Success, asset_uuid, self.asset_block.Type = \
+            _ASSET_UPLOAD_COMPLETE_STRUCT.unpack_from(buffer, offset) # Type is sbyte
+        self.asset_block.TransactionID = CustomUUID.from_buffer(transaction_id)
+        self.asset_block.AssetUUID = CustomUUID.from_buffer(asset_uuid)
 
         return self
 
@@ -9,30 +9,44 @@ from pylibremetaverse import utils as plm_utils
 DEFAULT_MAX_PACKET_SIZE = 1200
 logger = logging.getLogger(__name__)
 
-class PacketType(enum.Enum):
+_HEADER_STRUCT = struct.Struct('>I') # Flags (u8) followed by the 24-bit big-endian sequence number
+# Packets shorter than this (header included) are sent unencoded even when ZEROCODED is requested:
+# the few bytes zero-coding could save do not pay for the encode pass.
+_ZEROCODE_MIN_SIZE = 64
+
+# PacketType values identify a packet class; packet_factory matches the wire number and frequency.
+# A member whose number is also used by a packet of another frequency, or by an inbound packet
+# when it is itself Client -> Server, carries a tag bit so that no member silently aliases another.
+_HIGH_FREQ = 0x10000 # High-frequency (single byte) message number
+_OUTBOUND = 0x20000  # Client -> Server packet sharing its number with an inbound packet
+
+@enum.unique
+class PacketType(enum.IntEnum): # IntEnum: hashing/comparison are plain int ops on the dispatch and logging paths
     TestPacket = 0; UseCircuitCode = 1; RegionHandshake = 4; RegionHandshakeReply = 5
     CompleteAgentMovement = 7; AgentMovementComplete = 8; LogoutRequest = 9; CloseCircuit = 10
-    EconomyDataRequest = 11; TeleportLocationRequest = 12; TeleportLandmarkRequest = 13
+    EconomyDataRequest = _OUTBOUND | 11; TeleportLocationRequest = 12; TeleportLandmarkRequest = 13
     TeleportFinish = 14; TeleportLocal = 15; UpdateMuteListEntry = 20; RemoveMuteListEntry = 21
     MuteListRequest = 22; MuteListUpdate = 23; TeleportStart = 25; TeleportProgress = 26
     TeleportFailed = 27; ChatFromViewer = 46; ChatFromSimulator = 44; StartLure = 53
     ImprovedInstantMessage = 54; AgentRequestSit = 55; AgentSit = 56; AvatarSitResponse = 57
     TeleportCancel = 58; AvatarAnimation = 59; AgentAnimation = 60; AgentDataUpdate = 74
-    ActivateGestures = 71; DeactivateGestures = 72; ScriptDialog = 76; ScriptDialogReply = 77
-    ScriptQuestion = 81; ScriptAnswerYes = 82
+    ActivateGestures = 71; DeactivateGestures = 72; ScriptDialog = 76; ScriptDialogReply = _OUTBOUND | 77
+    ScriptQuestion = 81; ScriptAnswerYes = 82; SetAlwaysRun = 88
 
     ObjectUpdateCached = 6; RequestMultipleObjects = 48; KillObject = 11 # Note: KillObject is Server->Client
     RequestObjectPropertiesFamily = 16; ObjectPropertiesFamily = 63; ObjectProperties = 90
     ObjectSelect = 17; ObjectDeselect = 18; ObjectLink = 29; ObjectDelink = 30
     ObjectMove = 31; ObjectScale = 32; ObjectRotation = 33
-    ObjectName = 34; ObjectDescription = 35; ObjectText = 36; ObjectClickAction = 37
-    ObjectAdd = 38
-    ObjectAdd = 38
-    ObjectGrab = 26                # Low Freq (0xFFFFFF1A) Client -> Server
-    ObjectDeGrab = 27              # Low Freq (0xFFFFFF1B) Client -> Server
+    ObjectName = _OUTBOUND | 34; ObjectDescription = _OUTBOUND | 35; ObjectText = _OUTBOUND | 36
+    ObjectClickAction = _OUTBOUND | 37; ObjectAdd = _OUTBOUND | 38
+    ObjectGrab = _OUTBOUND | 26    # Low Freq (0xFFFFFF1A) Client -> Server
+    ObjectDeGrab = _OUTBOUND | 27  # Low Freq (0xFFFFFF1B) Client -> Server
     AssetUploadRequest = 39
     AssetUploadComplete = 40
-    UpdateCreateInventoryItem = 41 # Client -> Server
+
+    # Transfer/Xfer Packets
+    TransferPacket = 34; TransferInfo = 35; RequestXfer = 36; SendXferPacket = 37; ConfirmXferPacket = 38
+    UpdateCreateInventoryItem = _OUTBOUND | 41 # Client -> Server
     UpdateInventoryItem = 41       # Server -> Client (Uses the same ID as request, but different direction/content)
 
     # Friends Packets (Client -> Server)
@@ -49,7 +63,7 @@ class PacketType(enum.Enum):
     # Parcel Packets
     ParcelPropertiesRequest = 92 # Low Freq (0xFFFFFF5C) - Client to Server
     ParcelProperties = 77        # Low Freq (0xFFFFFF4D) - Server to Client
-    ParcelAccessListRequest = 86 # Low Freq (0xFFFFFF56) - Client to Server
+    ParcelAccessListRequest = _OUTBOUND | 86 # Low Freq (0xFFFFFF56) - Client to Server
     ParcelAccessListReply = 87   # Low Freq (0xFFFFFF57) - Server to Client (matches C# ParcelAccessList)
     # ParcelDwellRequest = 88    # Low Freq (0xFFFFFF58)
     # ParcelDwell = 89           # Low Freq (0xFFFFFF59)
@@ -63,8 +77,8 @@ class PacketType(enum.Enum):
 
     # Image/Texture Packets (UDP)
     RequestImage = 19
-    ImageData = 26
-    ImageNotInDatabase = 27
+    ImageData = _HIGH_FREQ | 26
+    ImageNotInDatabase = 86 # Low Freq (0xFFFFFF56)
 
     # Appearance Packets
     AgentSetAppearance = 205      # Low Freq, 0xFFFFFECD
@@ -76,8 +90,8 @@ class PacketType(enum.Enum):
     PacketAck = 244
 
     # High Frequency
-    ObjectUpdate = 5
-    ImprovedTerseObjectUpdate = 7
+    ObjectUpdate = _HIGH_FREQ | 5
+    ImprovedTerseObjectUpdate = _HIGH_FREQ | 7
     AgentUpdate = 1001
     AgentThrottle = 1002
 
@@ -86,29 +100,33 @@ class PacketType(enum.Enum):
 @enum.unique
 class PacketFlags(enum.IntFlag):
     NONE=0;ZEROCODED=0x80;RELIABLE=0x40;RESENT=0x20;ACK=0x10
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class PacketHeader:
     sequence:int=0;flags:PacketFlags=PacketFlags.NONE;SIZE=4
     @classmethod
     def from_bytes(cls,b:bytes,o:int=0)->"PacketHeader":
-        if len(b)<o+cls.SIZE:raise ValueError("Buffer too small");f=b[o];s=(b[o+1]<<16)|(b[o+2]<<8)|b[o+3];return cls(s,PacketFlags(f))
-    def to_bytes(self)->bytes:h=bytearray(self.SIZE);h[0]=self.flags.value;h[1]=(self.sequence>>16)&0xFF;h[2]=(self.sequence>>8)&0xFF;h[3]=self.sequence&0xFF;return bytes(h)
+        if len(b)<o+cls.SIZE:raise ValueError("Buffer too small")
+        v,=_HEADER_STRUCT.unpack_from(b,o);return cls(v&0xFFFFFF,PacketFlags(v>>24))
+    def to_bytes(self)->bytes:return _HEADER_STRUCT.pack((self.flags.value<<24)|(self.sequence&0xFFFFFF))
     @property
     def reliable(self)->bool:return bool(self.flags&PacketFlags.RELIABLE)
     @reliable.setter
     def reliable(self,v:bool):self.flags=self.flags|PacketFlags.RELIABLE if v else self.flags&~PacketFlags.RELIABLE
 class Packet:
+    __slots__=('type','header') # Subclasses that are created per received packet declare their own slots too
     def __init__(self,t:PacketType,h:PacketHeader|None=None):self.type:PacketType=t;self.header:PacketHeader=h if h is not None else PacketHeader()
     def from_bytes_body(self,b:bytes,o:int,l:int):raise NotImplementedError(f"{self.__class__.__name__}")
     def to_bytes(self)->bytes:raise NotImplementedError(f"{self.__class__.__name__}")
-    def to_bytes_with_header(self,max_s:int=DEFAULT_MAX_PACKET_SIZE)->bytes:
-        hb=self.header.to_bytes();bb=self.to_bytes();ufp=hb+bb
+    def to_bytes_with_header(self,max_packet_size:int=DEFAULT_MAX_PACKET_SIZE)->bytes:
+        max_s=max_packet_size;bb=self.to_bytes()
+        if self.header.flags&PacketFlags.ZEROCODED and PacketHeader.SIZE+len(bb)<_ZEROCODE_MIN_SIZE:self.header.flags&=~PacketFlags.ZEROCODED # Too small to be worth encoding
+        hb=self.header.to_bytes();ufp=hb+bb
         if self.header.flags&PacketFlags.ZEROCODED:
             db=bytearray(max_s+100);el=plm_utils.zero_encode(ufp,db)
-            if el>0 and el<len(ufp):logger.debug(f"Zero-coded {self.type.name} from {len(ufp)} to {el}b.");fpd=bytes(db[:el])
-            else:self.header.flags&=~PacketFlags.ZEROCODED;logger.debug(f"Zero-coding {self.type.name} not beneficial. Sending unencoded.");fpd=ufp
+            if el>0 and el<len(ufp):logger.debug("Zero-coded %s from %d to %db.",self.type.name,len(ufp),el);fpd=bytes(db[:el])
+            else:self.header.flags&=~PacketFlags.ZEROCODED;logger.debug("Zero-coding %s not beneficial. Sending unencoded.",self.type.name);fpd=self.header.to_bytes()+bb # Header must not keep the ZEROCODED bit
         else:fpd=ufp
-        if len(fpd)>max_s:logger.error(f"Packet {self.type.name}(Seq:{self.header.sequence})exceeds MAX_PACKET_SIZE({len(fpd)}>{max_s})")
+        if len(fpd)>max_s:logger.error("Packet %s (Seq:%d) exceeds MAX_PACKET_SIZE (%d>%d)", self.type.name, self.header.sequence, len(fpd), max_s)
         return fpd
     def __str__(self):return f"{self.type.name}(Seq={self.header.sequence}, Flags={self.header.flags})"
     def __repr__(self):return f"<{self.__class__.__name__} type={self.type.name} seq={self.header.sequence} flags={self.header.flags!r}>"
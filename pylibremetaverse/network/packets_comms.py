@@ -5,13 +5,20 @@ import dataclasses # For nested blocks
 
 from pylibremetaverse.types import CustomUUID, Vector3
 from pylibremetaverse.types.enums import ChatType, ChatSourceType, ChatAudibleLevel, InstantMessageDialog, InstantMessageOnline # Added IM enums
-from pylibremetaverse.utils import helpers
 from .packets_base import Packet, PacketHeader, PacketType
 
 logger = logging.getLogger(__name__)
 
+_CHAT_FROM_SIM_STRUCT = struct.Struct('<16s16sBBb3f') # SourceID, OwnerID, SourceType, ChatType, AudibleLevel (signed), Position
+_IM_HEAD_STRUCT = struct.Struct('<BB16s') # FromGroup, Dialog, IMSessionID
+_IM_TAIL_STRUCT = struct.Struct('<BI3f16sI16s') # Offline, ParentEstateID, Position, RegionID, Timestamp, ToAgentID
+_BUCKET_LEN_STRUCT = struct.Struct('<H') # BinaryBucket length prefix
+_MAX_STRING_SCAN = 1024 # Null-terminated names/messages are at most 1023 bytes + null
+
 class ChatFromSimulatorPacket(Packet):
     """Packet received from the simulator containing a chat message."""
+    __slots__ = ('from_name', 'source_id', 'owner_id', 'source_type', 'chat_type', 'audible_level', 'position', 'message', 'from_group_id')
+
     def __init__(self, header: PacketHeader | None = None):
         super().__init__(PacketType.ChatFromSimulator, header if header else PacketHeader())
         self.from_name: bytes = b'' # Name of the sender (UTF-8 encoded)
@@ -37,25 +44,28 @@ class ChatFromSimulatorPacket(Packet):
         """Deserializes the packet body."""
         # Minimum length: FromName(1, null) + SourceID(16) + OwnerID(16) + SourceType(1) +
         # ChatType(1) + AudibleLevel(1) + Position(12) + Message(1, null) = ~50 bytes
+        body_end = offset + length # Offsets below are positions in buffer, length counts from the body start
         # FromName (variable, null-terminated string, max ~60 per some viewers)
-        name_end = buffer.find(b'\x00', offset)
+        name_end = buffer.find(b'\x00', offset, offset + _MAX_STRING_SCAN)
         if name_end == -1: raise ValueError("ChatFromSimulator: No null terminator for FromName.")
         self.from_name = buffer[offset:name_end]; offset = name_end + 1
 
-        self.source_id = CustomUUID(buffer, offset); offset += 16
-        self.owner_id = CustomUUID(buffer, offset); offset += 16
-
-        try:
-            self.source_type = ChatSourceType(buffer[offset]); offset += 1
-            self.chat_type = ChatType(buffer[offset]); offset += 1
-            # AudibleLevel is signed byte in C#, handle potential negative if Python enum doesn't
-            audible_val = struct.unpack_from('b', buffer, offset)[0]; offset += 1
-            self.audible_level = ChatAudibleLevel(audible_val)
-        except ValueError as e: # Invalid enum value
-            logger.warning(f"ChatFromSimulator: Invalid enum value during parsing: {e}. Using defaults.")
-            # Defaults are already set in __init__
-
-        self.position = Vector3(*struct.unpack_from('<fff', buffer, offset)); offset += 12
+        source_id, owner_id, source_type_val, chat_type_val, audible_val, px, py, pz = _CHAT_FROM_SIM_STRUCT.unpack_from(buffer, offset)
+        offset += _CHAT_FROM_SIM_STRUCT.size
+        self.source_id = CustomUUID.from_buffer(source_id)
+        self.owner_id = CustomUUID.from_buffer(owner_id)
+        self.position = Vector3(px, py, pz)
+
+        # Unknown enum values keep the defaults set in __init__
+        source_type = ChatSourceType._value2member_map_.get(source_type_val)
+        chat_type = ChatType._value2member_map_.get(chat_type_val)
+        audible_level = ChatAudibleLevel._value2member_map_.get(audible_val)
+        if source_type is not None: self.source_type = source_type
+        if chat_type is not None: self.chat_type = chat_type
+        if audible_level is not None: self.audible_level = audible_level
+        if source_type is None or chat_type is None or audible_level is None:
+            logger.warning("ChatFromSimulator: Invalid enum value during parsing (SourceType=%d, ChatType=%d, AudibleLevel=%d). Using defaults.",
+                           source_type_val, chat_type_val, audible_val)
 
         # Message (variable, two-byte length prefix in some versions, but often null-terminated or to end of packet)
         # C# ChatFromSimulatorPacket reads it as a null-terminated string up to 1023 bytes.
@@ -66,35 +76,22 @@ class ChatFromSimulatorPacket(Packet):
         # Find where message content actually ends. It might be null-terminated,
         # or followed by FromGroupID (16 bytes) if present.
         # A common pattern is that the message is null-terminated.
-        msg_end = -1
-        # Max message length can be ~1023. Search within remaining packet length.
-        # remaining_len = length - (offset - initial_offset_of_body)
-        search_msg_end_limit = offset + min(length - (offset - (self.header.SIZE if hasattr(self.header,'SIZE') else 4) ), 1024)
-
-        # Search for null terminator for the message
-        temp_msg_end = buffer.find(b'\x00', offset, search_msg_end_limit)
-
-        # Check if FromGroupID (16 bytes) might exist after message + null
-        # This is heuristic. A clearer packet spec or length field for message would be better.
-        potential_groupid_offset = (temp_msg_end + 1) if temp_msg_end != -1 else offset
-        if length - potential_groupid_offset >= 16: # Enough space for FromGroupID
-             # If message was not null terminated but there's space for GroupID, assume msg ends before it.
-             if temp_msg_end == -1 : temp_msg_end = potential_groupid_offset
-             # (This logic is tricky; if message has no null and GroupID follows, need to define boundary)
-             # For now, prioritize null termination. If no null, and GroupID fits, assume message ends there.
+        # Max message length can be ~1023. Search within the rest of the body.
+        remaining_len = body_end - offset
+        temp_msg_end = buffer.find(b'\x00', offset, offset + min(remaining_len, 1024))
 
         if temp_msg_end != -1:
             self.message = buffer[offset:temp_msg_end]
             offset = temp_msg_end + 1
-        else: # No null, take up to a limit or what's left before potential GroupID
+        else: # No null: if a FromGroupID (16 bytes) fits, assume it is the trailing 16 bytes
             # This part is very heuristic without explicit length field for message
-            limit = length - ( (offset - (self.header.SIZE if hasattr(self.header,'SIZE') else 4)) + 16) if (length - (offset - (self.header.SIZE if hasattr(self.header,'SIZE') else 4)) >= 16) else length - (offset-(self.header.SIZE if hasattr(self.header,'SIZE') else 4))
+            limit = remaining_len - 16 if remaining_len >= 16 else remaining_len
             self.message = buffer[offset : offset + limit]
             offset += limit
 
         # FromGroupID (optional, check if there's enough space left)
-        if offset + 16 <= length: # Check if buffer has enough bytes for FromGroupID
-            self.from_group_id = CustomUUID(buffer, offset); offset += 16
+        if offset + 16 <= body_end: # Check if the body has enough bytes for FromGroupID
+            self.from_group_id = CustomUUID.from_buffer(buffer, offset); offset += 16
         else:
             self.from_group_id = CustomUUID.ZERO # Not present or truncated
 
@@ -110,11 +107,11 @@ class ChatFromSimulatorPacket(Packet):
 
 
 # --- ImprovedInstantMessagePacket ---
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class IMContainerBlock: # Helper, not a direct packet block but groups some fields
     from_agent_id: CustomUUID = CustomUUID.ZERO
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class IMMessageBlock: # Corresponds to MessageBlock in C#
     from_group: bool = False # u8, actually a boolean
     dialog: InstantMessageDialog = InstantMessageDialog.MessageFromAgent # u8
@@ -123,7 +120,7 @@ class IMMessageBlock: # Corresponds to MessageBlock in C#
     message: bytes = b'' # Variable, null-terminated string up to 1024 (UTF-8)
     offline: InstantMessageOnline = InstantMessageOnline.Online # u8
     parent_estate_id: int = 0 # u32
-    position: Vector3 = Vector3.ZERO # Vector3
+    position: Vector3 = dataclasses.field(default_factory=Vector3)
     region_id: CustomUUID = CustomUUID.ZERO # UUID
     timestamp: int = 0 # u32 (seconds since epoch)
     to_agent_id: CustomUUID = CustomUUID.ZERO # UUID
@@ -139,6 +136,8 @@ class IMMessageBlock: # Corresponds to MessageBlock in C#
 
 class ImprovedInstantMessagePacket(Packet):
     """Handles sending and receiving Instant Messages."""
+    __slots__ = ('agent_data', 'message_block')
+
     def __init__(self, header: PacketHeader | None = None):
         super().__init__(PacketType.ImprovedInstantMessage, header if header else PacketHeader())
         # AgentData block (only FromAgentID for this packet type)
@@ -148,75 +147,64 @@ class ImprovedInstantMessagePacket(Packet):
 
     def to_bytes(self) -> bytes:
         """Serializes the packet body for sending an IM."""
-        data = bytearray()
-        # AgentData Block (only FromAgentID)
-        data.extend(self.agent_data.from_agent_id.get_bytes()) # 16 bytes
-
-        # MessageBlock
-        # FromAgentName (UTF-8, null-terminated)
-        from_name_bytes = self.message_block.from_agent_name.encode('utf-8')[:1023] # Max 1023 + null
-        data.extend(from_name_bytes); data.append(0)
-
-        data.append(1 if self.message_block.from_group else 0) # FromGroup (u8)
-        data.append(self.message_block.dialog.value & 0xFF) # Dialog (u8)
-        data.extend(self.message_block.im_session_id.get_bytes()) # IMSessionID (16)
-
-        # Message (UTF-8, null-terminated)
-        msg_bytes = self.message_block.message_str.encode('utf-8')[:1023]
-        data.extend(msg_bytes); data.append(0)
-
-        data.append(self.message_block.offline.value & 0xFF) # Offline (u8)
-        data.extend(helpers.uint32_to_bytes(self.message_block.parent_estate_id)) # ParentEstateID (u32)
-        data.extend(struct.pack('<fff', self.message_block.position.X, self.message_block.position.Y, self.message_block.position.Z)) # Position (12)
-        data.extend(self.message_block.region_id.get_bytes()) # RegionID (16)
-        data.extend(helpers.uint32_to_bytes(self.message_block.timestamp)) # Timestamp (u32)
-        data.extend(self.message_block.to_agent_id.get_bytes()) # ToAgentID (16)
-
-        # BinaryBucket (u16 length prefix + data)
-        bucket_len = len(self.message_block.binary_bucket)
-        if bucket_len > 10240: bucket_len = 10240 # Max length
-        data.extend(helpers.uint16_to_bytes(bucket_len)) # Length prefix
-        data.extend(self.message_block.binary_bucket[:bucket_len]) # Actual data
-
+        mb = self.message_block
+        # Name and message are stored UTF-8 encoded, so resends write them without re-encoding
+        from_name_bytes = mb.from_agent_name_bytes[:1023] # FromAgentName, max 1023 + null
+        msg_bytes = mb.message[:1023] # Message, max 1023 + null
+        bucket = mb.binary_bucket[:10240] # BinaryBucket, max 10240
+
+        # Sized up front so each field is written in place: FromAgentID(16), name + null,
+        # head, message + null, tail, BinaryBucket length (u16) + data.
+        name_len = len(from_name_bytes); msg_len = len(msg_bytes); bucket_len = len(bucket)
+        data = bytearray(16 + name_len + 1 + _IM_HEAD_STRUCT.size + msg_len + 1 + _IM_TAIL_STRUCT.size + 2 + bucket_len)
+        data[0:16] = self.agent_data.from_agent_id.get_bytes(); pos = 16 # AgentData Block (only FromAgentID)
+        data[pos:pos + name_len] = from_name_bytes; pos += name_len + 1 # Null already zero
+        _IM_HEAD_STRUCT.pack_into(data, pos, 1 if mb.from_group else 0, mb.dialog.value & 0xFF, mb.im_session_id.get_bytes())
+        pos += _IM_HEAD_STRUCT.size
+        data[pos:pos + msg_len] = msg_bytes; pos += msg_len + 1
+        _IM_TAIL_STRUCT.pack_into(data, pos, mb.offline.value & 0xFF, mb.parent_estate_id,
+                                  mb.position.X, mb.position.Y, mb.position.Z, mb.region_id.get_bytes(),
+                                  mb.timestamp, mb.to_agent_id.get_bytes())
+        pos += _IM_TAIL_STRUCT.size
+        _BUCKET_LEN_STRUCT.pack_into(data, pos, bucket_len); pos += 2
+        data[pos:] = bucket
         return bytes(data)
 
     def from_bytes_body(self, buffer: bytes, offset: int, length: int):
         """Deserializes the packet body for a received IM."""
         initial_offset = offset
         # AgentData Block
-        self.agent_data.from_agent_id = CustomUUID(buffer, offset); offset += 16
+        self.agent_data.from_agent_id = CustomUUID.from_buffer(buffer, offset); offset += 16
 
         # MessageBlock
         # FromAgentName
-        name_end = buffer.find(b'\x00', offset)
+        name_end = buffer.find(b'\x00', offset, offset + _MAX_STRING_SCAN)
         if name_end == -1: raise ValueError("IM: No null for FromAgentName")
         self.message_block.from_agent_name_bytes = buffer[offset:name_end]; offset = name_end + 1
 
-        self.message_block.from_group = (buffer[offset] != 0); offset += 1
-        try:
-            self.message_block.dialog = InstantMessageDialog(buffer[offset]); offset += 1
-        except ValueError: self.message_block.dialog = InstantMessageDialog.MessageFromAgent; offset +=1; logger.warning("Invalid IMDialog")
-
-        self.message_block.im_session_id = CustomUUID(buffer, offset); offset += 16
+        from_group, dialog_val, im_session_id = _IM_HEAD_STRUCT.unpack_from(buffer, offset); offset += _IM_HEAD_STRUCT.size
+        self.message_block.from_group = from_group != 0
+        self.message_block.dialog = InstantMessageDialog._value2member_map_.get(dialog_val)
+        if self.message_block.dialog is None: self.message_block.dialog = InstantMessageDialog.MessageFromAgent; logger.warning("Invalid IMDialog")
+        self.message_block.im_session_id = CustomUUID.from_buffer(im_session_id)
 
         # Message
-        msg_end = buffer.find(b'\x00', offset)
+        msg_end = buffer.find(b'\x00', offset, offset + _MAX_STRING_SCAN)
         if msg_end == -1: raise ValueError("IM: No null for Message")
         self.message_block.message = buffer[offset:msg_end]; offset = msg_end + 1
 
-        try:
-            self.message_block.offline = InstantMessageOnline(buffer[offset]); offset += 1
-        except ValueError: self.message_block.offline = InstantMessageOnline.Unknown; offset +=1; logger.warning("Invalid IMOnline")
-
-        self.message_block.parent_estate_id = helpers.bytes_to_uint32(buffer, offset); offset += 4
-        self.message_block.position = Vector3(*struct.unpack_from('<fff', buffer, offset)); offset += 12
-        self.message_block.region_id = CustomUUID(buffer, offset); offset += 16
-        self.message_block.timestamp = helpers.bytes_to_uint32(buffer, offset); offset += 4
-        self.message_block.to_agent_id = CustomUUID(buffer, offset); offset += 16
+        (offline_val, self.message_block.parent_estate_id, px, py, pz, region_id,
+         self.message_block.timestamp, to_agent_id) = _IM_TAIL_STRUCT.unpack_from(buffer, offset)
+        offset += _IM_TAIL_STRUCT.size
+        self.message_block.offline = InstantMessageOnline._value2member_map_.get(offline_val)
+        if self.message_block.offline is None: self.message_block.offline = InstantMessageOnline.Unknown; logger.warning("Invalid IMOnline")
+        self.message_block.position = Vector3(px, py, pz)
+        self.message_block.region_id = CustomUUID.from_buffer(region_id)
+        self.message_block.to_agent_id = CustomUUID.from_buffer(to_agent_id)
 
         # BinaryBucket
         if offset + 2 <= initial_offset + length:
-            bucket_len = helpers.bytes_to_uint16(buffer, offset); offset += 2
+            bucket_len = _BUCKET_LEN_STRUCT.unpack_from(buffer, offset)[0]; offset += 2
             if offset + bucket_len <= initial_offset + length:
                 self.message_block.binary_bucket = buffer[offset : offset + bucket_len]
                 offset += bucket_len
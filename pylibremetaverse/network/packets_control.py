@@ -3,11 +3,20 @@ import struct
 
 from .packets_base import Packet, PacketHeader, PacketType, PacketFlags
 from pylibremetaverse.types import CustomUUID
-from pylibremetaverse.utils import helpers
 
 logger = logging.getLogger(__name__)
 
+_USE_CIRCUIT_CODE_STRUCT = struct.Struct('<I16s16s') # CircuitCode, SessionID, AgentID
+_AGENT_DATA_STRUCT = struct.Struct('<16s16s') # AgentID, SessionID
+_AGENT_DATA_U32_STRUCT = struct.Struct('<16s16sI') # AgentID, SessionID, Flags (RegionHandshakeReply) / CircuitCode (CompleteAgentMovement)
+_REGION_HANDSHAKE_HEAD_STRUCT = struct.Struct('<IB') # RegionFlags, SimAccess
+# RegionHandshake after SimName: SimOwner, TerrainBase[4], TerrainDetail[4], WaterHeight, BillableFactor,
+# CacheID, TerrainStartX, TerrainStartY, RegionID
+_REGION_HANDSHAKE_TAIL_STRUCT = struct.Struct('<16s4f4fff16sff16s')
+
 class UseCircuitCodePacket(Packet):
+    __slots__ = ('circuit_code', 'session_id', 'agent_id')
+
     def __init__(self, circuit_code: int, session_id: CustomUUID, agent_id: CustomUUID, header: PacketHeader | None = None):
         super().__init__(PacketType.UseCircuitCode, header if header else PacketHeader())
         self.circuit_code: int = circuit_code
@@ -16,18 +25,13 @@ class UseCircuitCodePacket(Packet):
         self.header.reliable = True
 
     def to_bytes(self) -> bytes:
-        data = bytearray()
-        data.extend(helpers.uint32_to_bytes(self.circuit_code))
-        data.extend(self.session_id.get_bytes())
-        data.extend(self.agent_id.get_bytes())
-        return bytes(data)
+        return _USE_CIRCUIT_CODE_STRUCT.pack(self.circuit_code, self.session_id.get_bytes(), self.agent_id.get_bytes())
 
     def from_bytes_body(self, buffer: bytes, offset: int, length: int):
         if length < (4 + 16 + 16):
             raise ValueError(f"UseCircuitCodePacket body too short. Expected {4+16+16}, got {length}")
-        self.circuit_code = helpers.bytes_to_uint32(buffer, offset); offset += 4
-        self.session_id = CustomUUID(buffer, offset); offset += 16
-        self.agent_id = CustomUUID(buffer, offset)
+        self.circuit_code, session_id, agent_id = _USE_CIRCUIT_CODE_STRUCT.unpack_from(buffer, offset)
+        self.session_id = CustomUUID.from_buffer(session_id); self.agent_id = CustomUUID.from_buffer(agent_id)
         return self
 
     def __repr__(self):
@@ -35,6 +39,9 @@ class UseCircuitCodePacket(Packet):
                 f"AgentID={self.agent_id} Seq={self.header.sequence}>")
 
 class RegionHandshakePacket(Packet):
+    __slots__ = ('region_flags', 'sim_access', 'sim_name', 'sim_name_str', 'sim_owner', 'terrain_base', 'terrain_detail',
+                 'water_height', 'billable_factor', 'cache_id', 'terrain_start_x', 'terrain_start_y', 'region_id')
+
     def __init__(self, header: PacketHeader | None = None):
         super().__init__(PacketType.RegionHandshake, header if header else PacketHeader())
         self.region_flags: int = 0
@@ -59,17 +66,15 @@ class RegionHandshakePacket(Packet):
         initial_offset = offset
         # Simplified min length check, actual parsing is more robust.
         if length < 86:
-             logger.warning(f"RegionHandshakePacket body might be too short. Length: {length}")
+             logger.warning("RegionHandshakePacket body might be too short. Length: %d", length)
              # Fall through and try to parse, errors will be caught by struct or index issues.
 
         try:
-            self.region_flags = helpers.bytes_to_uint32(buffer, offset); offset += 4
-            self.sim_access = buffer[offset]; offset += 1
+            self.region_flags, self.sim_access = _REGION_HANDSHAKE_HEAD_STRUCT.unpack_from(buffer, offset)
+            offset += _REGION_HANDSHAKE_HEAD_STRUCT.size
 
-            sim_name_end = -1
             search_limit = min(initial_offset + length, offset + 255)
-            for i in range(offset, search_limit):
-                if buffer[i] == 0: sim_name_end = i; break
+            sim_name_end = buffer.find(b'\x00', offset, search_limit)
 
             if sim_name_end != -1:
                 self.sim_name = buffer[offset:sim_name_end]
@@ -79,20 +84,18 @@ class RegionHandshakePacket(Packet):
                 self.sim_name = buffer[offset : offset + safe_len]
                 offset += safe_len
                 if offset < search_limit and (safe_len > 0 and buffer[offset-1] != 0):
-                     logger.warning(f"Sim name might be truncated in RegionHandshake.")
+                     logger.warning("Sim name might be truncated in RegionHandshake.")
             self.sim_name_str = self.sim_name.decode('utf-8', errors='replace')
 
-            self.sim_owner = CustomUUID(buffer, offset); offset += 16
-            self.terrain_base = [helpers.bytes_to_float(buffer, offset + i*4) for i in range(4)]; offset += 16
-            self.terrain_detail = [helpers.bytes_to_float(buffer, offset + i*4) for i in range(4)]; offset += 16
-            self.water_height = helpers.bytes_to_float(buffer, offset); offset += 4
-            self.billable_factor = helpers.bytes_to_float(buffer, offset); offset += 4
-            self.cache_id = CustomUUID(buffer, offset); offset += 16
-            self.terrain_start_x = helpers.bytes_to_float(buffer, offset); offset += 4
-            self.terrain_start_y = helpers.bytes_to_float(buffer, offset); offset += 4
-            self.region_id = CustomUUID(buffer, offset); offset += 16
-
-            logger.info(f"Parsed RegionHandshake: Name='{self.sim_name_str}', RegionID={self.region_id}")
+            v = _REGION_HANDSHAKE_TAIL_STRUCT.unpack_from(buffer, offset); offset += _REGION_HANDSHAKE_TAIL_STRUCT.size
+            self.sim_owner = CustomUUID.from_buffer(v[0])
+            self.terrain_base = list(v[1:5]); self.terrain_detail = list(v[5:9])
+            self.water_height, self.billable_factor = v[9], v[10]
+            self.cache_id = CustomUUID.from_buffer(v[11])
+            self.terrain_start_x, self.terrain_start_y = v[12], v[13]
+            self.region_id = CustomUUID.from_buffer(v[14])
+
+            logger.info("Parsed RegionHandshake: Name='%s', RegionID=%s", self.sim_name_str, self.region_id)
         except struct.error as e:
             raise ValueError(f"RegionHandshake struct error: {e}") from e
         except IndexError as e:
@@ -100,6 +103,7 @@ class RegionHandshakePacket(Packet):
         return self
 
 class RegionHandshakeReplyPacket(Packet):
+    __slots__ = ('agent_id', 'session_id', 'flags')
     def __init__(self, agent_id: CustomUUID, session_id: CustomUUID, flags: int = 0, header: PacketHeader | None = None):
         super().__init__(PacketType.RegionHandshakeReply, header if header else PacketHeader())
         self.agent_id = agent_id
@@ -107,33 +111,29 @@ class RegionHandshakeReplyPacket(Packet):
         self.flags = flags
         self.header.reliable = True
     def to_bytes(self) -> bytes:
-        data = bytearray(); data.extend(self.agent_id.get_bytes())
-        data.extend(self.session_id.get_bytes()); data.extend(helpers.uint32_to_bytes(self.flags))
-        return bytes(data)
+        return _AGENT_DATA_U32_STRUCT.pack(self.agent_id.get_bytes(), self.session_id.get_bytes(), self.flags)
     def from_bytes_body(self, buffer: bytes, offset: int, length: int):
         if length < (16+16+4): raise ValueError("Body too short.")
-        self.agent_id = CustomUUID(buffer, offset); offset += 16
-        self.session_id = CustomUUID(buffer, offset); offset += 16
-        self.flags = helpers.bytes_to_uint32(buffer, offset)
+        agent_id, session_id, self.flags = _AGENT_DATA_U32_STRUCT.unpack_from(buffer, offset)
+        self.agent_id = CustomUUID.from_buffer(agent_id); self.session_id = CustomUUID.from_buffer(session_id)
         return self
 
 class CompleteAgentMovementPacket(Packet):
+    __slots__ = ('agent_id', 'session_id', 'circuit_code')
     def __init__(self, agent_id: CustomUUID, session_id: CustomUUID, circuit_code: int, header: PacketHeader | None = None):
         super().__init__(PacketType.CompleteAgentMovement, header if header else PacketHeader())
         self.agent_id = agent_id; self.session_id = session_id; self.circuit_code = circuit_code
         self.header.reliable = True
     def to_bytes(self) -> bytes:
-        data = bytearray(); data.extend(self.agent_id.get_bytes())
-        data.extend(self.session_id.get_bytes()); data.extend(helpers.uint32_to_bytes(self.circuit_code))
-        return bytes(data)
+        return _AGENT_DATA_U32_STRUCT.pack(self.agent_id.get_bytes(), self.session_id.get_bytes(), self.circuit_code)
     def from_bytes_body(self, buffer: bytes, offset: int, length: int):
         if length < (16+16+4): raise ValueError("Body too short.")
-        self.agent_id = CustomUUID(buffer, offset); offset += 16
-        self.session_id = CustomUUID(buffer, offset); offset += 16
-        self.circuit_code = helpers.bytes_to_uint32(buffer, offset)
+        agent_id, session_id, self.circuit_code = _AGENT_DATA_U32_STRUCT.unpack_from(buffer, offset)
+        self.agent_id = CustomUUID.from_buffer(agent_id); self.session_id = CustomUUID.from_buffer(session_id)
         return self
 
 class AgentThrottlePacket(Packet):
+    __slots__ = ('throttle_values',)
     THROTTLE_BUFFER_SIZE = 28
     def __init__(self, throttle_values: bytes | None = None, header: PacketHeader | None = None):
         super().__init__(PacketType.AgentThrottle, header if header else PacketHeader())
@@ -153,17 +153,17 @@ class EconomyDataRequestPacket(Packet):
     def from_bytes_body(self, buffer: bytes, offset: int, length: int): return self
 
 class LogoutRequestPacket(Packet):
+    __slots__ = ('agent_id', 'session_id')
     def __init__(self, agent_id: CustomUUID, session_id: CustomUUID, header: PacketHeader | None = None):
         super().__init__(PacketType.LogoutRequest, header if header else PacketHeader())
         self.agent_id = agent_id; self.session_id = session_id
         self.header.reliable = True
     def to_bytes(self) -> bytes:
-        data = bytearray(); data.extend(self.agent_id.get_bytes()); data.extend(self.session_id.get_bytes())
-        return bytes(data)
+        return _AGENT_DATA_STRUCT.pack(self.agent_id.get_bytes(), self.session_id.get_bytes())
     def from_bytes_body(self, buffer: bytes, offset: int, length: int):
         if length < (16+16): raise ValueError("Body too short.")
-        self.agent_id = CustomUUID(buffer, offset); offset += 16
-        self.session_id = CustomUUID(buffer, offset)
+        agent_id, session_id = _AGENT_DATA_STRUCT.unpack_from(buffer, offset)
+        self.agent_id = CustomUUID.from_buffer(agent_id); self.session_id = CustomUUID.from_buffer(session_id)
         return self
 
 class CloseCircuitPacket(Packet):
@@ -174,6 +174,8 @@ class CloseCircuitPacket(Packet):
 
 class AckPacket(Packet):
     """Packet containing one or more ACKs (PacketAck / MSG_RELIABLE type)."""
+    __slots__ = ('sequences',)
+
     def __init__(self, sequences: list[int] | None = None, header: PacketHeader | None = None):
         super().__init__(PacketType.PacketAck, header if header else PacketHeader())
         self.sequences: list[int] = sequences if sequences is not None else []
@@ -183,23 +185,19 @@ class AckPacket(Packet):
         if not self.sequences: return b'\x00' # Count byte must exist
         count = len(self.sequences)
         if count > 255:
-            logger.warning(f"AckPacket: Too many sequences ({count}), trimming to 255.")
+            logger.warning("AckPacket: Too many sequences (%d), trimming to 255.", count)
             self.sequences = self.sequences[:255]; count = 255
-        data = bytearray(); data.append(count)
-        for seq in self.sequences: data.extend(helpers.uint32_to_bytes(seq))
-        return bytes(data)
+        return struct.pack(f'<B{count}I', count, *self.sequences) # Count byte + u32 sequence numbers
 
     def from_bytes_body(self, buffer: bytes, offset: int, length: int):
         if length == 0: self.sequences = []; return self # Should have at least count byte
         count = buffer[offset]; offset += 1
-        self.sequences = []
         expected_len = 1 + count * 4
         if length < expected_len:
-            logger.error(f"AckPacket body too short. Expected {expected_len}, got {length}. Count: {count}")
+            logger.error("AckPacket body too short. Expected %d, got %d. Count: %d", expected_len, length, count)
             count = (length -1) // 4 # Max possible full ACKs
-        for _ in range(count):
-            if offset + 4 > length: break
-            self.sequences.append(helpers.bytes_to_uint32(buffer, offset)); offset += 4
+        # One C-level unpack for all sequence numbers, as in PacketProtocol's inline PacketAck path
+        self.sequences = list(struct.unpack_from(f'<{count}I', buffer, offset))
         return self
     def __repr__(self):
         return f"<AckPacket Count={len(self.sequences)} Seqs={self.sequences[:5]}... Seq={self.header.sequence}>"
@@ -142,31 +142,31 @@ class OnlineNotificationPacket(Packet):
         initial_offset = offset
 
         # AgentData (Our own ID/Session)
-        self.agent_data.AgentID = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
-        self.agent_data.SessionID = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
+        self.agent_data.AgentID = CustomUUID.from_buffer(buffer, offset); offset += 16
+        self.agent_data.SessionID = CustomUUID.from_buffer(buffer, offset); offset += 16
 
         # AgentBlock array (friends who came online)
         num_agent_blocks = buffer[offset]; offset += 1
         for _ in range(num_agent_blocks):
-            agent_id = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
+            agent_id = CustomUUID.from_buffer(buffer, offset); offset += 16
             self.agent_block_array.append(OnlineNotificationAgentBlock(AgentID=agent_id))
 
         # BuddyRightsOnline array (Rights they grant us)
         num_buddy_online_blocks = buffer[offset]; offset += 1
         for _ in range(num_buddy_online_blocks):
-            agent_id = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
+            agent_id = CustomUUID.from_buffer(buffer, offset); offset += 16
             rights = helpers.bytes_to_int32(buffer, offset); offset += 4 # Rights are int32
             self.buddy_rights_online_array.append(BuddyRightsBlock(AgentID=agent_id, Rights=rights))
 
         # BuddyRightsFriend array (Rights we grant them)
         num_buddy_friend_blocks = buffer[offset]; offset += 1
         for _ in range(num_buddy_friend_blocks):
-            agent_id = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
+            agent_id = CustomUUID.from_buffer(buffer, offset); offset += 16
             rights = helpers.bytes_to_int32(buffer, offset); offset += 4 # Rights are int32
             self.buddy_rights_friend_array.append(BuddyRightsBlock(AgentID=agent_id, Rights=rights))
 
         if offset - initial_offset != length:
-            logger.warning(f"OnlineNotificationPacket: Expected to read {length} bytes, but read {offset - initial_offset}")
+            logger.warning("OnlineNotificationPacket: Expected to read %d bytes, but read %d", length, offset - initial_offset)
         return self
 
     def to_bytes(self) -> bytes: # Server -> Client, client does not send this
@@ -187,16 +187,16 @@ class OfflineNotificationPacket(Packet):
 
     def from_bytes_body(self, buffer: bytes, offset: int, length: int) -> "OfflineNotificationPacket":
         initial_offset = offset
-        self.agent_data.AgentID = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
-        self.agent_data.SessionID = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
+        self.agent_data.AgentID = CustomUUID.from_buffer(buffer, offset); offset += 16
+        self.agent_data.SessionID = CustomUUID.from_buffer(buffer, offset); offset += 16
 
         num_blocks = buffer[offset]; offset += 1
         for _ in range(num_blocks):
-            agent_id = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
+            agent_id = CustomUUID.from_buffer(buffer, offset); offset += 16
             self.agent_block_array.append(OfflineNotificationAgentBlock(AgentID=agent_id))
 
         if offset - initial_offset != length:
-            logger.warning(f"OfflineNotificationPacket: Expected to read {length} bytes, but read {offset - initial_offset}")
+            logger.warning("OfflineNotificationPacket: Expected to read %d bytes, but read %d", length, offset - initial_offset)
         return self
 
     def to_bytes(self) -> bytes: # Server -> Client, client does not send this
@@ -261,12 +261,12 @@ class AgentOnlineStatusPacket(Packet):
 
     def from_bytes_body(self, buffer: bytes, offset: int, length: int) -> "AgentOnlineStatusPacket":
         initial_offset = offset
-        self.agent_data.AgentID = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
-        self.agent_data.SessionID = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
+        self.agent_data.AgentID = CustomUUID.from_buffer(buffer, offset); offset += 16
+        self.agent_data.SessionID = CustomUUID.from_buffer(buffer, offset); offset += 16
 
         num_blocks = buffer[offset]; offset += 1
         for _ in range(num_blocks):
-            agent_id = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
+            agent_id = CustomUUID.from_buffer(buffer, offset); offset += 16
             online_status = buffer[offset] != 0; offset += 1
             timestamp = helpers.bytes_to_uint32(buffer, offset); offset += 4 # Assuming little-endian from SL
             self.agent_block_array.append(AgentOnlineStatusDataBlock(
@@ -274,7 +274,7 @@ class AgentOnlineStatusPacket(Packet):
             ))
 
         if offset - initial_offset != length:
-            logger.warning(f"AgentOnlineStatusPacket: Expected to read {length} bytes, but read {offset - initial_offset}")
+            logger.warning("AgentOnlineStatusPacket: Expected to read %d bytes, but read %d", length, offset - initial_offset)
         return self
 
     def to_bytes(self) -> bytes: # Server -> Client, client does not send this
@@ -2,15 +2,15 @@
 """
 Group-related network packets.
 """
+import logging
 import struct
 import dataclasses
 from typing import List, Tuple
 
 from pylibremetaverse.types import CustomUUID
-from pylibremetaverse.types.enums import PacketType
 from pylibremetaverse.types.group_defs import GroupPowers # Assuming GroupPowers is in group_defs
 from pylibremetaverse.utils import helpers
-from .packets_base import Packet, PacketHeader # Assuming Packet, PacketHeader are in packets_base
+from .packets_base import Packet, PacketHeader, PacketType
 
 logger = logging.getLogger(__name__) # Assuming standard logging setup
 
@@ -49,14 +49,11 @@ class AgentGroupDataUpdatePacket(Packet):
     Sent by the server to provide the client with a list of groups
     the agent is a member of, along with some summary information for each.
     """
-    # PACKET_ID = PacketType.AgentGroupDataUpdate # To be assigned in packets_base.py
     # FREQUENCY = PacketFrequency.Low # Typically low
     # FLAGS = PacketFlags.Reliable # Usually reliable
 
     def __init__(self, header: PacketHeader | None = None):
-        # The actual PacketType ID will be set once defined in packets_base.py
-        # For now, using a placeholder. Ensure this is updated.
-        super().__init__(PacketType.Unhandled, header if header else PacketHeader()) # Placeholder ID
+        super().__init__(PacketType.AgentGroupDataUpdate, header if header else PacketHeader())
         self.agent_data_block = AgentGroupDataUpdateAgentDataBlock(AgentID=CustomUUID.ZERO)
         self.group_data_blocks: List[AgentGroupDataUpdateGroupDataBlock] = []
 
@@ -64,7 +61,7 @@ class AgentGroupDataUpdatePacket(Packet):
         initial_offset = offset
 
         # AgentDataBlock
-        self.agent_data_block.AgentID = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
+        self.agent_data_block.AgentID = CustomUUID.from_buffer(buffer, offset); offset += 16
 
         # GroupDataBlocks (Array)
         # The number of GroupData blocks is typically prefixed by a count byte or derived from remaining length.
@@ -85,28 +82,28 @@ class AgentGroupDataUpdatePacket(Packet):
             # Min size: UUID (16) + UUID (16) + Name (1, null term) + Powers (8) + Title (1, null term) + Accept (1) + ListInProfile (1) = ~44 bytes
             # This is a rough estimate, actual parsing will advance offset.
             if offset + 44 > initial_offset + length: # Rough check
-                 logger.warning(f"AgentGroupDataUpdatePacket: Potential buffer overrun parsing group block {_ + 1}/{group_data_count}. Offset: {offset}")
+                 logger.warning("AgentGroupDataUpdatePacket: Potential buffer overrun parsing group block %d/%d. Offset: %d", _ + 1, group_data_count, offset)
                  break
 
-            group_id = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
-            insignia_id = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
+            group_id = CustomUUID.from_buffer(buffer, offset); offset += 16
+            insignia_id = CustomUUID.from_buffer(buffer, offset); offset += 16
 
-            name_bytes, new_offset = helpers.read_null_terminated_bytes(buffer, offset)
-            if new_offset == offset: # Should not happen if string is properly terminated
-                logger.warning("AgentGroupDataUpdatePacket: Empty or unterminated GroupName.")
+            name_bytes, bytes_read = helpers.read_null_terminated_bytes(buffer, offset)
+            if bytes_read < 0: # Should not happen if string is properly terminated
+                logger.warning("AgentGroupDataUpdatePacket: Unterminated GroupName.")
                 # Decide how to handle: skip block, use empty name, or stop parsing.
                 # For now, assume it might mean end of useful data or malformed packet.
                 break
-            offset = new_offset
+            offset += bytes_read
 
             if offset + 8 > initial_offset + length: break # For GroupPowers_val (uint64)
             group_powers_val = helpers.bytes_to_uint64(buffer, offset); offset += 8
 
-            title_bytes, new_offset = helpers.read_null_terminated_bytes(buffer, offset)
-            if new_offset == offset and title_bytes: # Allow empty title, but not if read failed
+            title_bytes, bytes_read = helpers.read_null_terminated_bytes(buffer, offset)
+            if bytes_read < 0: # Empty titles are fine, a missing terminator is not
                  logger.warning("AgentGroupDataUpdatePacket: Unterminated MemberTitle.")
                  break
-            offset = new_offset
+            offset += bytes_read
 
             if offset + 2 > initial_offset + length: break # For AcceptNotices & ListInProfile
             accept_notices = buffer[offset] != 0; offset += 1
@@ -125,7 +122,7 @@ class AgentGroupDataUpdatePacket(Packet):
             )
 
         if offset - initial_offset != length:
-            logger.warning(f"AgentGroupDataUpdatePacket: Parsed {offset - initial_offset} bytes, but expected body length was {length}.")
+            logger.warning("AgentGroupDataUpdatePacket: Parsed %d bytes, but expected body length was %d.", offset - initial_offset, length)
             # This could indicate a parsing error or an unexpected packet structure.
 
         return self
@@ -176,7 +173,6 @@ class AgentSetGroupPacket(Packet):
     Sent by the client to set its active group tag.
     Corresponds to PacketType.AgentSetGroup (109 / 0xFFFFFF6D)
     """
-    # PACKET_ID = PacketType.AgentSetGroup # To be assigned
     # FREQUENCY = PacketFrequency.Low
     # FLAGS = PacketFlags.Reliable
 
@@ -187,9 +183,7 @@ class AgentSetGroupPacket(Packet):
 
     def __init__(self, agent_id: CustomUUID, session_id: CustomUUID, group_id: CustomUUID,
                  header: PacketHeader | None = None):
-        # The actual PacketType ID will be set once defined in packets_base.py
-        # For now, using a placeholder. Ensure this is updated.
-        super().__init__(PacketType.Unhandled, header if header else PacketHeader()) # Placeholder ID
+        super().__init__(PacketType.AgentSetGroup, header if header else PacketHeader())
         self.agent_id = agent_id
         self.session_id = session_id
         self.group_id = group_id
@@ -209,8 +203,8 @@ class AgentSetGroupPacket(Packet):
         if length < 48: # 3 UUIDs
             raise ValueError("Buffer too small for AgentSetGroupPacket body.")
 
-        agent_id = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
-        session_id = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
-        group_id = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
+        agent_id = CustomUUID.from_buffer(buffer, offset); offset += 16
+        session_id = CustomUUID.from_buffer(buffer, offset); offset += 16
+        group_id = CustomUUID.from_buffer(buffer, offset); offset += 16
 
         return cls(agent_id=agent_id, session_id=session_id, group_id=group_id)
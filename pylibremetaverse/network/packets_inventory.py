@@ -172,19 +172,19 @@ class UpdateInventoryItemPacket(Packet): # Server -> Client
         initial_offset = offset
 
         # AgentDataBlock
-        self.agent_data.AgentID = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
-        self.agent_data.SessionID = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
-        self.agent_data.TransactionID = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
+        self.agent_data.AgentID = CustomUUID.from_buffer(buffer, offset); offset += 16
+        self.agent_data.SessionID = CustomUUID.from_buffer(buffer, offset); offset += 16
+        self.agent_data.TransactionID = CustomUUID.from_buffer(buffer, offset); offset += 16
 
         # InventoryDataBlock array
         num_blocks = buffer[offset]; offset += 1
         for _ in range(num_blocks):
             block = ServerInventoryDataBlock()
-            block.ItemID = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
-            block.ParentID = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
-            block.CreatorID = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
-            block.OwnerID = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
-            block.GroupID = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
+            block.ItemID = CustomUUID.from_buffer(buffer, offset); offset += 16
+            block.ParentID = CustomUUID.from_buffer(buffer, offset); offset += 16
+            block.CreatorID = CustomUUID.from_buffer(buffer, offset); offset += 16
+            block.OwnerID = CustomUUID.from_buffer(buffer, offset); offset += 16
+            block.GroupID = CustomUUID.from_buffer(buffer, offset); offset += 16
 
             block.BaseMask = helpers.bytes_to_uint32(buffer, offset); offset += 4
             block.OwnerMask = helpers.bytes_to_uint32(buffer, offset); offset += 4
@@ -198,7 +198,7 @@ class UpdateInventoryItemPacket(Packet): # Server -> Client
             block.InvType = struct.unpack_from('<b', buffer, offset)[0]; offset += 1
             block.Type = struct.unpack_from('<b', buffer, offset)[0]; offset += 1
 
-            block.AssetID = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
+            block.AssetID = CustomUUID.from_buffer(buffer, offset); offset += 16
 
             block.SaleType = buffer[offset]; offset += 1
             block.SalePrice = helpers.bytes_to_int32(buffer, offset); offset += 4
@@ -220,7 +220,7 @@ class UpdateInventoryItemPacket(Packet): # Server -> Client
             self.inventory_data_blocks.append(block)
 
         if offset - initial_offset != length:
-            logger.warning(f"UpdateInventoryItemPacket: Expected to read {length} bytes, but read {offset - initial_offset}")
+            logger.warning("UpdateInventoryItemPacket: Expected to read %d bytes, but read %d", length, offset - initial_offset)
         return self
 
     def to_bytes(self) -> bytes: # Server -> Client, client does not send this
@@ -18,13 +18,13 @@ class ObjectDataBlock:
     parent_id: int = 0
     update_flags: int = 0 # u32, SL UpdateType enum
 
-    pcode: PCode = PCode.Primitive
-    material: Material = Material.STONE
+    pcode: PCode = PCode.Prim
+    material: Material = Material.Stone
     click_action: ClickAction = ClickAction.TOUCH
 
     scale: Vector3 = dataclasses.field(default_factory=lambda: Vector3(0.5, 0.5, 0.5))
     position: Vector3 = dataclasses.field(default_factory=Vector3.ZERO)
-    rotation: Quaternion = dataclasses.field(default_factory=Quaternion.IDENTITY)
+    rotation: Quaternion = dataclasses.field(default_factory=Quaternion.identity)
 
     path_curve: PathCurve = PathCurve.LINE; profile_curve: ProfileCurve = ProfileCurve.CIRCLE
     path_begin: float = 0.0; path_end: float = 0.0
@@ -72,7 +72,7 @@ class ObjectUpdatePacket(Packet):
             try:
                 block.id = helpers.bytes_to_uint32(buffer, offset); offset += 4 # LocalID
                 block.state = buffer[offset]; offset += 1
-                block.full_id = CustomUUID(buffer, offset); offset += 16
+                block.full_id = CustomUUID.from_buffer(buffer, offset); offset += 16
                 block.crc = helpers.bytes_to_uint32(buffer, offset); offset += 4
                 block.pcode = PCode(buffer[offset]); offset += 1
                 block.material = Material(buffer[offset]); offset += 1
@@ -87,20 +87,22 @@ class ObjectUpdatePacket(Packet):
                     block.scale = Vector3(*struct.unpack_from('<fff', buffer, offset)); offset += 12
                     block.position = Vector3(*struct.unpack_from('<fff', buffer, offset)); offset += 12
                     block.rotation = Quaternion(*struct.unpack_from('<ffff', buffer, offset)); offset += 16
-                    block.owner_id = CustomUUID(buffer, offset); offset += 16 # Example, might be conditional
+                    block.owner_id = CustomUUID.from_buffer(buffer, offset); offset += 16 # Example, might be conditional
                 except struct.error: # If vector/quat data is not where expected, log and skip this block
-                    logger.warning(f"ObjectUpdate: struct error parsing vectors/quat for block ID {block.id}, data potentially terse or malformed. Skipping block.")
+                    logger.warning("ObjectUpdate: struct error parsing vectors/quat for block ID %d, data potentially terse or malformed. Skipping block.", block.id)
                     break # Stop trying to parse more blocks from this packet if one is bad
 
                 # Example of reading a variable length string (e.g. NameValue)
                 # This requires knowing the structure (e.g. if it's null terminated or length prefixed)
                 # For NameValue, it's often null-terminated.
                 if offset < initial_offset + length:
-                    name_value_bytes, read_len = helpers.read_null_terminated_string_bytes(buffer, offset)
-                    if read_len > 0 :
-                         block.name_value_bytes = name_value_bytes
-                         block.parse_name_value()
-                         offset += read_len
+                    name_value_bytes, read_len = helpers.read_null_terminated_bytes(buffer, offset)
+                    if read_len < 0:
+                        logger.warning("ObjectUpdate: unterminated NameValue for block ID %d. Skipping block.", block.id)
+                        break
+                    block.name_value_bytes = name_value_bytes
+                    block.parse_name_value()
+                    offset += read_len
 
                 # TextureEntry: variable, length-prefixed (often 2 bytes for length)
                 if offset + 2 <= initial_offset + length:
@@ -109,12 +111,12 @@ class ObjectUpdatePacket(Packet):
                     if offset + te_len <= initial_offset + length:
                         block.texture_entry_bytes = buffer[offset : offset + te_len]
                         offset += te_len
-                    else: logger.warning(f"TE length {te_len} exceeds packet for prim {block.id}")
+                    else: logger.warning("TE length %d exceeds packet for prim %d", te_len, block.id)
 
                 self.object_data_blocks.append(block)
-                logger.debug(f"Parsed ObjectDataBlock (simplified): ID={block.id}, Name='{block.name}'")
+                logger.debug("Parsed ObjectDataBlock (simplified): ID=%s, Name='%s'", block.id, block.name)
             except Exception as e:
-                logger.error(f"Error parsing an ObjectDataBlock in ObjectUpdate: {e}. Data remaining: { (initial_offset + length) - offset } bytes.")
+                logger.error("Error parsing an ObjectDataBlock in ObjectUpdate: %s. Data remaining: %d bytes.", e, (initial_offset + length) - offset)
                 break # Stop parsing if an error occurs in one block
         return self
     def to_bytes(self)->bytes: logger.warning("Client doesn't send ObjectUpdatePacket."); return b''
@@ -320,7 +322,7 @@ class KillObjectPacket(Packet):
             local_id = helpers.bytes_to_uint32(buffer, offset); offset += 4
             self.object_data_blocks.append(KillObjectDataBlock(ID=local_id))
 
-        logger.debug(f"Parsed KillObjectPacket, {len(self.object_data_blocks)} objects to remove.")
+        logger.debug("Parsed KillObjectPacket, %d objects to remove.", len(self.object_data_blocks))
         return self
 
     def to_bytes(self) -> bytes:
@@ -371,7 +373,7 @@ class ImprovedTerseObjectUpdatePacket(Packet):
             # UpdateType (1 byte)
             # Data Length (1 byte if < 128, else 2 bytes if MSB of first byte is set)
             if initial_offset + length - offset < 4 + 1 + 1: # Min size for block header
-                logger.warning(f"ImprovedTerse: Not enough data for next block header. Remaining: {initial_offset + length - offset}")
+                logger.warning("ImprovedTerse: Not enough data for next block header. Remaining: %d", initial_offset + length - offset)
                 break
 
             local_id = helpers.bytes_to_uint32(buffer, offset); offset += 4
@@ -380,13 +382,13 @@ class ImprovedTerseObjectUpdatePacket(Packet):
             data_len = buffer[offset]; offset += 1
             if data_len & 0x80: # Check MSB for two-byte length
                 if offset >= initial_offset + length: # Need another byte for length
-                    logger.error(f"ImprovedTerse: Truncated two-byte data length for LocalID {local_id}.")
+                    logger.error("ImprovedTerse: Truncated two-byte data length for LocalID %d.", local_id)
                     break
                 data_len = ((data_len & 0x7F) << 8) | buffer[offset]
                 offset += 1
 
             if offset + data_len > initial_offset + length:
-                logger.error(f"ImprovedTerse: Data length {data_len} for LocalID {local_id} exceeds packet bounds.")
+                logger.error("ImprovedTerse: Data length %d for LocalID %d exceeds packet bounds.", data_len, local_id)
                 break # Corrupted or truncated packet
 
             object_data_payload = buffer[offset : offset + data_len]
@@ -408,14 +410,14 @@ class ImprovedTerseObjectUpdatePacket(Packet):
                     if offset + te_len <= initial_offset + length:
                         block.texture_entry_bytes = buffer[offset : offset + te_len]
                         offset += te_len
-                    else: logger.warning(f"ImprovedTerse: TE length {te_len} for LocalID {local_id} exceeds packet bounds.")
+                    else: logger.warning("ImprovedTerse: TE length %d for LocalID %d exceeds packet bounds.", te_len, local_id)
                 # else: logger.debug(f"ImprovedTerse: No TE length found for LocalID {local_id} despite UpdateType suggesting it.")
 
 
             self.object_data_blocks.append(block)
             idx += 1
 
-        logger.debug(f"Parsed {idx} blocks in ImprovedTerseObjectUpdatePacket.")
+        logger.debug("Parsed %d blocks in ImprovedTerseObjectUpdatePacket.", idx)
         return self
 
     def to_bytes(self) -> bytes:
@@ -489,6 +491,14 @@ class ObjectPropertiesPacketDataBlock: # Used by ObjectPropertiesFamilyPacket an
     @property
     def sit_text_str(self) -> str: return self.SitText.decode(errors='replace')
 
+def _read_property_strings(buffer: bytes, offset: int, prop_block: ObjectPropertiesPacketDataBlock) -> int:
+    """Reads the trailing Name/Description/TouchText/SitText strings into prop_block, returns the new offset."""
+    for field in ('Name', 'Description', 'TouchText', 'SitText'):
+        value, read = helpers.read_null_terminated_bytes(buffer, offset)
+        if read < 0: raise ValueError(f"ObjectProperties: No null terminator for {field}.")
+        setattr(prop_block, field, value); offset += read
+    return offset
+
 
 class ObjectPropertiesFamilyPacket(Packet): # Server -> Client
     """
@@ -499,7 +509,7 @@ class ObjectPropertiesFamilyPacket(Packet): # Server -> Client
         super().__init__(PacketType.ObjectPropertiesFamily, header if header else PacketHeader())
         self.requestor_id: CustomUUID = CustomUUID.ZERO # AgentID of who requested
         self.object_id: CustomUUID = CustomUUID.ZERO    # UUID of the root prim of the linkset
-        self.type: int = 0 # u8, actually PrimType enum in C# (not PCode) - e.g. tree, grass
+        self.prim_type: int = 0 # u8, actually PrimType enum in C# (not PCode) - e.g. tree, grass
                            # This might need a new PrimType enum if different from PCode.
                            # For now, store as int.
         self.properties_blocks: list[ObjectPropertiesPacketDataBlock] = [] # One for each prim in linkset
@@ -507,10 +517,10 @@ class ObjectPropertiesFamilyPacket(Packet): # Server -> Client
     def from_bytes_body(self, buffer: bytes, offset: int, length: int):
         initial_offset = offset
         # RequestorData
-        self.requestor_id = CustomUUID(buffer, offset); offset += 16
+        self.requestor_id = CustomUUID.from_buffer(buffer, offset); offset += 16
         # ObjectData (for the root/main object of the family)
-        self.object_id = CustomUUID(buffer, offset); offset += 16
-        self.type = buffer[offset]; offset += 1 # PrimType/Category
+        self.object_id = CustomUUID.from_buffer(buffer, offset); offset += 16
+        self.prim_type = buffer[offset]; offset += 1 # PrimType/Category
 
         # Number of objects in this packet (usually 1 for the root, then others if part of selection)
         # C# ObjectPropertiesFamilyPacket has a nested array of ObjectData blocks.
@@ -527,9 +537,9 @@ class ObjectPropertiesFamilyPacket(Packet): # Server -> Client
             prop_block = ObjectPropertiesPacketDataBlock()
             prop_block.ObjectID = self.object_id # The main ObjectID is for this block
 
-            prop_block.OwnerID = CustomUUID(buffer, offset); offset += 16
-            prop_block.CreatorID = CustomUUID(buffer, offset); offset += 16
-            prop_block.GroupID = CustomUUID(buffer, offset); offset += 16
+            prop_block.OwnerID = CustomUUID.from_buffer(buffer, offset); offset += 16
+            prop_block.CreatorID = CustomUUID.from_buffer(buffer, offset); offset += 16
+            prop_block.GroupID = CustomUUID.from_buffer(buffer, offset); offset += 16
             prop_block.BaseMask = helpers.bytes_to_uint32(buffer, offset); offset += 4
             prop_block.OwnerMask = helpers.bytes_to_uint32(buffer, offset); offset += 4
             prop_block.GroupMask = helpers.bytes_to_uint32(buffer, offset); offset += 4
@@ -539,12 +549,9 @@ class ObjectPropertiesFamilyPacket(Packet): # Server -> Client
             prop_block.SalePrice = helpers.bytes_to_int32(buffer, offset); offset += 4
             prop_block.SaleType = buffer[offset]; offset += 1
             prop_block.Category = helpers.bytes_to_uint32(buffer, offset); offset += 4 # Not InventoryCategory, but different
-            prop_block.LastOwnerID = CustomUUID(buffer, offset); offset += 16
+            prop_block.LastOwnerID = CustomUUID.from_buffer(buffer, offset); offset += 16
 
-            prop_block.Name, read = helpers.read_null_terminated_string_bytes(buffer,offset); offset+=read
-            prop_block.Description, read = helpers.read_null_terminated_string_bytes(buffer,offset); offset+=read
-            prop_block.TouchText, read = helpers.read_null_terminated_string_bytes(buffer,offset); offset+=read
-            prop_block.SitText, read = helpers.read_null_terminated_string_bytes(buffer,offset); offset+=read
+            offset = _read_property_strings(buffer, offset, prop_block)
 
             self.properties_blocks.append(prop_block)
         return self
@@ -569,10 +576,10 @@ class ObjectPropertiesPacket(Packet): # Server -> Client
             prop_block = ObjectPropertiesPacketDataBlock()
             # This parsing logic is identical to the one in ObjectPropertiesFamilyPacket's block
             # It should be refactored into a helper or on ObjectPropertiesPacketDataBlock itself.
-            prop_block.ObjectID = CustomUUID(buffer, offset); offset += 16 # This is the key difference
-            prop_block.OwnerID = CustomUUID(buffer, offset); offset += 16
-            prop_block.CreatorID = CustomUUID(buffer, offset); offset += 16
-            prop_block.GroupID = CustomUUID(buffer, offset); offset += 16
+            prop_block.ObjectID = CustomUUID.from_buffer(buffer, offset); offset += 16 # This is the key difference
+            prop_block.OwnerID = CustomUUID.from_buffer(buffer, offset); offset += 16
+            prop_block.CreatorID = CustomUUID.from_buffer(buffer, offset); offset += 16
+            prop_block.GroupID = CustomUUID.from_buffer(buffer, offset); offset += 16
             prop_block.BaseMask = helpers.bytes_to_uint32(buffer, offset); offset += 4
             prop_block.OwnerMask = helpers.bytes_to_uint32(buffer, offset); offset += 4
             prop_block.GroupMask = helpers.bytes_to_uint32(buffer, offset); offset += 4
@@ -582,11 +589,8 @@ class ObjectPropertiesPacket(Packet): # Server -> Client
             prop_block.SalePrice = helpers.bytes_to_int32(buffer, offset); offset += 4
             prop_block.SaleType = buffer[offset]; offset += 1
             prop_block.Category = helpers.bytes_to_uint32(buffer, offset); offset += 4
-            prop_block.LastOwnerID = CustomUUID(buffer, offset); offset += 16
-            prop_block.Name, read = helpers.read_null_terminated_string_bytes(buffer,offset); offset+=read
-            prop_block.Description, read = helpers.read_null_terminated_string_bytes(buffer,offset); offset+=read
-            prop_block.TouchText, read = helpers.read_null_terminated_string_bytes(buffer,offset); offset+=read
-            prop_block.SitText, read = helpers.read_null_terminated_string_bytes(buffer,offset); offset+=read
+            prop_block.LastOwnerID = CustomUUID.from_buffer(buffer, offset); offset += 16
+            offset = _read_property_strings(buffer, offset, prop_block)
             self.object_data_blocks.append(prop_block)
         return self
     def to_bytes(self)->bytes: logger.warning("Client doesn't send OPPkt."); return b''
@@ -821,10 +825,10 @@ class ObjectAddPacket(Packet):
         if len(te_bytes) == 17:
             data.extend(te_bytes)
         elif len(te_bytes) > 17:
-            logger.warning(f"ObjectAddPacket: TextureEntry too long ({len(te_bytes)}), using first 17 bytes.")
+            logger.warning("ObjectAddPacket: TextureEntry too long (%d), using first 17 bytes.", len(te_bytes))
             data.extend(te_bytes[:17])
         else: # len < 17
-            logger.error(f"ObjectAddPacket: TextureEntry is too short ({len(te_bytes)}), expected 17 bytes. Padding with zeros.")
+            logger.error("ObjectAddPacket: TextureEntry is too short (%d), expected 17 bytes. Padding with zeros.", len(te_bytes))
             data.extend(te_bytes)
             data.extend(bytes(17 - len(te_bytes))) # Pad with zeros to 17 bytes
 
@@ -5,10 +5,10 @@ from datetime import datetime, timezone
 from typing import List # Added for type hinting
 
 from pylibremetaverse.types import CustomUUID, Vector3
-from pylibremetaverse.types.enums import AssetType, ParcelFlags, ParcelCategory, ParcelStatus, PacketType
-from pylibremetaverse.types.parcel_defs import ParcelPrimOwnerData, ParcelACLFlags # Added imports
+from pylibremetaverse.types.enums import AssetType
+from pylibremetaverse.types.parcel_defs import ParcelFlags, ParcelCategory, ParcelStatus, ParcelPrimOwnerData, ParcelACLFlags
 from pylibremetaverse.utils import helpers
-from .packets_base import Packet, PacketHeader
+from .packets_base import Packet, PacketHeader, PacketType
 
 logger = logging.getLogger(__name__)
 
@@ -154,9 +154,9 @@ class ParcelPropertiesPacket(Packet): # Server -> Client
 
         pd.RequestResult = helpers.bytes_to_int32(buffer, offset); offset += 4
         pd.SequenceID = helpers.bytes_to_int32(buffer, offset); offset += 4
-        pd.SnapKey = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
+        pd.SnapKey = CustomUUID.from_buffer(buffer, offset); offset += 16
         pd.LocalID = helpers.bytes_to_int32(buffer, offset); offset += 4
-        pd.OwnerID = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
+        pd.OwnerID = CustomUUID.from_buffer(buffer, offset); offset += 16
         pd.IsGroupOwned = buffer[offset] != 0; offset += 1
 
         pd.Name, read = helpers.read_sized_string_bytes(buffer, offset, 128); offset += read
@@ -171,7 +171,7 @@ class ParcelPropertiesPacket(Packet): # Server -> Client
         pd.GlobalZ = helpers.bytes_to_float(buffer, offset); offset += 4
 
         pd.SimName, read = helpers.read_sized_string_bytes(buffer, offset, 64); offset += read
-        pd.SnapshotID = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
+        pd.SnapshotID = CustomUUID.from_buffer(buffer, offset); offset += 16
         pd.MediaURL, read = helpers.read_sized_string_bytes(buffer, offset, 255); offset += read
         pd.MusicURL, read = helpers.read_sized_string_bytes(buffer, offset, 255); offset += read
 
@@ -183,7 +183,7 @@ class ParcelPropertiesPacket(Packet): # Server -> Client
         pd.Category = buffer[offset]; offset += 1 # u8
         pd.Status = struct.unpack_from('<b', buffer, offset)[0]; offset += 1 # sbyte
         pd.LandingType = buffer[offset]; offset += 1 # u8
-        pd.AuthBuyerID = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
+        pd.AuthBuyerID = CustomUUID.from_buffer(buffer, offset); offset += 16
 
         pd.MediaDesc, read = helpers.read_sized_string_bytes(buffer, offset, 255); offset += read
         pd.MediaWidth = helpers.bytes_to_int16(buffer, offset); offset += 2
@@ -195,13 +195,13 @@ class ParcelPropertiesPacket(Packet): # Server -> Client
         # pd.ObscureMediaURL, read = helpers.read_sized_string_bytes(buffer, offset, 255); offset += read # See note above
 
         pd.SeeOtherCleanTime = helpers.bytes_to_int32(buffer, offset); offset += 4
-        pd.RegionUUID = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
+        pd.RegionUUID = CustomUUID.from_buffer(buffer, offset); offset += 16
 
         # Parse ParcelPrimOwnersData
         prim_owner_count = buffer[offset]; offset += 1 # Count is 1 byte
         pd.PrimOwners = []
         for _ in range(prim_owner_count):
-            owner_id = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
+            owner_id = CustomUUID.from_buffer(buffer, offset); offset += 16
             count = helpers.bytes_to_int32(buffer, offset); offset += 4
             pd.PrimOwners.append(ParcelPrimOwnerData(owner_id=owner_id, count=count))
 
@@ -302,15 +302,15 @@ class ParcelAccessListReplyPacket(Packet):
 
     def from_bytes_body(self, buffer: bytes, offset: int, length: int) -> "ParcelAccessListReplyPacket":
         # AgentDataBlock
-        self.agent_data.AgentID = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
-        self.agent_data.SessionID = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
+        self.agent_data.AgentID = CustomUUID.from_buffer(buffer, offset); offset += 16
+        self.agent_data.SessionID = CustomUUID.from_buffer(buffer, offset); offset += 16
 
         # DataBlock
         db = self.data_block
         db.SequenceID = helpers.bytes_to_int32(buffer, offset); offset += 4
         db.Flags = helpers.bytes_to_uint32(buffer, offset); offset += 4
         db.ParcelLocalID = helpers.bytes_to_int32(buffer, offset); offset += 4
-        db.TransactionID = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
+        db.TransactionID = CustomUUID.from_buffer(buffer, offset); offset += 16
 
         # AccessDataBlocks (Array)
         # The count of AccessDataBlocks is determined by the remaining length of the packet
@@ -326,7 +326,7 @@ class ParcelAccessListReplyPacket(Packet):
              if remaining_length % access_block_size == 0:
                  num_access_blocks = remaining_length // access_block_size
              else:
-                 logger.warning(f"ParcelAccessListReply: Unexpected remaining length {remaining_length} for access blocks.")
+                 logger.warning("ParcelAccessListReply: Unexpected remaining length %d for access blocks.", remaining_length)
                  # Potentially, there's a count byte. For now, we'll proceed if it's a clean division.
                  # If not, this will likely lead to errors or incomplete parsing.
                  # A more robust parser would check a count field if the protocol specifies one.
@@ -337,7 +337,7 @@ class ParcelAccessListReplyPacket(Packet):
             if offset + access_block_size > len(buffer): # Boundary check
                 logger.error("ParcelAccessListReply: Buffer overrun while parsing access data blocks.")
                 break
-            acc_id = CustomUUID(initial_bytes=buffer[offset : offset+16]); offset += 16
+            acc_id = CustomUUID.from_buffer(buffer, offset); offset += 16
             acc_time = helpers.bytes_to_int32(buffer, offset); offset += 4
             acc_flags = helpers.bytes_to_uint32(buffer, offset); offset += 4
             self.access_data_blocks.append(
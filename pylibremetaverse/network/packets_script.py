@@ -9,6 +9,9 @@ from .packets_base import Packet, PacketHeader, PacketType
 
 logger = logging.getLogger(__name__)
 
+_SCRIPT_DIALOG_REPLY_STRUCT = struct.Struct('<16s16s16sii') # AgentID, SessionID, ObjectID, ChatChannel, ButtonIndex
+_SCRIPT_ANSWER_STRUCT = struct.Struct('<16s16s16s16sI') # AgentID, SessionID, TaskID, ItemID, Questions
+
 # --- ScriptDialogPacket (Server -> Client) ---
 class ScriptDialogPacket(Packet):
     """Received from server, presents a dialog from a script to the user."""
@@ -37,9 +40,9 @@ class ScriptDialogPacket(Packet):
     def from_bytes_body(self, buffer: bytes, offset: int, length: int):
         initial_offset = offset
         # ObjectData block
-        self.object_id = CustomUUID(buffer, offset); offset += 16
+        self.object_id = CustomUUID.from_buffer(buffer, offset); offset += 16
         self.object_name = helpers.bytes_to_string(buffer, offset, 0).encode('utf-8'); offset += len(self.object_name) + 1
-        self.image_id = CustomUUID(buffer, offset); offset += 16
+        self.image_id = CustomUUID.from_buffer(buffer, offset); offset += 16
         self.chat_channel = helpers.bytes_to_int32(buffer, offset); offset += 4
 
         # Data block
@@ -78,20 +81,10 @@ class ScriptDialogReplyPacket(Packet):
         self.header.reliable = True
 
     def to_bytes(self) -> bytes:
-        data = bytearray()
-        # AgentData
-        data.extend(self.agent_id.get_bytes())
-        data.extend(self.session_id.get_bytes())
-        # Data
-        data.extend(self.object_id.get_bytes())
-        data.extend(helpers.int32_to_bytes(self.chat_channel))
-        data.extend(helpers.int32_to_bytes(self.button_index))
-
-        label_bytes = self.button_label_bytes
-        if len(label_bytes) > 254: label_bytes = label_bytes[:254] # Max length for button label
-        data.extend(label_bytes)
-        data.append(0) # Null terminator
-        return bytes(data)
+        # AgentData + Data fixed fields, then the null-terminated ButtonLabel (max 254 bytes)
+        return (_SCRIPT_DIALOG_REPLY_STRUCT.pack(self.agent_id.get_bytes(), self.session_id.get_bytes(),
+                                                 self.object_id.get_bytes(), self.chat_channel, self.button_index)
+                + self.button_label_bytes[:254] + b'\x00')
 
     def from_bytes_body(self, buffer: bytes, offset: int, length: int): # Server doesn't send this
         logger.warning("ScriptDialogReplyPacket.from_bytes_body should not be called on client.")
@@ -125,8 +118,8 @@ class ScriptQuestionPacket(Packet):
         min_len = 16 + 16 + 1+1+1+ 4 # Min for strings (1 byte each for null term)
         if length < min_len: raise ValueError(f"ScriptQuestionPacket body too short: {length}")
 
-        self.task_id = CustomUUID(buffer, offset); offset += 16
-        self.item_id = CustomUUID(buffer, offset); offset += 16
+        self.task_id = CustomUUID.from_buffer(buffer, offset); offset += 16
+        self.item_id = CustomUUID.from_buffer(buffer, offset); offset += 16
 
         self.object_name = helpers.bytes_to_string(buffer, offset, 0).encode('utf-8'); offset += len(self.object_name) + 1
         # In C#, ObjectOwner is a single string field. Here, split for consistency if other packets do.
@@ -184,8 +177,7 @@ class ScriptAnswerYesPacket(Packet):
     def __init__(self, agent_id: CustomUUID, session_id: CustomUUID,
                  task_id: CustomUUID, item_id: CustomUUID, questions_granted: ScriptPermission,
                  header: PacketHeader | None = None):
-        # Assuming a conceptual PacketType.ScriptAnswerYes exists or will be added
-        super().__init__(PacketType.Unhandled, header if header else PacketHeader()) # Replace Unhandled later
+        super().__init__(PacketType.ScriptAnswerYes, header if header else PacketHeader())
         self.agent_id = agent_id
         self.session_id = session_id
         self.task_id = task_id # TaskID from ScriptQuestion
@@ -194,15 +186,8 @@ class ScriptAnswerYesPacket(Packet):
         self.header.reliable = True
 
     def to_bytes(self) -> bytes:
-        data = bytearray()
-        # AgentData
-        data.extend(self.agent_id.get_bytes())
-        data.extend(self.session_id.get_bytes())
-        # Data
-        data.extend(self.task_id.get_bytes())
-        data.extend(self.item_id.get_bytes())
-        data.extend(helpers.uint32_to_bytes(self.questions))
-        return bytes(data)
+        return _SCRIPT_ANSWER_STRUCT.pack(self.agent_id.get_bytes(), self.session_id.get_bytes(),
+                                          self.task_id.get_bytes(), self.item_id.get_bytes(), self.questions)
 
     def from_bytes_body(self, buffer: bytes, offset: int, length: int): # Server doesn't send this
         logger.warning("ScriptAnswerYesPacket.from_bytes_body should not be called on client.")
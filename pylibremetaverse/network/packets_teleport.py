@@ -1,5 +1,6 @@
 import logging
 import struct
+import dataclasses
 
 from pylibremetaverse.types import CustomUUID, Vector3
 from pylibremetaverse.types.enums import TeleportFlags
@@ -8,6 +9,15 @@ from .packets_base import Packet, PacketHeader, PacketType
 
 logger = logging.getLogger(__name__)
 
+_U32_STRUCT = struct.Struct('<I')
+_TELEPORT_FINISH_HEAD_STRUCT = struct.Struct('<16sQI') # AgentID, RegionHandle, LocationID
+_SIM_ENDPOINT_STRUCT = struct.Struct('>IH') # SimIP, SimPort (network byte order)
+_TELEPORT_LOCAL_STRUCT = struct.Struct('<I3f3fI') # LocationID, Position, LookAt, TeleportFlags
+_AGENT_DATA_STRUCT = struct.Struct('<16s16s') # AgentID, SessionID
+_TELEPORT_LANDMARK_REQUEST_STRUCT = struct.Struct('<16s16s16s') # AgentID, SessionID, LandmarkID
+_TELEPORT_LOCATION_REQUEST_STRUCT = struct.Struct('<16s16sQ3f3f') # AgentID, SessionID, RegionHandle, Position, LookAt
+_TELEPORT_LURE_REQUEST_STRUCT = struct.Struct('<16s16s16sI') # AgentID, SessionID, LureID, TeleportFlags
+
 # --- Outgoing Teleport Request Packets ---
 
 class TeleportLandmarkRequestPacket(Packet):
@@ -21,13 +31,9 @@ class TeleportLandmarkRequestPacket(Packet):
         self.header.reliable = True
 
     def to_bytes(self) -> bytes:
-        data = bytearray()
-        # AgentData block
-        data.extend(self.agent_id.get_bytes())    # 16 bytes
-        data.extend(self.session_id.get_bytes())  # 16 bytes
-        # Info block
-        data.extend(self.landmark_id.get_bytes()) # 16 bytes (LandmarkID)
-        return bytes(data)
+        # AgentData block, then Info block (LandmarkID)
+        return _TELEPORT_LANDMARK_REQUEST_STRUCT.pack(self.agent_id.get_bytes(), self.session_id.get_bytes(),
+                                                      self.landmark_id.get_bytes())
 
     def from_bytes_body(self, buffer: bytes, offset: int, length: int): # Server doesn't send this
         logger.warning("TeleportLandmarkRequestPacket.from_bytes_body should not be called on client.")
@@ -48,15 +54,10 @@ class TeleportLocationRequestPacket(Packet):
         self.header.reliable = True
 
     def to_bytes(self) -> bytes:
-        data = bytearray()
-        # AgentData block
-        data.extend(self.agent_id.get_bytes())    # 16
-        data.extend(self.session_id.get_bytes())  # 16
-        # Info block
-        data.extend(helpers.uint64_to_bytes(self.region_handle)) # 8
-        data.extend(struct.pack('<fff', self.position.X, self.position.Y, self.position.Z)) # 12
-        data.extend(struct.pack('<fff', self.look_at.X, self.look_at.Y, self.look_at.Z))    # 12
-        return bytes(data)
+        # AgentData block, then Info block (RegionHandle, Position, LookAt)
+        pos = self.position; look_at = self.look_at
+        return _TELEPORT_LOCATION_REQUEST_STRUCT.pack(self.agent_id.get_bytes(), self.session_id.get_bytes(), self.region_handle,
+                                                      pos.X, pos.Y, pos.Z, look_at.X, look_at.Y, look_at.Z)
 
     def from_bytes_body(self, buffer: bytes, offset: int, length: int): # Server doesn't send this
         logger.warning("TeleportLocationRequestPacket.from_bytes_body should not be called on client.")
@@ -75,21 +76,18 @@ class TeleportCancelPacket(Packet):
 
     def to_bytes(self) -> bytes: # When client sends to cancel
         if self.agent_id and self.session_id:
-            data = bytearray()
-            data.extend(self.agent_id.get_bytes())
-            data.extend(self.session_id.get_bytes())
-            return bytes(data)
+            return _AGENT_DATA_STRUCT.pack(self.agent_id.get_bytes(), self.session_id.get_bytes())
         return b'' # Empty body if server sends it or no specific agent/session context
 
     def from_bytes_body(self, buffer: bytes, offset: int, length: int):
         # Server might send this with no body, or with Agent/Session.
         if length >= 32: # AgentID + SessionID
-            self.agent_id = CustomUUID(buffer, offset); offset += 16
-            self.session_id = CustomUUID(buffer, offset)
+            self.agent_id = CustomUUID.from_buffer(buffer, offset); offset += 16
+            self.session_id = CustomUUID.from_buffer(buffer, offset)
         else: # Assume no specific agent/session data if body is short
             self.agent_id = CustomUUID.ZERO
             self.session_id = CustomUUID.ZERO
-        logger.info(f"Parsed TeleportCancelPacket. Agent: {self.agent_id}, Session: {self.session_id}")
+        logger.info("Parsed TeleportCancelPacket. Agent: %s, Session: %s", self.agent_id, self.session_id)
         return self
 
 
@@ -103,7 +101,7 @@ class TeleportStartPacket(Packet):
 
     def from_bytes_body(self, buffer: bytes, offset: int, length: int):
         if length < 4: raise ValueError("TeleportStart body too short.")
-        self.teleport_flags = TeleportFlags(helpers.bytes_to_uint32(buffer, offset))
+        self.teleport_flags = TeleportFlags(_U32_STRUCT.unpack_from(buffer, offset)[0])
         return self
     def to_bytes(self) -> bytes: logger.warning("Client does not send TeleportStart."); return b''
 
@@ -121,7 +119,7 @@ class TeleportProgressPacket(Packet):
     def from_bytes_body(self, buffer: bytes, offset: int, length: int):
         # AgentData block (AgentID)
         if length < 16 + 1: raise ValueError("TeleportProgress body too short for AgentID.")
-        self.agent_id = CustomUUID(buffer, offset); offset += 16
+        self.agent_id = CustomUUID.from_buffer(buffer, offset); offset += 16
 
         # Message block (Message, TeleportFlags)
         # Message is variable length, null-terminated
@@ -139,7 +137,7 @@ class TeleportProgressPacket(Packet):
             self.message = buffer[offset:msg_end]; offset = msg_end + 1
 
         if offset + 4 > length: raise ValueError("TeleportProgress body too short for TeleportFlags.")
-        self.teleport_flags = TeleportFlags(helpers.bytes_to_uint32(buffer, offset))
+        self.teleport_flags = TeleportFlags(_U32_STRUCT.unpack_from(buffer, offset)[0])
         return self
     def to_bytes(self) -> bytes: logger.warning("Client does not send TeleportProgress."); return b''
 
@@ -158,7 +156,7 @@ class TeleportFailedPacket(Packet):
     def from_bytes_body(self, buffer: bytes, offset: int, length: int):
         # AgentData block (AgentID)
         if length < 16 + 1: raise ValueError("TeleportFailed body too short for AgentID.")
-        self.agent_id = CustomUUID(buffer, offset); offset += 16
+        self.agent_id = CustomUUID.from_buffer(buffer, offset); offset += 16
 
         # Info block (Reason string, AlertFlags u32)
         # Reason is variable length, null-terminated
@@ -170,7 +168,7 @@ class TeleportFailedPacket(Packet):
             self.reason = buffer[offset:reason_end]; offset = reason_end + 1
 
         if offset + 4 <= length : # Check if AlertFlags are present
-             self.alert_flags = helpers.bytes_to_uint32(buffer, offset)
+             self.alert_flags, = _U32_STRUCT.unpack_from(buffer, offset)
         else: self.alert_flags = 0 # Default if not present
 
         return self
@@ -200,12 +198,10 @@ class TeleportFinishPacket(Packet):
         min_len = 38
         if length < min_len: raise ValueError(f"TeleportFinish body too short: {length}")
 
-        self.agent_id = CustomUUID(buffer, offset); offset += 16
-        self.region_handle = helpers.bytes_to_uint64(buffer, offset); offset += 8
-        self.location_id = helpers.bytes_to_uint32(buffer, offset); offset += 4 # Often 0 for inter-sim
-        self.sim_ip_uint32 = helpers.bytes_to_uint32_big_endian(buffer, offset); offset += 4 # Big Endian for IP
-        self.sim_port = helpers.bytes_to_uint16_big_endian(buffer, offset); offset += 2 # Big Endian for port
-        self.teleport_flags = TeleportFlags(helpers.bytes_to_uint32(buffer, offset)); offset += 4
+        agent_id, self.region_handle, self.location_id = _TELEPORT_FINISH_HEAD_STRUCT.unpack_from(buffer, offset) # LocationID is often 0 for inter-sim
+        self.agent_id = CustomUUID.from_buffer(agent_id); offset += _TELEPORT_FINISH_HEAD_STRUCT.size
+        self.sim_ip_uint32, self.sim_port = _SIM_ENDPOINT_STRUCT.unpack_from(buffer, offset); offset += _SIM_ENDPOINT_STRUCT.size
+        self.teleport_flags = TeleportFlags(_U32_STRUCT.unpack_from(buffer, offset)[0]); offset += 4
 
         # SeedCapability (variable string, null-terminated)
         seed_cap_end = buffer.find(b'\x00', offset)
@@ -221,9 +217,9 @@ class TeleportFinishPacket(Packet):
 
         # Optional RegionSizeX and RegionSizeY (added in later versions of protocol)
         if offset + 4 <= length: # Check for RegionSizeX
-            self.region_size_x = helpers.bytes_to_uint32(buffer, offset); offset += 4
+            self.region_size_x, = _U32_STRUCT.unpack_from(buffer, offset); offset += 4
         if offset + 4 <= length: # Check for RegionSizeY
-            self.region_size_y = helpers.bytes_to_uint32(buffer, offset); offset += 4
+            self.region_size_y, = _U32_STRUCT.unpack_from(buffer, offset); offset += 4
 
         return self
     def to_bytes(self) -> bytes: logger.warning("Client does not send TeleportFinish."); return b''
@@ -240,10 +236,9 @@ class TeleportLocalPacket(Packet): # Server sends this for in-sim teleports (TP
     def from_bytes_body(self, buffer: bytes, offset: int, length: int):
         # LocationID(4) + Position(12) + LookAt(12) + TeleportFlags(4) = 32 bytes
         if length < 32: raise ValueError("TeleportLocal body too short.")
-        self.location_id = helpers.bytes_to_uint32(buffer, offset); offset += 4
-        self.position = Vector3(*struct.unpack_from('<fff', buffer, offset)); offset += 12
-        self.look_at = Vector3(*struct.unpack_from('<fff', buffer, offset)); offset += 12
-        self.teleport_flags = TeleportFlags(helpers.bytes_to_uint32(buffer, offset))
+        self.location_id, px, py, pz, lx, ly, lz, flags = _TELEPORT_LOCAL_STRUCT.unpack_from(buffer, offset)
+        self.position = Vector3(px, py, pz); self.look_at = Vector3(lx, ly, lz)
+        self.teleport_flags = TeleportFlags(flags)
         return self
     def to_bytes(self) -> bytes: logger.warning("Client does not send TeleportLocal this way."); return b''
 
@@ -277,25 +272,13 @@ class StartLurePacket(Packet):
         self.header.reliable = True
 
     def to_bytes(self) -> bytes:
-        data = bytearray()
-        # AgentData
-        data.extend(self.agent_data.AgentID.get_bytes())
-        data.extend(self.agent_data.SessionID.get_bytes())
-        # Info
-        data.append(self.info.LureType & 0xFF) # LureType is u8
-
         msg_bytes = self.info.Message # Already bytes
         if len(msg_bytes) > 1023: msg_bytes = msg_bytes[:1023] # Max length
-        data.extend(msg_bytes)
-        data.append(0) # Null terminator for message
-
-        # TargetData Array (count + elements)
-        # Assuming only one target for now, as is typical for client sending.
-        data.append(len(self.target_data) & 0xFF) # Count of targets (u8)
-        for target_block in self.target_data:
-            data.extend(target_block.TargetID.get_bytes())
-
-        return bytes(data)
+        targets = self.target_data[:255] # Count of targets is u8; one target is typical for client sending
+        # AgentData (32) + LureType (1) + Message + null (1) + target count (1) + TargetIDs
+        return b''.join((_AGENT_DATA_STRUCT.pack(self.agent_data.AgentID.get_bytes(), self.agent_data.SessionID.get_bytes()),
+                         bytes((self.info.LureType & 0xFF,)), msg_bytes, b'\0', bytes((len(targets),)),
+                         *[target_block.TargetID.get_bytes() for target_block in targets]))
 
     def from_bytes_body(self, buffer: bytes, offset: int, length: int): # Server doesn't send this
         logger.warning("StartLurePacket.from_bytes_body should not be called on client.")
@@ -324,13 +307,9 @@ class TeleportLureRequestPacket(Packet):
         self.header.reliable = True
 
     def to_bytes(self) -> bytes:
-        data = bytearray()
-        # Info Block
-        data.extend(self.info.AgentID.get_bytes())
-        data.extend(self.info.SessionID.get_bytes())
-        data.extend(self.info.LureID.get_bytes())
-        data.extend(helpers.uint32_to_bytes(self.info.TeleportFlags))
-        return bytes(data)
+        info = self.info
+        return _TELEPORT_LURE_REQUEST_STRUCT.pack(info.AgentID.get_bytes(), info.SessionID.get_bytes(),
+                                                  info.LureID.get_bytes(), info.TeleportFlags)
 
     def from_bytes_body(self, buffer: bytes, offset: int, length: int):
         # This specific structure (client accepting lure) is not typically received by client.
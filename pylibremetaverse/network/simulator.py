@@ -1,4 +1,5 @@
 import asyncio
+import collections
 import socket
 import logging
 import time
@@ -39,7 +40,9 @@ class Simulator:
 
         self.ack_inbox: Dict[int, float] = {}
         self.ack_queue: asyncio.Queue[int] = asyncio.Queue()
-        self.need_ack: Dict[int, Tuple[Packet, float, int]] = {}
+        # Reliable packets awaiting an ACK, kept in order of last transmission so the
+        # resend loop can stop at the first entry that is too recent to have expired.
+        self.need_ack: collections.OrderedDict[int, Tuple[Packet, float, int]] = collections.OrderedDict()
 
         self.transport: asyncio.DatagramTransport | None = None
         self.protocol: PacketProtocol | None = None
@@ -118,10 +121,16 @@ class Simulator:
         try:
             resend_timeout_secs = self.client.settings.resend_timeout / 1000.0
             max_resends = self.client.settings.max_resend_count
+            base_timeout = resend_timeout_secs * RESEND_TIMEOUT_FACTOR
             while self.connected:
                 current_time = time.monotonic(); packets_to_resend = []
-                for seq, (packet, time_sent, resend_count) in list(self.need_ack.items()):
-                    if current_time - time_sent > resend_timeout_secs * (resend_count + 1) * RESEND_TIMEOUT_FACTOR:
+                expired_seqs = []
+                for seq, (_, time_sent, _) in self.need_ack.items():
+                    if current_time - time_sent <= base_timeout: break # Everything after this was sent later
+                    expired_seqs.append(seq)
+                for seq in expired_seqs:
+                    packet, time_sent, resend_count = self.need_ack[seq]
+                    if current_time - time_sent > base_timeout * (resend_count + 1):
                         if resend_count >= max_resends:
                             logger.error(f"[{self}] Max resends for packet Seq={seq}, Type={packet.type.name}. Giving up.")
                             del self.need_ack[seq]
@@ -131,6 +140,7 @@ class Simulator:
                         packet.header.flags |= PacketFlags.RESENT
                         packets_to_resend.append(packet)
                         self.need_ack[seq] = (packet, current_time, resend_count + 1)
+                        self.need_ack.move_to_end(seq)
                 for p_to_resend in packets_to_resend:
                     await self.send_packet(p_to_resend, set_sequence=False)
                 await asyncio.sleep(resend_timeout_secs / 3.0)
@@ -146,7 +156,8 @@ class Simulator:
             max_seq = self.client.settings.MAX_SEQUENCE
             self.sequence_number = (self.sequence_number + 1) & max_seq
             packet.header.sequence = self.sequence_number
-        if packet.header.reliable and not (packet.header.flags & PacketFlags.ACK):
+        if packet.header.reliable and not (packet.header.flags & PacketFlags.ACK) \
+                and packet.header.sequence not in self.need_ack: # Resends keep their existing entry and count
             self.need_ack[packet.header.sequence] = (packet, time.monotonic(), 0)
         try:
             max_size = self.client.settings.MAX_PACKET_SIZE
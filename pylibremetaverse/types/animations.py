@@ -11,7 +11,7 @@ class Animations:
     STAND_2 = CustomUUID("1906875f-a213-5070-79c2-080808e81101") # Stand 2
     STAND_3 = CustomUUID("1906875f-a213-5070-79c2-080808e81102") # Stand 3
     STAND_4 = CustomUUID("1906875f-a213-5070-79c2-080808e81103") # Stand 4
-    WALK = CustomUUID("7a2e4798-869d-0978-5917-7arti0kul8a1")  # Often overridden by AO, but a default exists
+    WALK = CustomUUID("6ed24bd8-91aa-4b12-ccc7-c97c857ab4e0")  # Often overridden by AO, but a default exists
     RUN = CustomUUID("05ddbff8-aaa9-92a1-2397-c5890c0960a2")   # Default run
     SIT_GROUND = CustomUUID("1a2c786f-5419-2f79-9903-700280505660")
     SIT_GROUND_RELAXED = CustomUUID("2a840450-72d5-7888-9903-700280505660") # Example
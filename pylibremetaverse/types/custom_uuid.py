@@ -6,6 +6,9 @@ class CustomUUID:
     A custom UUID class that mimics the behavior of UUID.cs,
     including specific byte ordering and CRC calculation.
     """
+    # _bytes is the 16-byte wire form returned by get_bytes() and is what equality compares.
+    # _uuid is the standard uuid.UUID, built on first use (str/hash) for UUIDs decoded from packets.
+    __slots__ = ('_uuid', '_bytes')
     ZERO = None  # Will be initialized after class definition
 
     def __init__(self, value, offset: int = None):
@@ -21,129 +24,69 @@ class CustomUUID:
             self.from_bytes(value, offset)
         elif isinstance(value, uuid.UUID):
             self._uuid = value
+            self._bytes = value.bytes_le
         elif isinstance(value, str):
             self._uuid = uuid.UUID(value)
+            self._bytes = self._uuid.bytes_le
         elif isinstance(value, CustomUUID):
             self._uuid = value._uuid
+            self._bytes = value._bytes
         else:
             raise TypeError(
                 "Invalid type for value. Must be bytes, uuid.UUID, CustomUUID, or str."
             )
 
+    @classmethod
+    def from_buffer(cls, buffer, offset: int = 0) -> 'CustomUUID':
+        """
+        Creates a CustomUUID from 16 wire-order bytes at offset in any bytes-like object
+        (bytes, bytearray or memoryview). Skips the type dispatch in __init__, which makes
+        it the cheaper constructor for packet decoders. The uuid.UUID is not built until needed.
+        """
+        b = bytes(buffer[offset:offset + 16])
+        if len(b) != 16:
+            raise ValueError("Source bytearray is too small.")
+        obj = cls.__new__(cls)
+        obj._bytes = b
+        obj._uuid = None
+        return obj
+
+    def _std_uuid(self) -> uuid.UUID:
+        """Returns the equivalent uuid.UUID, building it from the wire bytes on first use."""
+        u = self._uuid
+        if u is None:
+            u = self._uuid = uuid.UUID(bytes_le=self._bytes)
+        return u
+
     def to_bytes(self, dest_array: bytearray, offset: int):
         """
-        Converts the internal UUID to bytes and places them into dest_array at offset.
-        This method replicates the specific byte ordering from UUID.cs's ToBytes method.
+        Writes the 16-byte wire representation into dest_array at offset.
         """
         if len(dest_array) < offset + 16:
             raise ValueError("Destination bytearray is too small.")
 
-        # uuid.bytes_le is almost what we need, but UUID.cs does a specific shuffle.
-        # The standard .bytes attribute is big-endian.
-        # UUID.cs:
-        # private byte _a; (int)
-        # private byte _b; (short)
-        # private byte _c; (short)
-        # private byte _d;
-        # private byte _e;
-        # private byte _f;
-        # private byte _g;
-        # private byte _h;
-        # private byte _i;
-        # private byte _j;
-        # private byte _k;
-        # network byte order (big-endian) for the first 3 components
-        # then the rest are just bytes
-
-        # Python's uuid.UUID fields:
-        # time_low (unsigned int, 4 bytes)
-        # time_mid (unsigned short, 2 bytes)
-        # time_hi_version (unsigned short, 2 bytes)
-        # clock_seq_hi_variant (unsigned char, 1 byte)
-        # clock_seq_low (unsigned char, 1 byte)
-        # node (unsigned long, 6 bytes)
-
-        # Mapping based on how C# UUID(byte[]) constructor works, which is what ToBytes should be inverse of.
-        # C# UUID(byte[] b)
-        # _a = (int)b[3] << 24 | (int)b[2] << 16 | (int)b[1] << 8 | (int)b[0];
-        # _b = (short)((int)b[5] << 8 | (int)b[4]);
-        # _c = (short)((int)b[7] << 8 | (int)b[6]);
-        # _d = b[8];
-        # _e = b[9];
-        # _f = b[10];
-        # _g = b[11];
-        # _h = b[12];
-        # _i = b[13];
-        # _j = b[14];
-        # _k = b[15];
-
-        # So, ToBytes should write them in this order:
-        # b[0-3] = _a (int, little-endian in array)
-        # b[4-5] = _b (short, little-endian in array)
-        # b[6-7] = _c (short, little-endian in array)
-        # b[8-15] = _d to _k (8 bytes)
-
-        # Get the standard big-endian bytes
-        std_bytes = self._uuid.bytes
-
-        # time_low (first 4 bytes of std_bytes) corresponds to _a, needs to be little-endian
-        dest_array[offset + 0] = std_bytes[3]
-        dest_array[offset + 1] = std_bytes[2]
-        dest_array[offset + 2] = std_bytes[1]
-        dest_array[offset + 3] = std_bytes[0]
-
-        # time_mid (next 2 bytes of std_bytes) corresponds to _b, needs to be little-endian
-        dest_array[offset + 4] = std_bytes[5]
-        dest_array[offset + 5] = std_bytes[4]
-
-        # time_hi_version (next 2 bytes of std_bytes) corresponds to _c, needs to be little-endian
-        dest_array[offset + 6] = std_bytes[7]
-        dest_array[offset + 7] = std_bytes[6]
-
-        # The remaining 8 bytes are copied directly
-        for i in range(8):
-            dest_array[offset + 8 + i] = std_bytes[8 + i]
-
+        # Wire order is uuid.bytes_le (C# UUID.ToBytes layout), cached in self._bytes.
+        dest_array[offset:offset + 16] = self._bytes
 
     def get_bytes(self) -> bytes:
-        """Returns a new 16-byte bytes object by calling to_bytes."""
-        arr = bytearray(16)
-        self.to_bytes(arr, 0)
-        return bytes(arr)
+        """
+        Returns the 16-byte wire representation (same ordering as to_bytes).
+        The value is computed once when the UUID is set and cached, since it is
+        requested for every outgoing packet that carries an agent/session ID.
+        """
+        return self._bytes
 
     def from_bytes(self, source_array: bytes, offset: int):
         """
-        Initializes the UUID from a byte array at a given offset.
-        This method replicates the byte shuffling from UUID.cs's FromBytes/UUID(byte[]) constructor.
+        Initializes the UUID from 16 wire-order bytes in a byte array at a given offset.
         """
         if len(source_array) < offset + 16:
             raise ValueError("Source bytearray is too small.")
 
-        # Read the bytes in the order C# UUID(byte[] b) expects
-        # _a = (int)b[3] << 24 | (int)b[2] << 16 | (int)b[1] << 8 | (int)b[0];
-        # _b = (short)((int)b[5] << 8 | (int)b[4]);
-        # _c = (short)((int)b[7] << 8 | (int)b[6]);
-        # _d = b[8]; ... _k = b[15];
-
-        # These are then used to form the components for uuid.UUID constructor
-        # which expects bytes in big-endian order for its 'bytes' parameter.
-
+        # Wire order is uuid.bytes_le (C# UUID(byte[]) layout), so the bytes are kept as-is.
         b = source_array[offset : offset + 16]
-
-        # Reconstruct the big-endian byte string for uuid.UUID
-        # time_low (from b[0:4] little-endian)
-        # time_mid (from b[4:6] little-endian)
-        # time_hi_version (from b[6:8] little-endian)
-        # clock_seq_hi_res, clock_seq_low, node (from b[8:16] as is)
-
-        reordered_bytes = bytes([
-            b[3], b[2], b[1], b[0],  # time_low
-            b[5], b[4],              # time_mid
-            b[7], b[6],              # time_hi_version
-            b[8], b[9], b[10], b[11], b[12], b[13], b[14], b[15] # rest
-        ])
-        self._uuid = uuid.UUID(bytes=reordered_bytes)
-
+        self._bytes = bytes(b)
+        self._uuid = None # Built by _std_uuid() when needed
 
     def crc(self) -> int:
         """
@@ -221,18 +164,18 @@ class CustomUUID:
 
     def __str__(self) -> str:
         """Returns the hyphenated string form of the UUID."""
-        return str(self._uuid)
+        return str(self._std_uuid())
 
     def __eq__(self, other) -> bool:
         """Checks equality with another CustomUUID or uuid.UUID object."""
         if isinstance(other, CustomUUID):
-            return self._uuid == other._uuid
+            return self._bytes == other._bytes
         if isinstance(other, uuid.UUID):
-            return self._uuid == other
+            return self._bytes == other.bytes_le
         return False
 
     def __hash__(self) -> int:
-        """Returns the hash of the internal uuid.UUID object."""
-        return hash(self._uuid)
+        """Returns the hash of the equivalent uuid.UUID object, so mixed dict keys still match."""
+        return hash(self._std_uuid())
 
 CustomUUID.ZERO = CustomUUID("00000000-0000-0000-0000-000000000000")
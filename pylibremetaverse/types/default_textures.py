@@ -13,6 +13,7 @@ from .custom_uuid import CustomUUID
 # layer defaults aren't critical for initial appearance logic.
 # The "Default System Skin" is a common fallback.
 DEFAULT_SKIN_TEXTURE_GENERAL = CustomUUID("5748decc-f629-461c-9a36-a35a221fe21f")
+DEFAULT_SKIN_TEXTURE = DEFAULT_SKIN_TEXTURE_GENERAL
 
 # Specific default skin parts (can use the general one if specifics are not set)
 DEFAULT_HEAD_SKIN_TEXTURE = DEFAULT_SKIN_TEXTURE_GENERAL
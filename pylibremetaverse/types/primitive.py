@@ -20,19 +20,19 @@ class Primitive:
     parent_id: int = 0 # LocalID of the parent object, 0 if no parent (root prim of an object)
 
     # Basic Properties often included in ObjectUpdate
-    flags: PrimFlags = PrimFlags.None_ # PrimFlags, e.g., Physics, Phantom, CastShadows
-    pcode: PCode = PCode.Primitive # Type of primitive (Box, Sphere, etc.)
+    flags: PrimFlags = PrimFlags.NoneFlag # PrimFlags, e.g., Physics, Phantom, CastShadows
+    pcode: PCode = PCode.Prim # Type of primitive (Box, Sphere, etc.)
 
     # Transform
     position: Vector3 = dataclasses.field(default_factory=Vector3.ZERO)
-    rotation: Quaternion = dataclasses.field(default_factory=Quaternion.Identity)
+    rotation: Quaternion = dataclasses.field(default_factory=Quaternion.identity)
     scale: Vector3 = dataclasses.field(default_factory=lambda: Vector3(0.5, 0.5, 0.5)) # Default size
     velocity: Vector3 = dataclasses.field(default_factory=Vector3.ZERO) # For physics
     acceleration: Vector3 = dataclasses.field(default_factory=Vector3.ZERO)
     angular_velocity: Vector3 = dataclasses.field(default_factory=Vector3.ZERO)
 
     # Appearance and Interaction (Simplified for now)
-    material: Material = Material.STONE # Material type
+    material: Material = Material.Stone # Material type
     click_action: ClickAction = ClickAction.TOUCH # What happens on click
 
     # TextureEntry related (Full TE is complex, placeholder for now)
@@ -98,6 +98,8 @@ class Primitive:
         return (f"<Primitive local_id={self.local_id} id_uuid='{self.id_uuid}' name='{self.name}' "
                 f"pcode={self.pcode} position={self.position} scale={self.scale}>")
 
+MAX_AVATAR_FACES = Primitive.MAX_AVATAR_FACES
+
 
 @dataclasses.dataclass
 class TextureEntryFace:
@@ -146,7 +148,7 @@ class TextureEntryFace:
             return None # Not enough data
 
         face = cls()
-        face.texture_id = CustomUUID(data, offset); offset += 16
+        face.texture_id = CustomUUID.from_buffer(data, offset); offset += 16
 
         r = data[offset]; g = data[offset+1]; b = data[offset+2]; a = data[offset+3]; offset += 4
         face.color = Color4(float(r)/255.0, float(g)/255.0, float(b)/255.0, float(a)/255.0)
@@ -267,9 +269,9 @@ class TextureEntry:
             # This structure is more for object_update.
             # For now, let's assume the AppearanceManager will call this with a small max_faces_to_serialize
             # or this structure is primarily for prims, not avatar appearance TEs.
-        pass # Keep current behavior for prim TE to_bytes
+            pass # Keep current behavior for prim TE to_bytes
 
-    return bytes(data)
+        return bytes(data)
 
     def to_avatar_appearance_bytes(self, default_textures_map: dict[int, CustomUUID]) -> bytes:
         """
@@ -217,6 +217,7 @@ class Quaternion:
         return Quaternion(x, y, z, w)
 
 Quaternion.ZERO = Quaternion(0.0, 0.0, 0.0, 0.0) # Added for completeness
+Quaternion.Identity = Quaternion.identity()
 
 # Example Usage & Basic Tests (from my draft, slightly expanded)
 if __name__ == '__main__':
@@ -0,0 +1,237 @@
+"""
+Zero-coding for LLUDP packets.
+
+Ports of the C# Helpers.ZeroEncode and Helpers.ZeroDecode methods. Runs of 0x00 bytes
+are transmitted as a 0x00 marker followed by a one-byte run length; the first 6 bytes of
+a message (the 4-byte header plus the extra header) are never zero-coded, and neither
+are ACKs appended to the end of a message.
+
+When Numba is installed the encode and decode loops are compiled to native code.
+Otherwise pure-Python implementations are used that copy whole non-zero runs with slice
+assignment (located via bytes.find) instead of iterating byte by byte.
+"""
+
+import re
+
+try:
+    import numba
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    numba = None
+    np = None
+
+ZEROCODE_PREFIX_SIZE = 6 # Leading bytes that are never zero-coded
+_ZERO_RUN = memoryview(bytes(255)) # Longest run a single 0x00 marker can expand to
+_ZERO_RUN_RE = re.compile(b'\x00{1,255}') # Longest run a single 0x00 marker can encode
+_APPENDED_ACKS_FLAG = 0x10 # PacketFlags.ACK (MSG_APPENDED_ACKS)
+
+
+def _zero_decode_kernel(src, dest) -> int:
+    """Byte-at-a-time decode loop over uint8 arrays; compiled with Numba when available."""
+    srclen = len(src)
+    destlen = len(dest)
+    if srclen <= 6:
+        if srclen > destlen: return 0
+        for i in range(srclen): dest[i] = src[i]
+        return srclen
+    if destlen < 6: return 0
+    for i in range(6): dest[i] = src[i]
+    destoff = 6
+    srciter = 6
+    while srciter < srclen:
+        if destoff >= destlen: return 0
+        if src[srciter] == 0:
+            srciter += 1
+            if srciter >= srclen: return 0 # Truncated run marker
+            zeros = src[srciter]
+            if destoff + zeros > destlen: return 0
+            for _ in range(zeros):
+                dest[destoff] = 0
+                destoff += 1
+        else:
+            dest[destoff] = src[srciter]
+            destoff += 1
+        srciter += 1
+    return destoff
+
+
+def _zero_decode_py(src, dest) -> int:
+    """Pure-Python decode that copies each non-zero run in a single slice assignment."""
+    if isinstance(src, memoryview): src = src.tobytes()
+    srclen = len(src)
+    destlen = len(dest)
+    if srclen <= ZEROCODE_PREFIX_SIZE:
+        if srclen > destlen: return 0
+        dest[:srclen] = src
+        return srclen
+    if destlen < ZEROCODE_PREFIX_SIZE: return 0
+    dest[:ZEROCODE_PREFIX_SIZE] = src[:ZEROCODE_PREFIX_SIZE]
+
+    src_mv = memoryview(src)
+    destoff = ZEROCODE_PREFIX_SIZE
+    srciter = ZEROCODE_PREFIX_SIZE
+    while srciter < srclen:
+        zero_idx = src.find(b'\x00', srciter)
+        if zero_idx == -1: zero_idx = srclen
+        run = zero_idx - srciter
+        if run:
+            if destoff + run > destlen: return 0
+            dest[destoff:destoff + run] = src_mv[srciter:zero_idx]
+            destoff += run
+        if zero_idx >= srclen: break
+        if destoff >= destlen: return 0 # Dest is full but input remains, as the kernel rejects it
+        if zero_idx + 1 >= srclen: return 0 # Truncated run marker
+        zeros = src[zero_idx + 1]
+        if destoff + zeros > destlen: return 0
+        dest[destoff:destoff + zeros] = _ZERO_RUN[:zeros]
+        destoff += zeros
+        srciter = zero_idx + 2
+    return destoff
+
+
+def _zero_encode_kernel(src, dest) -> int:
+    """Byte-at-a-time encode loop over uint8 arrays; compiled with Numba when available."""
+    srclen = len(src)
+    destlen = len(dest)
+    if srclen == 0: return 0
+    if srclen <= 6:
+        if srclen > destlen: return 0
+        for i in range(srclen): dest[i] = src[i]
+        return srclen
+    if destlen < 6: return 0
+    for i in range(6): dest[i] = src[i]
+    # Appended ACKs (u32 sequence numbers plus a trailing count byte) are copied verbatim
+    bodylen = srclen
+    if src[0] & 0x10:
+        num_acks = src[srclen - 1]
+        if num_acks > 0: bodylen = max(6, srclen - num_acks * 4 - 1)
+    destoff = 6
+    srciter = 6
+    while srciter < bodylen:
+        if src[srciter] == 0:
+            zeros = 0
+            while srciter < bodylen and src[srciter] == 0 and zeros < 255:
+                zeros += 1
+                srciter += 1
+            if destoff + 2 > destlen: return 0
+            dest[destoff] = 0
+            dest[destoff + 1] = zeros
+            destoff += 2
+        else:
+            if destoff >= destlen: return 0
+            dest[destoff] = src[srciter]
+            destoff += 1
+            srciter += 1
+    remaining = srclen - bodylen
+    if destoff + remaining > destlen: return 0
+    for i in range(remaining): dest[destoff + i] = src[bodylen + i]
+    return destoff + remaining
+
+
+def _zero_encode_py(src, dest) -> int:
+    """Pure-Python encode that copies each non-zero run in a single slice assignment."""
+    if isinstance(src, memoryview): src = src.tobytes()
+    srclen = len(src)
+    destlen = len(dest)
+    if srclen == 0: return 0
+    if srclen <= ZEROCODE_PREFIX_SIZE:
+        if srclen > destlen: return 0
+        dest[:srclen] = src
+        return srclen
+    if destlen < ZEROCODE_PREFIX_SIZE: return 0
+    dest[:ZEROCODE_PREFIX_SIZE] = src[:ZEROCODE_PREFIX_SIZE]
+    # Appended ACKs (u32 sequence numbers plus a trailing count byte) are copied verbatim
+    bodylen = srclen
+    if src[0] & _APPENDED_ACKS_FLAG and src[-1]:
+        bodylen = max(ZEROCODE_PREFIX_SIZE, srclen - src[-1] * 4 - 1)
+
+    src_mv = memoryview(src)
+    destoff = ZEROCODE_PREFIX_SIZE
+    srciter = ZEROCODE_PREFIX_SIZE
+    while srciter < bodylen:
+        zero_idx = src.find(b'\x00', srciter, bodylen)
+        if zero_idx == -1: zero_idx = bodylen
+        run = zero_idx - srciter
+        if run:
+            if destoff + run > destlen: return 0
+            dest[destoff:destoff + run] = src_mv[srciter:zero_idx]
+            destoff += run
+        if zero_idx >= bodylen: break
+        srciter = _ZERO_RUN_RE.match(src, zero_idx, bodylen).end()
+        if destoff + 2 > destlen: return 0
+        dest[destoff] = 0
+        dest[destoff + 1] = srciter - zero_idx
+        destoff += 2
+    remaining = srclen - bodylen
+    if destoff + remaining > destlen: return 0
+    dest[destoff:destoff + remaining] = src_mv[bodylen:]
+    return destoff + remaining
+
+
+if numba is not None:
+    _zero_decode_native = numba.njit(cache=True, boundscheck=False)(_zero_decode_kernel)
+    _zero_encode_native = numba.njit(cache=True, boundscheck=False)(_zero_encode_kernel)
+
+    def zero_decode(src, dest) -> int:
+        """
+        Performs zero-coding decompression on a byte array.
+        Operates on the FULL packet data (header + body).
+
+        Args:
+            src: The zero-coded source packet (any bytes-like object).
+            dest: A pre-allocated writable buffer (bytearray or uint8 ndarray) for the
+                  decompressed data. Should be large enough (e.g., MAX_PACKET_SIZE).
+
+        Returns:
+            The actual length of the decompressed data, or 0 if the source is malformed
+            or the result does not fit in dest.
+        """
+        if not isinstance(dest, np.ndarray): dest = np.frombuffer(dest, dtype=np.uint8)
+        return _zero_decode_native(np.frombuffer(src, dtype=np.uint8), dest)
+
+    def zero_encode(src, dest) -> int:
+        """
+        Performs zero-coding compression on a byte array.
+        Operates on the FULL packet data (header + body).
+
+        Args:
+            src: The full unencoded packet (any bytes-like object).
+            dest: A pre-allocated writable buffer (bytearray or uint8 ndarray) for the
+                  compressed data. Should be at least len(src) + some overhead, or MAX_PACKET_SIZE.
+
+        Returns:
+            The actual length written to dest, or 0 if the result does not fit.
+        """
+        if not isinstance(dest, np.ndarray): dest = np.frombuffer(dest, dtype=np.uint8)
+        return _zero_encode_native(np.frombuffer(src, dtype=np.uint8), dest)
+else:
+    def zero_decode(src, dest) -> int:
+        """
+        Performs zero-coding decompression on a byte array.
+        Operates on the FULL packet data (header + body).
+
+        Args:
+            src: The zero-coded source packet (any bytes-like object).
+            dest: A pre-allocated bytearray for the decompressed data.
+                  Should be large enough (e.g., MAX_PACKET_SIZE).
+
+        Returns:
+            The actual length of the decompressed data, or 0 if the source is malformed
+            or the result does not fit in dest.
+        """
+        return _zero_decode_py(src, dest)
+
+    def zero_encode(src, dest) -> int:
+        """
+        Performs zero-coding compression on a byte array.
+        Operates on the FULL packet data (header + body).
+
+        Args:
+            src: The full unencoded packet (any bytes-like object).
+            dest: A pre-allocated bytearray for the compressed data.
+                  Should be at least len(src) + some overhead, or MAX_PACKET_SIZE.
+
+        Returns:
+            The actual length written to dest, or 0 if the result does not fit.
+        """
+        return _zero_encode_py(src, dest)
@@ -16,88 +16,101 @@ EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
 
 # --- Byte/Numeric Conversion Functions (Little Endian default) ---
 
+# Precompiled layouts for the scalar conversions below; they are called for most packet fields.
+_INT16 = struct.Struct('<h')
+_UINT16 = struct.Struct('<H')
+_INT32 = struct.Struct('<i')
+_UINT32 = struct.Struct('<I')
+_INT64 = struct.Struct('<q')
+_UINT64 = struct.Struct('<Q')
+_FLOAT = struct.Struct('<f')
+_DOUBLE = struct.Struct('<d')
+_UINT16_BE = struct.Struct('>H')
+_UINT32_BE = struct.Struct('>I')
+_UINT64_BE = struct.Struct('>Q')
+
 def bytes_to_int16(data: bytes, offset: int = 0) -> int:
     """Converts 2 bytes (little endian) to a signed 16-bit integer."""
-    return struct.unpack_from('<h', data, offset)[0]
+    return _INT16.unpack_from(data, offset)[0]
 
 def bytes_to_uint16(data: bytes, offset: int = 0) -> int:
     """Converts 2 bytes (little endian) to an unsigned 16-bit integer."""
-    return struct.unpack_from('<H', data, offset)[0]
+    return _UINT16.unpack_from(data, offset)[0]
 
 def bytes_to_int32(data: bytes, offset: int = 0) -> int:
     """Converts 4 bytes (little endian) to a signed 32-bit integer."""
-    return struct.unpack_from('<i', data, offset)[0]
+    return _INT32.unpack_from(data, offset)[0]
 
 def bytes_to_uint32(data: bytes, offset: int = 0) -> int:
     """Converts 4 bytes (little endian) to an unsigned 32-bit integer."""
-    return struct.unpack_from('<I', data, offset)[0]
+    return _UINT32.unpack_from(data, offset)[0]
 
 def bytes_to_int64(data: bytes, offset: int = 0) -> int:
     """Converts 8 bytes (little endian) to a signed 64-bit integer."""
-    return struct.unpack_from('<q', data, offset)[0]
+    return _INT64.unpack_from(data, offset)[0]
 
 def bytes_to_uint64(data: bytes, offset: int = 0) -> int:
     """Converts 8 bytes (little endian) to an unsigned 64-bit integer."""
-    return struct.unpack_from('<Q', data, offset)[0]
+    return _UINT64.unpack_from(data, offset)[0]
 
 def bytes_to_float(data: bytes, offset: int = 0) -> float:
     """Converts 4 bytes (little endian) to a single-precision float."""
-    return struct.unpack_from('<f', data, offset)[0]
+    return _FLOAT.unpack_from(data, offset)[0]
 
 def bytes_to_double(data: bytes, offset: int = 0) -> float:
     """Converts 8 bytes (little endian) to a double-precision float."""
-    return struct.unpack_from('<d', data, offset)[0]
+    return _DOUBLE.unpack_from(data, offset)[0]
 
 def int16_to_bytes(value: int) -> bytes:
     """Converts a signed 16-bit integer to 2 bytes (little endian)."""
-    return struct.pack('<h', value)
+    return _INT16.pack(value)
 
 def uint16_to_bytes(value: int) -> bytes:
     """Converts an unsigned 16-bit integer to 2 bytes (little endian)."""
-    return struct.pack('<H', value)
+    return _UINT16.pack(value)
 
 def int32_to_bytes(value: int) -> bytes:
     """Converts a signed 32-bit integer to 4 bytes (little endian)."""
-    return struct.pack('<i', value)
+    return _INT32.pack(value)
 
 def uint32_to_bytes(value: int) -> bytes:
     """Converts an unsigned 32-bit integer to 4 bytes (little endian)."""
-    return struct.pack('<I', value)
+    return _UINT32.pack(value)
 
 def int64_to_bytes(value: int) -> bytes:
     """Converts a signed 64-bit integer to 8 bytes (little endian)."""
-    return struct.pack('<q', value)
+    return _INT64.pack(value)
 
 def uint64_to_bytes(value: int) -> bytes:
     """Converts an unsigned 64-bit integer to 8 bytes (little endian)."""
-    return struct.pack('<Q', value)
+    return _UINT64.pack(value)
 
 def float_to_bytes(value: float) -> bytes:
     """Converts a single-precision float to 4 bytes (little endian)."""
-    return struct.pack('<f', value)
+    return _FLOAT.pack(value)
 
 def double_to_bytes(value: float) -> bytes:
     """Converts a double-precision float to 8 bytes (little endian)."""
-    return struct.pack('<d', value)
+    return _DOUBLE.pack(value)
 
 # Big Endian versions
 def bytes_to_uint16_big_endian(data: bytes, offset: int = 0) -> int:
-    return struct.unpack_from('>H', data, offset)[0]
+    return _UINT16_BE.unpack_from(data, offset)[0]
 
 def uint16_to_bytes_big_endian(value: int) -> bytes:
-    return struct.pack('>H', value)
+    return _UINT16_BE.pack(value)
 
 def bytes_to_uint32_big_endian(data: bytes, offset: int = 0) -> int:
-    return struct.unpack_from('>I', data, offset)[0]
+    return _UINT32_BE.unpack_from(data, offset)[0]
 
 def uint32_to_bytes_big_endian(value: int) -> bytes:
-    return struct.pack('>I', value)
+    return _UINT32_BE.pack(value)
 
 def bytes_to_uint64_big_endian(data: bytes, offset: int = 0) -> int:
-    return struct.unpack_from('>Q', data, offset)[0]
+    return _UINT64_BE.unpack_from(data, offset)[0]
 
 def uint64_to_bytes_big_endian(value: int) -> bytes:
-    return struct.pack('>Q', value)
+    return _UINT64_BE.pack(value)
 
 
 # --- String Conversion Functions ---
@@ -132,6 +145,20 @@ def bytes_to_string(data: bytes, offset: int = 0, length: int = -1) -> str:
         return actual_data.decode('utf-8', errors='replace')
 
 
+def read_null_terminated_bytes(data: bytes, offset: int = 0, max_length: int = -1) -> tuple[bytes, int]:
+    """
+    Reads a null-terminated byte string starting at offset.
+    Returns the bytes (without the terminator) and the number of bytes consumed, including
+    the terminator. If no terminator is found within max_length (or before the end of data),
+    the remaining bytes are returned with -1 as the count, so callers can reject or
+    special-case a truncated string.
+    """
+    end = len(data) if max_length < 0 else min(len(data), offset + max_length)
+    null_idx = data.find(b'\x00', offset, end)
+    if null_idx == -1:
+        return data[offset:end], -1
+    return data[offset:null_idx], null_idx - offset + 1
+
 def string_to_bytes(s: str, add_null_terminator: bool = True) -> bytes:
     """Encodes a string to UTF-8 bytes, optionally adding a null terminator."""
     b = s.encode('utf-8')
@@ -291,175 +318,3 @@ def approximately_equal(a: float, b: float, tolerance: float = 1e-6) -> bool:
     """Checks if two floats are approximately equal within a tolerance."""
     return abs(a - b) < tolerance
 
-
-# --- Zero Coding (Placeholders) ---
-
-def zero_encode(data: bytes) -> bytes:
-    """
-    Performs zero-coding compression on a byte array.
-    Placeholder: Returns original data. Actual implementation is complex.
-    See LibreMetaverse.Utils.ZeroEncode for reference.
-    """
-    # TODO: Implement actual zero-coding
-    return data
-
-def zero_decode(data: bytes, data_length: int, decompressed_buffer: bytearray) -> int:
-    """
-    Performs zero-coding decompression on a byte array.
-    Placeholder: Copies original data. Actual implementation is complex.
-    Args:
-        data: The zero-coded byte array.
-        data_length: The length of the data to decode from the source 'data' buffer.
-        decompressed_buffer: A pre-allocated bytearray to store the decompressed data.
-                             This buffer should be large enough (e.g., MAX_PACKET_SIZE).
-    Returns:
-        The actual length of the decompressed data.
-    See LibreMetaverse.Utils.ZeroDecode for reference.
-    """
-    # TODO: Implement actual zero-decoding
-    # Basic placeholder: copy data if it fits, assuming no actual compression/expansion.
-    # This is NOT a correct zero-decode implementation.
-    if data_length > len(decompressed_buffer): # Ensure we don't write past the end of source 'data' either
-        # This check is more about the source 'data' vs 'data_length'
-        raise ValueError("data_length exceeds source data buffer size, or decompressed_buffer is too small.")
-
-    if data_length > 0 : # Ensure there is data to copy
-        decompressed_buffer[:data_length] = data[:data_length]
-    return data_length
-
-
-def zero_encode(src: bytes, dest: bytearray) -> int:
-    """
-    Performs zero-coding compression on a byte array.
-    This is a port of the C# Helpers.ZeroEncode method.
-    Operates on the FULL packet data (header + body).
-
-    Args:
-        src: The source byte array (full packet data).
-        dest: A pre-allocated bytearray to store the compressed data.
-              Should be at least len(src) + some overhead, or MAX_PACKET_SIZE.
-
-    Returns:
-        The actual length written to dest_bytearray.
-    """
-    srclen = len(src)
-    if srclen == 0:
-        return 0
-
-    # The MSG_APPENDED_ACKS flag (0x10) is PacketFlags.ACK
-    # It indicates that the last byte of the packet payload (before this encoding)
-    # specifies the number of ACKs appended to this packet.
-    # Each ACK is 4 bytes (a u32 sequence number).
-    # This bodylen calculation is specific to how packet ACKs are appended
-    # *before* zero-coding is applied to the entire packet.
-    bodylen = srclen
-    if (src[0] & 0x10): # PacketFlags.ACK / MSG_APPENDED_ACKS
-        # Number of appended ACKs is in the last byte of the unencoded message
-        num_acks = src[srclen - 1]
-        if num_acks > 0:
-             bodylen = srclen - (num_acks * 4) - 1
-             # num_acks * 4 for the ACK data, -1 for the byte storing num_acks itself.
-
-    destoff = 0 # Current offset in destination buffer
-
-    # The first 6 bytes of a message are never zero-coded
-    # This typically includes the 4-byte header and first 2 bytes of payload.
-    # If srclen is less than 6, then the whole message is copied.
-    if srclen <= 6:
-        if srclen > len(dest): return 0 # Not enough space in dest
-        dest[:srclen] = src[:srclen]
-        return srclen
-
-    if len(dest) < 6: return 0 # Not enough space for even the initial copy
-    dest[:6] = src[:6]
-    destoff = 6
-
-    # Zero-code the rest of the message
-    srciter = 6 # Start iterating from the 7th byte of source
-
-    while srciter < srclen:
-        if destoff >= len(dest): return 0 # Ran out of space in dest
-
-        if src[srciter] == 0x00:
-            # Count zeroes
-            zeros = 0
-            while srciter < srclen and src[srciter] == 0x00 and zeros < 255:
-                zeros += 1
-                srciter += 1
-
-            if destoff + 2 > len(dest): return 0 # Not enough space for 0x00 and zero count
-            dest[destoff] = 0x00
-            dest[destoff+1] = zeros & 0xFF # Store count as byte
-            destoff += 2
-        else:
-            # Copy non-zero byte
-            dest[destoff] = src[srciter]
-            destoff += 1
-            srciter += 1
-
-            # Check if this is the start of the appended ACKs block
-            # If MSG_APPENDED_ACKS is set and we've reached the bodylen,
-            # the rest of the message is copied verbatim (these are the ACKs)
-            if srciter == bodylen and (src[0] & 0x10): # MSG_APPENDED_ACKS
-                remaining = srclen - srciter
-                if destoff + remaining > len(dest): return 0 # Not enough space
-                dest[destoff : destoff + remaining] = src[srciter : srclen]
-                destoff += remaining
-                srciter += remaining # Should break the loop
-                break
-
-    return destoff
-
-
-def zero_decode(src: bytes, dest: bytearray) -> int:
-    """
-    Performs zero-coding decompression on a byte array.
-    This is a port of the C# Helpers.ZeroDecode method.
-    Operates on the FULL packet data.
-
-    Args:
-        src: The zero-coded source byte array (full packet data).
-        dest: A pre-allocated bytearray to store the decompressed data.
-              Should be large enough (e.g., MAX_PACKET_SIZE).
-
-    Returns:
-        The actual length of the decompressed data.
-    """
-    srclen = len(src)
-    destoff = 0 # Current offset in destination buffer
-    srciter = 0 # Current offset in source buffer
-
-    # The first 6 bytes of a message are never zero-coded
-    if srclen <= 6:
-        if srclen > len(dest): return 0
-        dest[:srclen] = src[:srclen]
-        return srclen
-
-    if len(dest) < 6: return 0
-    dest[:6] = src[:6]
-    destoff = 6
-    srciter = 6
-
-    while srciter < srclen:
-        if destoff >= len(dest): return 0 # Ran out of space in dest
-
-        if src[srciter] == 0x00:
-            srciter += 1
-            if srciter >= srclen: # Should not happen with valid encoding
-                # This means a 0x00 was the last byte, which is an invalid sequence.
-                # Or, source was truncated.
-                return 0 # Error condition
-
-            zeros = src[srciter] & 0xFF
-            if destoff + zeros > len(dest): return 0 # Not enough space for all zeroes
-
-            for _ in range(zeros):
-                dest[destoff] = 0x00
-                destoff += 1
-        else:
-            dest[destoff] = src[srciter]
-            destoff += 1
-
-        srciter += 1
-
-    return destoff
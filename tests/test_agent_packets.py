@@ -0,0 +1,20 @@
+import os
+import sys
+import uuid
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pylibremetaverse.network.packets_agent import AgentAnimationListBlock, AgentAnimationPacket
+from pylibremetaverse.types import CustomUUID
+
+AGENT_ID = CustomUUID(uuid.UUID(int=1))
+SESSION_ID = CustomUUID(uuid.UUID(int=2))
+
+
+def test_agent_animation_start_flags():
+    start, stop = CustomUUID(uuid.UUID(int=3)), CustomUUID(uuid.UUID(int=4))
+    packet = AgentAnimationPacket(AGENT_ID, SESSION_ID, {start: True, stop: False})
+    assert packet.animation_list == [AgentAnimationListBlock(start, True), AgentAnimationListBlock(stop, False)]
+    assert packet.to_bytes() == (AGENT_ID.get_bytes() + SESSION_ID.get_bytes() + b'\x02'
+                                 + start.get_bytes() + b'\x01' + stop.get_bytes() + b'\x00'
+                                 + b'\x00') # Empty PhysicalAvatarEventList
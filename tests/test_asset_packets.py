@@ -0,0 +1,39 @@
+import os
+import struct
+import sys
+import uuid
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pylibremetaverse.network.packets_asset import AssetUploadRequestPacket, RequestXferPacket, SendXferPacket
+from pylibremetaverse.types import CustomUUID
+from pylibremetaverse.types.enums import AssetType
+
+TRANSACTION_ID = CustomUUID(uuid.UUID(int=0xABCDEF))
+
+
+def test_request_xfer_to_bytes():
+    packet = RequestXferPacket(filename="file.tmp", vfile_id=TRANSACTION_ID, vfile_type=AssetType.Texture)
+    packet.xfer_id = 42
+    data = packet.to_bytes()
+    assert type(data) is bytes
+    assert data == struct.pack('<Q16sh', 42, TRANSACTION_ID.get_bytes(), AssetType.Texture.value) + b'file.tmp\0'
+
+
+def test_send_xfer_to_bytes():
+    assert SendXferPacket(7, 3).to_bytes() == struct.pack('<QI', 7, 3)
+    for chunk in (b'abc', bytearray(b'abc'), memoryview(b'abc')):
+        data = SendXferPacket(7, 0x80000003, chunk).to_bytes()
+        assert type(data) is bytes
+        assert data == struct.pack('<QI', 7, 0x80000003) + b'abc'
+
+
+def test_asset_upload_request_to_bytes():
+    payload = bytearray(b'\x01\x02\x03\x04')
+    packet = AssetUploadRequestPacket(TRANSACTION_ID, AssetType.Notecard, len(payload), True, False, True, payload)
+    data = packet.to_bytes()
+    assert type(data) is bytes
+    assert data == (struct.pack('<16sB???iI', TRANSACTION_ID.get_bytes(), AssetType.Notecard.value,
+                                True, False, True, 4, 4) + payload)
+    empty = AssetUploadRequestPacket(TRANSACTION_ID, AssetType.Notecard, 0, False, False, False, None).to_bytes()
+    assert empty[-4:] == b'\0\0\0\0' and len(empty) == 28
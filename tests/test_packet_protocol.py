@@ -0,0 +1,67 @@
+import asyncio
+import os
+import struct
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pylibremetaverse.network.packet_protocol import IncomingPacket, PacketProtocol
+from pylibremetaverse.network.packets_asset import ImageNotInDatabasePacket
+from pylibremetaverse.utils import zero_encode
+
+IMAGE_ID = bytes(range(1, 17))
+IMAGE_NOT_IN_DATABASE = b'\xff\xff\xff\x56' + IMAGE_ID
+
+
+def _make_protocol():
+    settings = SimpleNamespace(MAX_PACKET_SIZE=1200, track_utilization=False)
+    sim = SimpleNamespace(client=SimpleNamespace(settings=settings, stats=None), connected=True,
+                          need_ack={}, acks=[], name="sim",
+                          network_manager=SimpleNamespace(packet_inbox=asyncio.Queue()))
+    sim.queue_ack = sim.acks.append
+    return PacketProtocol(sim), sim
+
+
+def _received(sim):
+    inbox = sim.network_manager.packet_inbox
+    return [inbox.get_nowait() for _ in range(inbox.qsize())]
+
+
+def test_datagram_reaches_packet_inbox():
+    protocol, sim = _make_protocol()
+    protocol.datagram_received(struct.pack('>I', 5) + IMAGE_NOT_IN_DATABASE, ("127.0.0.1", 9000))
+    received = _received(sim)
+    assert len(received) == 1
+    assert isinstance(received[0], IncomingPacket)
+    assert received[0].simulator is sim
+    packet = received[0].packet
+    assert isinstance(packet, ImageNotInDatabasePacket)
+    assert packet.id.get_bytes() == IMAGE_ID
+    assert packet.header.sequence == 5
+    assert sim.acks == []
+
+
+def test_reliable_zerocoded_datagram():
+    protocol, sim = _make_protocol()
+    flags = 0x80 | 0x40 # ZEROCODED | RELIABLE
+    body = b'\xff\xff\xff\x56' + bytes(16) # Zero image ID, so the body is actually zero-coded
+    datagram = bytearray(64)
+    n = zero_encode(struct.pack('>I', (flags << 24) | 7) + body, datagram)
+    assert n < 4 + len(body)
+    protocol.datagram_received(bytes(datagram[:n]), ("127.0.0.1", 9000))
+    received = _received(sim)
+    assert len(received) == 1
+    assert received[0].packet.id.get_bytes() == bytes(16)
+    assert sim.acks == [7]
+
+
+def test_appended_acks_are_stripped_before_deserializing():
+    protocol, sim = _make_protocol()
+    sim.need_ack.update({3: None, 4: None, 9: None})
+    datagram = struct.pack('>I', (0x10 << 24) | 8) + IMAGE_NOT_IN_DATABASE + struct.pack('<II', 3, 4) + b'\x02'
+    protocol.datagram_received(datagram, ("127.0.0.1", 9000))
+    received = _received(sim)
+    assert len(received) == 1
+    assert received[0].packet.id.get_bytes() == IMAGE_ID
+    assert list(sim.need_ack) == [9]
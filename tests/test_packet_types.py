@@ -0,0 +1,55 @@
+import enum
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pytest
+
+from pylibremetaverse.network import packet_factory
+from pylibremetaverse.network.packets_asset import ImageDataPacket, ImageNotInDatabasePacket
+from pylibremetaverse.network.packets_base import PacketHeader, PacketType
+from pylibremetaverse.network.packets_group import AgentGroupDataUpdatePacket
+
+HIGH_FREQ = 0x10000
+TABLES = {
+    "low": packet_factory._LOW_FREQ_PACKETS,
+    "medium": packet_factory._MEDIUM_FREQ_PACKETS,
+    "high": packet_factory._HIGH_FREQ_PACKETS,
+}
+CLASS_NAME_EXCEPTIONS = {PacketType.PacketAck: "AckPacket"}
+
+
+def test_packet_type_is_unique():
+    assert len(PacketType.__members__) == len(PacketType) # No member is an alias of another
+    enum.unique(PacketType)
+
+
+def test_examples():
+    assert PacketType.ImageNotInDatabase == 86
+    assert packet_factory._LOW_FREQ_PACKETS[0x56] == (ImageNotInDatabasePacket, PacketType.ImageNotInDatabase)
+    assert PacketType.ImageData == 0x1001A
+    assert packet_factory._HIGH_FREQ_PACKETS[0x1A] == (ImageDataPacket, PacketType.ImageData)
+
+
+@pytest.mark.parametrize("frequency,wire_id", [(f, k) for f, table in TABLES.items() for k in table])
+def test_dispatch_table_entry(frequency, wire_id):
+    packet_class, packet_type = TABLES[frequency][wire_id]
+    assert isinstance(packet_type, PacketType)
+    assert packet_type & 0xFF == wire_id
+    assert bool(packet_type & HIGH_FREQ) == (frequency == "high")
+    expected_name = packet_type.name if packet_type.name.endswith("Packet") else packet_type.name + "Packet"
+    assert packet_class.__name__ == CLASS_NAME_EXCEPTIONS.get(packet_type, expected_name)
+
+
+def test_factory_builds_packet_of_the_mapped_type():
+    image_id = bytes(range(16))
+    packet = packet_factory.from_bytes(b'\xff\xff\xff\x56' + image_id, PacketHeader(sequence=3))
+    assert isinstance(packet, ImageNotInDatabasePacket)
+    assert packet.type is PacketType.ImageNotInDatabase
+    assert packet.id.get_bytes() == image_id
+    assert packet.header.sequence == 3
+
+
+def test_agent_group_data_update_reports_its_type():
+    assert AgentGroupDataUpdatePacket(header=PacketHeader()).type is PacketType.AgentGroupDataUpdate
@@ -0,0 +1,47 @@
+import os
+import struct
+import sys
+import uuid
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pytest
+
+from pylibremetaverse.network.packets_asset import RequestImagePacket
+from pylibremetaverse.types import CustomUUID
+
+AGENT_ID = CustomUUID(uuid.UUID(int=0x0102030405060708090A0B0C0D0E0F10))
+SESSION_ID = CustomUUID(uuid.UUID(int=0x1112131415161718191A1B1C1D1E1F20))
+AGENT_SESSION = AGENT_ID.get_bytes() + SESSION_ID.get_bytes()
+
+
+def _request(i):
+    return {'Image': CustomUUID(uuid.UUID(int=i + 1)), 'Type': i % 3, 'DiscardLevel': i % 6,
+            'DownloadPriority': float(i), 'Packet': i * 7, 'ExtraInfo': i * 11}
+
+
+def _block(i):
+    # RequestImage block: Image(16), Type(u8), DiscardLevel(i8), DownloadPriority(f32), Packet(u32), ExtraInfo(u32)
+    return uuid.UUID(int=i + 1).bytes + bytes((i % 3, i % 6)) + struct.pack('<fII', float(i), i * 7, i * 11)
+
+
+@pytest.mark.parametrize("count", [0, 1, 2, 255])
+def test_to_bytes_layout(count):
+    packet = RequestImagePacket(AGENT_ID, SESSION_ID, [_request(i) for i in range(count)])
+    data = packet.to_bytes()
+    assert data == AGENT_SESSION + bytes((count,)) + b''.join(_block(i) for i in range(count))
+    assert len(data) == 33 + 30 * count
+
+
+def test_to_bytes_trims_to_255_blocks():
+    packet = RequestImagePacket(AGENT_ID, SESSION_ID, [_request(i) for i in range(300)])
+    data = packet.to_bytes()
+    assert data == AGENT_SESSION + b'\xff' + b''.join(_block(i) for i in range(255))
+
+
+@pytest.mark.parametrize("count", [0, 1, 3])
+def test_to_bytes_uses_agent_session_bytes(count):
+    pre_packed = bytes(range(100, 132))
+    packet = RequestImagePacket(CustomUUID.ZERO, CustomUUID.ZERO, [_request(i) for i in range(count)],
+                                agent_session_bytes=pre_packed)
+    assert packet.to_bytes() == pre_packed + bytes((count,)) + b''.join(_block(i) for i in range(count))
@@ -0,0 +1,77 @@
+import asyncio
+import os
+import sys
+from collections import Counter
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pylibremetaverse.network import simulator
+from pylibremetaverse.network.packets_base import PacketHeader
+from pylibremetaverse.network.packets_control import LogoutRequestPacket
+from pylibremetaverse.types import CustomUUID
+
+RESEND_TIMEOUT_MS = 30 # Fake-clock base timeout is 3x this, 0.09s; the loop sleeps 10ms between passes
+MAX_RESENDS = 3
+
+
+def _make_sim(monkeypatch, clock):
+    settings = SimpleNamespace(resend_timeout=RESEND_TIMEOUT_MS, max_resend_count=MAX_RESENDS,
+                               MAX_SEQUENCE=0xFFFFFF, MAX_PACKET_SIZE=1200, track_utilization=False)
+    network_manager = SimpleNamespace(client=SimpleNamespace(settings=settings, stats=None))
+    sim = simulator.Simulator(network_manager, "127.0.0.1", 9000, 0, 256, 256)
+    sent = Counter()
+    sim.transport = SimpleNamespace(sendto=lambda data: sent.update([PacketHeader.from_bytes(data).sequence]))
+    sim.connected = True
+    # Only the simulator's clock is faked; the event loop keeps using the real one.
+    monkeypatch.setattr(simulator, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    return sim, sent
+
+
+async def _let_loop_run():
+    await asyncio.sleep(0.05)
+
+
+def test_resend_loop_keeps_send_order_and_gives_up(monkeypatch):
+    async def run_test():
+        clock = [100.0]
+        sim, sent = _make_sim(monkeypatch, clock)
+        first = LogoutRequestPacket(CustomUUID.ZERO, CustomUUID.ZERO)
+        second = LogoutRequestPacket(CustomUUID.ZERO, CustomUUID.ZERO)
+        await sim.send_packet(first)
+        clock[0] = 100.05
+        await sim.send_packet(second)
+        a, b = first.header.sequence, second.header.sequence
+        assert list(sim.need_ack) == [a, b]
+
+        task = asyncio.create_task(sim._resend_loop())
+        try:
+            # Only the first packet has expired; its resend moves it behind the second one.
+            clock[0] = 100.1
+            await _let_loop_run()
+            assert sent == {a: 2, b: 1}
+            assert list(sim.need_ack) == [b, a]
+            assert sim.need_ack[a][2] == 1
+
+            # The second packet expires while the first, just resent, is still fresh.
+            # It must not be starved by the fresh entry.
+            clock[0] = 100.16
+            await _let_loop_run()
+            assert sent == {a: 2, b: 2}
+            assert list(sim.need_ack) == [a, b]
+
+            # A resend goes through send_packet again without resetting the entry's count.
+            assert sim.need_ack[a][2] == 1 and sim.need_ack[b][2] == 1
+
+            # Keep expiring both packets until max_resends is reached and they are dropped.
+            for _ in range(MAX_RESENDS + 1):
+                clock[0] += 10
+                await _let_loop_run()
+            assert sent == {a: MAX_RESENDS + 1, b: MAX_RESENDS + 1}
+            assert not sim.need_ack
+        finally:
+            sim.connected = False
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(run_test())
@@ -0,0 +1,122 @@
+import importlib.util
+import os
+import random
+import struct
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# _zerocode only needs the standard library (Numba is optional). Load it from its file so
+# the test does not depend on the rest of pylibremetaverse.utils importing cleanly.
+_spec = importlib.util.spec_from_file_location(
+    "_zerocode", os.path.join(ROOT, "pylibremetaverse", "utils", "_zerocode.py"))
+zc = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(zc)
+
+ENCODERS = [zc._zero_encode_py, zc._zero_encode_kernel]
+DECODERS = [zc._zero_decode_py, zc._zero_decode_kernel]
+
+
+def _encode(encoder, src, size=4096):
+    dest = bytearray(size)
+    n = encoder(src, dest)
+    return bytes(dest[:n])
+
+
+def _decode(decoder, src, size=4096):
+    dest = bytearray(size)
+    n = decoder(src, dest)
+    return bytes(dest[:n])
+
+
+def _packets():
+    rng = random.Random(1234)
+    header = b'\x80\x00\x00\x01\x00\x00' # ZEROCODED flag, sequence 1, no extra header
+    yield header + b'\x01\x02\x03'
+    yield header + bytes(10) + b'\xff'
+    yield header + b'\x05' + bytes(3) + b'\x06' + bytes(1)
+    for _ in range(50):
+        body = bytearray()
+        target_len = rng.randrange(1, 1100)
+        while len(body) < target_len:
+            if rng.random() < 0.4:
+                body += bytes(rng.randrange(1, 300))
+            else:
+                body += bytes(rng.randrange(1, 256) for _ in range(rng.randrange(1, 40)))
+        yield header + bytes(body)
+
+
+@pytest.mark.parametrize("packet", list(_packets()))
+def test_encode_decode_roundtrip_agrees(packet):
+    encoded = {_encode(enc, packet) for enc in ENCODERS}
+    assert len(encoded) == 1
+    encoded = encoded.pop()
+    assert encoded[:6] == packet[:6]
+    for dec in DECODERS:
+        assert _decode(dec, encoded) == packet
+    assert _encode(zc.zero_encode, packet) == encoded
+    assert _decode(zc.zero_decode, encoded) == packet
+
+
+def test_zero_run_longer_than_255_is_split():
+    packet = b'\x80\x00\x00\x01\x00\x00' + b'\x07' + bytes(600) + b'\x08'
+    expected = packet[:6] + b'\x07' + b'\x00\xff' + b'\x00\xff' + b'\x00\x5a' + b'\x08'
+    for enc in ENCODERS:
+        assert _encode(enc, packet) == expected
+    for dec in DECODERS:
+        assert _decode(dec, expected) == packet
+
+
+def test_appended_acks_are_not_zero_coded():
+    acks = struct.pack('<II', 0x100, 7) + b'\x02' # Two u32 ACKs containing zero bytes, then the count
+    packet = b'\x90\x00\x00\x01\x00\x00' + b'\x09' + bytes(4) + b'\x0a' + acks # ZEROCODED | ACK
+    expected = packet[:6] + b'\x09\x00\x04\x0a' + acks
+    for enc in ENCODERS:
+        assert _encode(enc, packet) == expected
+
+
+@pytest.mark.parametrize("encoder", ENCODERS)
+def test_encode_into_short_destination_fails(encoder):
+    packet = b'\x80\x00\x00\x01\x00\x00' + b'\x01\x02\x03' + bytes(20)
+    assert encoder(packet, bytearray(8)) == 0
+    assert encoder(packet, bytearray(4)) == 0
+
+
+@pytest.mark.parametrize("decoder", DECODERS)
+def test_decode_into_short_destination_fails(decoder):
+    encoded = b'\x80\x00\x00\x01\x00\x00' + b'\x01' + b'\x00\x20' + b'\x02'
+    assert decoder(encoded, bytearray(20)) == 0
+    assert decoder(encoded, bytearray(4)) == 0
+    assert _decode(decoder, encoded, 40) == encoded[:7] + bytes(0x20) + b'\x02'
+
+
+@pytest.mark.parametrize("decoder", DECODERS)
+def test_decode_truncated_run_marker_fails(decoder):
+    assert decoder(b'\x80\x00\x00\x01\x00\x00\x01\x00', bytearray(64)) == 0
+
+
+@pytest.mark.parametrize("decoder", DECODERS)
+def test_decode_rejects_input_left_over_when_destination_is_full(decoder):
+    header = b'\x80\x00\x00\x01\x00\x00'
+    assert decoder(header + b'\x01\x02' + b'\x00\x00', bytearray(8)) == 0 # Empty run after a full dest
+    assert decoder(header + b'\x00\x02' + b'\x00\x00', bytearray(8)) == 0
+    assert decoder(header + b'\x01\x02' + b'\x00\x00', bytearray(9)) == 8
+
+
+def _malformed_inputs():
+    rng = random.Random(4321)
+    header = b'\x80\x00\x00\x01\x00\x00'
+    for _ in range(300):
+        body = bytes(rng.choice((0, 0, 1, 2, 3, 255)) for _ in range(rng.randrange(0, 12)))
+        yield header[:rng.randrange(0, 7)] + body, rng.randrange(0, 24)
+
+
+def test_decoders_agree_on_malformed_input():
+    for src, size in _malformed_inputs():
+        results = set()
+        for dec in DECODERS:
+            dest = bytearray(size)
+            n = dec(src, dest)
+            results.add((n, bytes(dest[:n])))
+        assert len(results) == 1, (src.hex(), size, results)